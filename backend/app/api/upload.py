@@ -17,7 +17,7 @@ from app.models.invoice import (
     InvoiceSummary,
     PaginationInfo
 )
-from app.services.invoice_processor import InvoiceProcessorService
+from app.services.invoice_processor import get_invoice_processor
 from app.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
@@ -76,6 +76,17 @@ async def upload_invoice(
         )
     
     try:
+        max_size = settings.max_file_size
+        size_limit_detail = f"File size exceeds maximum limit of {max_size // (1024*1024)}MB"
+        
+        # The multipart parser has already spooled the upload and knows its
+        # size, so oversized files are rejected without reading them into memory
+        if file.size is not None and file.size > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=size_limit_detail
+            )
+        
         # Read file content
         file_content = await file.read()
         
@@ -86,11 +97,10 @@ async def upload_invoice(
             )
         
         # Check file size limit
-        max_size = settings.max_file_size
         if len(file_content) > max_size:
             raise HTTPException(
                 status_code=413,
-                detail=f"File size exceeds maximum limit of {max_size // (1024*1024)}MB"
+                detail=size_limit_detail
             )
         
         logger.info(
@@ -100,7 +110,7 @@ async def upload_invoice(
         )
         
         # Process invoice
-        processor = InvoiceProcessorService()
+        processor = get_invoice_processor()
         result = await processor.process_invoice(file_content, file.filename)
         
         # Log result
@@ -152,7 +162,7 @@ async def download_invoice(batch_id: str) -> InvoiceDownloadResponse:
     logger.info("Download request received", batch_id=batch_id)
     
     try:
-        processor = InvoiceProcessorService()
+        processor = get_invoice_processor()
         
         # Get invoice details to verify existence
         invoice_details = await processor.get_invoice_details(batch_id)
@@ -210,7 +220,7 @@ async def get_invoice_details(batch_id: str):
     logger.info("Invoice details request", batch_id=batch_id)
     
     try:
-        processor = InvoiceProcessorService()
+        processor = get_invoice_processor()
         details = await processor.get_invoice_details(batch_id)
         
         if not details:
@@ -406,5 +416,24 @@ async def health_check():
         )
 
 
+
+@router.get("/health/queues")
+async def queue_health():
+    """
+    Report the invoice processor's queue depths.
+    
+    Returns:
+        Dict: Running and waiting S3 operations and pending orphan cleanups
+    """
+    try:
+        processor = get_invoice_processor()
+        return processor.get_queue_stats()
+    except Exception as e:
+        logger.error("Queue health check failed", error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service unhealthy"
+        )
+
 # Note: Error handlers are implemented at the endpoint level with try/catch blocks
 # APIRouter doesn't support exception_handler decorator - that's only for FastAPI app
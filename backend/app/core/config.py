@@ -188,7 +188,27 @@ class Settings(BaseSettings):
         description="S3 prefix for invoice storage"
     )
     
+    s3_concurrency: int = Field(
+        default=8,
+        description="Maximum number of concurrent blocking S3 operations"
+    )
+    
+    s3_max_pool_connections: int = Field(
+        default=20,
+        description="Maximum number of pooled HTTP connections of the S3 client"
+    )
+    
+    s3_orphan_cleanup_interval: int = Field(
+        default=300,
+        description="Seconds between cleanups of orphaned S3 invoice files (0 disables)"
+    )
+    
     # Invoice Processing Configuration
+    pdf_parser_processes: int = Field(
+        default=0,
+        description="Worker processes for PDF extraction (0 extracts in threads)"
+    )
+    
     invoice_download_expiration: int = Field(
         default=3600,
         description="Download URL expiration time in seconds (1 hour)"
@@ -272,6 +292,16 @@ class Settings(BaseSettings):
         description="Timeout for LawnFawn page loading in seconds"
     )
     
+    lawnfawn_candidate_hedge_delay_ms: int = Field(
+        default=3000,
+        description="Delay before a pending search result gets the next one scraped alongside it in milliseconds"
+    )
+    
+    sku_extraction_pattern: str = Field(
+        default=r"LF[-]?(\d+)",
+        description="Regex extracting the numeric part of LawnFawn SKUs"
+    )
+    
     # Confidence Score Configuration
     confidence_exact_match: int = Field(
         default=100,
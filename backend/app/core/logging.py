@@ -65,7 +65,11 @@ def configure_logging(log_level: str = "INFO") -> None:
         processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the configured level return immediately instead of
+        # building an event dict for filter_by_level to drop
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, log_level.upper())
+        ),
         cache_logger_on_first_use=True,
     )
     
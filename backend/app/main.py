@@ -5,6 +5,7 @@ This module initializes the FastAPI application with all necessary middleware,
 routers, and configuration.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -14,6 +15,8 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.core.config import get_settings
 from app.core.logging import configure_logging, get_logger
+from app.services.firecrawl_client import reset_firecrawl_client
+from app.services.invoice_processor import run_s3_orphan_cleanup, shutdown_executors
 
 # Initialize settings and logger
 settings = get_settings()
@@ -49,6 +52,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # TODO: Initialize Redis connection
     # TODO: Validate API keys and external service connections
     
+    # Periodically delete S3 files left without database records
+    orphan_cleanup_task = None
+    if settings.s3_orphan_cleanup_interval > 0:
+        orphan_cleanup_task = asyncio.create_task(
+            run_s3_orphan_cleanup(settings.s3_orphan_cleanup_interval)
+        )
+    
     logger.info("Application startup completed")
     
     yield
@@ -58,7 +68,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # TODO: Close database connections
     # TODO: Close Redis connections
-    # TODO: Cleanup any background tasks
+    
+    # Stop the S3 orphan cleanup loop
+    if orphan_cleanup_task is not None:
+        orphan_cleanup_task.cancel()
+    
+    # Release pooled Firecrawl connections
+    await reset_firecrawl_client()
+    
+    # Stop the S3 worker threads and PDF worker processes
+    shutdown_executors()
     
     logger.info("Application shutdown completed")
 
@@ -31,6 +31,18 @@ class DataConflict(BaseModel):
         }
 
 
+class ConflictAnalysis(BaseModel):
+    """
+    Outcome of comparing an existing product with new incoming data.
+    
+    Bundles the detected conflicts with their overall severity and whether
+    all of them can be auto-resolved, computed in a single detector pass.
+    """
+    conflicts: List[DataConflict] = Field(default_factory=list, description="List of detected conflicts")
+    severity: str = Field("none", description="Overall severity: none, minor, major, critical")
+    can_auto_resolve: bool = Field(True, description="All conflicts can be auto-resolved")
+
+
 class DeduplicationResult(BaseModel):
     """
     Result of processing a single product with deduplication logic.
@@ -114,3 +126,5 @@ class DeduplicationConfig(BaseModel):
     class Config:
         """Pydantic configuration."""
         from_attributes = True
+        # Immutable and hashable so configured services can be cached per config
+        frozen = True
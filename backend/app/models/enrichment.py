@@ -43,7 +43,7 @@ class FirecrawlResponse(BaseModel):
     content: str = Field(..., description="HTML content")
     markdown: str = Field(default="", description="Markdown content")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Page metadata")
-    raw_data: Dict[str, Any] = Field(default_factory=dict, description="Raw API response")
+    raw_data: Optional[Dict[str, Any]] = Field(default=None, description="Raw API response (top-level keys unless the full payload is kept)")
     success: bool = Field(..., description="Whether scraping was successful")
     error_message: Optional[str] = Field(default=None, description="Error message if failed")
     credits_used: int = Field(default=1, description="Firecrawl credits consumed")
@@ -260,6 +260,10 @@ class EnrichmentConfig(BaseModel):
     max_concurrent_requests: int = Field(default=5, ge=1, le=20, description="Maximum concurrent requests")
     retry_attempts: int = Field(default=3, ge=1, le=10, description="Number of retry attempts")
     retry_delay: int = Field(default=2, ge=1, le=60, description="Retry delay in seconds")
+    cache_ttl_seconds: int = Field(default=3600, ge=0, description="Scrape response cache TTL in seconds (0 disables)")
+    cache_max_entries: int = Field(default=1000, ge=0, description="Maximum cached scrape responses (0 disables)")
+    default_formats: List[str] = Field(default_factory=lambda: ["markdown"], description="Firecrawl output formats requested by default")
+    keep_raw_response: bool = Field(default=False, description="Keep the full Firecrawl payload in FirecrawlResponse.raw_data")
     confidence_thresholds: Dict[str, int] = Field(
         default_factory=lambda: {
             "exact_match": 100,
@@ -270,5 +274,8 @@ class EnrichmentConfig(BaseModel):
         description="Confidence score thresholds"
     )
     rate_limit_requests_per_minute: int = Field(default=30, ge=1, le=1000, description="Rate limit per minute")
+    rate_limit_burst: int = Field(default=10, ge=1, le=1000, description="Requests allowed back to back before the rate limit applies")
+    domain_delay_ms: int = Field(default=200, ge=0, le=60000, description="Minimum delay between scrapes of the same domain in milliseconds")
     lawnfawn_base_url: str = Field(default="https://www.lawnfawn.com", description="LawnFawn base URL")
+    candidate_hedge_delay_ms: int = Field(default=3000, ge=0, le=60000, description="Delay before a pending search result gets the next one scraped alongside it in milliseconds")
     sku_extraction_pattern: str = Field(default=r'LF[-]?(\d+)', description="SKU extraction regex pattern")
@@ -38,6 +38,7 @@ class UploadBatchBase(BaseCreateModel):
     parsing_success_rate: Optional[float] = Field(None, ge=0, le=100, description="Parsing success rate percentage")
     download_count: Optional[int] = Field(None, ge=0, description="Number of times invoice was downloaded")
     last_downloaded_at: Optional[datetime] = Field(None, description="Last download timestamp")
+    content_sha256: Optional[str] = Field(None, min_length=64, max_length=64, description="SHA-256 hex digest of the uploaded file")
     
     @validator('batch_name')
     def validate_batch_name(cls, v):
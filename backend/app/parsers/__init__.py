@@ -5,10 +5,24 @@ This package provides supplier-specific parsing strategies for extracting
 product data from different invoice formats.
 """
 
+import importlib
+
 from .base import InvoiceParsingStrategy
-from .lawnfawn import LawnFawnParsingStrategy
+
+# Supplier strategies are imported on first attribute access
+_LAZY_STRATEGIES = {
+    'LawnFawnParsingStrategy': '.lawnfawn'
+}
 
 __all__ = [
     'InvoiceParsingStrategy',
     'LawnFawnParsingStrategy'
 ]
+
+
+def __getattr__(name: str):
+    """Import supplier strategies lazily on first access."""
+    module_name = _LAZY_STRATEGIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -14,6 +14,13 @@ from app.models.invoice import InvoiceMetadata, ParsedProduct, InvoiceParsingRes
 
 logger = structlog.get_logger(__name__)
 
+# Cleanup patterns applied to every parsed invoice line
+_SKU_EDGE_PATTERN = re.compile(r'^[^\w]+|[^\w]+$')
+_CURRENCY_SYMBOL_PATTERN = re.compile(r'[$€£¥]')
+_TAX_SUFFIX_PATTERN = re.compile(r'[T]$')
+_NON_DECIMAL_PATTERN = re.compile(r'[^\d\.]')
+_NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+
 
 class InvoiceParsingStrategy(ABC):
     """
@@ -93,7 +100,7 @@ class InvoiceParsingStrategy(ABC):
         cleaned_sku = sku.strip()
         
         # Remove common prefixes/suffixes that might be artifacts
-        cleaned_sku = re.sub(r'^[^\w]+|[^\w]+$', '', cleaned_sku)
+        cleaned_sku = _SKU_EDGE_PATTERN.sub('', cleaned_sku)
         
         if not cleaned_sku:
             raise ValueError("SKU contains no valid characters")
@@ -120,8 +127,8 @@ class InvoiceParsingStrategy(ABC):
         cleaned = amount_str.strip()
         
         # Remove currency symbols and common suffixes
-        cleaned = re.sub(r'[$€£¥]', '', cleaned)
-        cleaned = re.sub(r'[T]$', '', cleaned)  # Remove trailing 'T' (tax indicator)
+        cleaned = _CURRENCY_SYMBOL_PATTERN.sub('', cleaned)
+        cleaned = _TAX_SUFFIX_PATTERN.sub('', cleaned)  # Remove trailing 'T' (tax indicator)
         
         # Handle comma as decimal separator (European format)
         if ',' in cleaned and '.' not in cleaned:
@@ -131,7 +138,7 @@ class InvoiceParsingStrategy(ABC):
             cleaned = cleaned.replace(',', '')
         
         # Remove any remaining non-numeric characters except decimal point
-        cleaned = re.sub(r'[^\d\.]', '', cleaned)
+        cleaned = _NON_DECIMAL_PATTERN.sub('', cleaned)
         
         if not cleaned:
             raise ValueError("No numeric content found in amount")
@@ -158,7 +165,7 @@ class InvoiceParsingStrategy(ABC):
             raise ValueError("Quantity cannot be empty")
         
         # Clean quantity string
-        cleaned = re.sub(r'[^\d]', '', quantity_str.strip())
+        cleaned = _NON_DIGIT_PATTERN.sub('', quantity_str.strip())
         
         if not cleaned:
             raise ValueError("No numeric content found in quantity")
@@ -6,15 +6,19 @@ existing and new product data during the deduplication process.
 """
 
 import difflib
+from functools import lru_cache
 from typing import List, Optional, Any
 from decimal import Decimal
 import structlog
 
-from ..models.deduplication import DataConflict, DeduplicationConfig
+from ..models.deduplication import ConflictAnalysis, DataConflict, DeduplicationConfig
 from ..models.product import Product, ProductCreate
 
 logger = structlog.get_logger(__name__)
 
+# Rank of each conflict severity, used to track the overall (maximum) severity
+_SEVERITY_RANK = {"none": 0, "minor": 1, "major": 2, "critical": 3}
+
 
 class ConflictDetector:
     """
@@ -49,58 +53,86 @@ class ConflictDetector:
         Returns:
             List of detected conflicts.
         """
+        analysis = await self.analyze_conflicts(existing_product, new_data)
+        return analysis.conflicts
+    
+    async def analyze_conflicts(
+        self, 
+        existing_product: Product, 
+        new_data: ProductCreate
+    ) -> ConflictAnalysis:
+        """
+        Detect conflicts and classify them in a single pass.
+        
+        Overall severity and auto-resolvability are accumulated while the
+        conflicts are collected, so the list is not walked again afterwards.
+        
+        Args:
+            existing_product: Current product in database.
+            new_data: New product data being processed.
+            
+        Returns:
+            ConflictAnalysis with conflicts, overall severity and auto-resolve flag.
+        """
         conflicts = []
+        severity = "none"
+        can_auto_resolve = True
         
         try:
-            # Price conflict detection
-            price_conflict = self._detect_price_conflict(
-                existing_product.supplier_price_usd,
-                new_data.supplier_price_usd
-            )
-            if price_conflict:
-                conflicts.append(price_conflict)
-            
-            # Name conflict detection
-            name_conflict = self._detect_name_conflict(
-                existing_product.supplier_name,
-                new_data.supplier_name
-            )
-            if name_conflict:
-                conflicts.append(name_conflict)
+            field_conflicts = [
+                # Price conflict detection
+                self._detect_price_conflict(
+                    existing_product.supplier_price_usd,
+                    new_data.supplier_price_usd
+                ),
+                # Name conflict detection
+                self._detect_name_conflict(
+                    existing_product.supplier_name,
+                    new_data.supplier_name
+                )
+            ]
             
             # Category conflict detection (if available)
             if hasattr(new_data, 'category'):
-                category_conflict = self._detect_category_conflict(
+                field_conflicts.append(self._detect_category_conflict(
                     getattr(existing_product, 'category', None),
                     new_data.category
-                )
-                if category_conflict:
-                    conflicts.append(category_conflict)
+                ))
             
             # Manufacturer conflict detection (if available)
             if hasattr(new_data, 'manufacturer'):
-                manufacturer_conflict = self._detect_manufacturer_conflict(
+                field_conflicts.append(self._detect_manufacturer_conflict(
                     getattr(existing_product, 'manufacturer', None),
                     new_data.manufacturer
-                )
-                if manufacturer_conflict:
-                    conflicts.append(manufacturer_conflict)
+                ))
             
             # Description conflict detection
-            description_conflict = self._detect_description_conflict(
+            field_conflicts.append(self._detect_description_conflict(
                 getattr(existing_product, 'supplier_description', None),
                 getattr(new_data, 'description', None)
-            )
-            if description_conflict:
-                conflicts.append(description_conflict)
+            ))
+            
+            for conflict in field_conflicts:
+                if conflict is None:
+                    continue
+                
+                conflicts.append(conflict)
+                if _SEVERITY_RANK[conflict.severity] > _SEVERITY_RANK[severity]:
+                    severity = conflict.severity
+                can_auto_resolve = can_auto_resolve and conflict.auto_resolvable
             
             logger.info(
                 "Conflict detection completed",
                 supplier_sku=existing_product.supplier_sku,
-                conflicts_found=len(conflicts)
+                conflicts_found=len(conflicts),
+                severity=severity
             )
             
-            return conflicts
+            return ConflictAnalysis(
+                conflicts=conflicts,
+                severity=severity,
+                can_auto_resolve=can_auto_resolve
+            )
             
         except Exception as e:
             logger.error(
@@ -398,9 +430,15 @@ class ConflictDetector:
         return all(conflict.auto_resolvable for conflict in conflicts)
 
 
+@lru_cache(maxsize=8)
+def _get_cached_conflict_detector(config: DeduplicationConfig) -> ConflictDetector:
+    """Create and cache one conflict detector per distinct configuration."""
+    return ConflictDetector(config)
+
+
 def get_conflict_detector(config: Optional[DeduplicationConfig] = None) -> ConflictDetector:
     """
-    Get a conflict detector instance.
+    Get the conflict detector instance for a configuration.
     
     Args:
         config: Optional configuration for conflict detection.
@@ -408,4 +446,9 @@ def get_conflict_detector(config: Optional[DeduplicationConfig] = None) -> Confl
     Returns:
         ConflictDetector instance.
     """
-    return ConflictDetector(config)
+    return _get_cached_conflict_detector(config or DeduplicationConfig())
+
+
+def reset_conflict_detector() -> None:
+    """Reset the cached conflict detector instances (useful for testing)."""
+    _get_cached_conflict_detector.cache_clear()
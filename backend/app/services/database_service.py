@@ -6,12 +6,15 @@ with comprehensive error handling and transaction support.
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any, Union, Tuple
+from typing import AsyncIterator, List, Optional, Dict, Any, Union, Tuple
 from uuid import UUID
 from datetime import datetime
 import structlog
+from postgrest.exceptions import APIError
+from postgrest.types import ReturnMethod
 from ..core.database import get_supabase_client, supabase_manager
 from ..models import (
+    BatchStatus, ProductStatus,
     Supplier, SupplierCreate, SupplierUpdate,
     UploadBatch, UploadBatchCreate, UploadBatchUpdate,
     Product, ProductCreate, ProductUpdate,
@@ -21,6 +24,40 @@ from ..models import (
 
 logger = structlog.get_logger(__name__)
 
+# PostgreSQL error code for unique constraint violations
+UNIQUE_VIOLATION = "23505"
+
+# PostgREST error code for calls to a database function that does not exist
+UNDEFINED_FUNCTION = "PGRST202"
+
+# Products claimed for enrichment at once; the fallback claim lists their IDs
+# in an in.() filter, which has to stay well within URL length limits
+ENRICHMENT_CLAIM_SIZE = 100
+
+# Manufacturer SKUs per lookup request; keeps the in.() filter well within
+# URL length limits
+SKU_LOOKUP_CHUNK_SIZE = 100
+
+# Rows per request when reading many products; matches PostgREST's
+# default max-rows, above which unpaged selects are silently truncated
+PRODUCT_PAGE_SIZE = 1000
+
+
+async def execute_query(query: Any) -> Any:
+    """
+    Execute a Supabase query in a worker thread.
+    
+    The Supabase client is synchronous, so calling execute() directly blocks
+    the event loop, and every other task on it, for the whole round trip.
+    
+    Args:
+        query: Query or RPC builder, ready to execute.
+        
+    Returns:
+        The builder's API response.
+    """
+    return await asyncio.to_thread(query.execute)
+
 
 class DatabaseService:
     """
@@ -287,6 +324,36 @@ class DatabaseService:
             logger.error("Failed to get upload batch by ID", batch_id=str(batch_id), error=str(e))
             raise
     
+    async def get_completed_batch_by_hash(self, content_sha256: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest completed upload batch of a file by its content hash.
+        
+        Args:
+            content_sha256: SHA-256 hex digest of the uploaded file.
+            
+        Returns:
+            Batch row with its invoice fields if found, None otherwise.
+        """
+        try:
+            result = self.client.table('upload_batches')\
+                .select(
+                    'id, supplier_code, total_products, parsing_success_rate, invoice_number, '
+                    'invoice_date, currency_code, total_amount_original, s3_key'
+                )\
+                .eq('content_sha256', content_sha256)\
+                .eq('status', BatchStatus.COMPLETED.value)\
+                .order('created_at', desc=True)\
+                .limit(1)\
+                .execute()
+            
+            if result.data:
+                return result.data[0]
+            return None
+            
+        except Exception as e:
+            logger.error("Failed to get upload batch by content hash", error=str(e))
+            raise
+    
     async def create_upload_batch(self, batch_data: UploadBatchCreate, batch_id: Optional[str] = None) -> UploadBatch:
         """
         Create a new upload batch.
@@ -317,6 +384,45 @@ class DatabaseService:
             logger.error("Failed to create upload batch", error=str(e))
             raise
     
+    async def create_upload_batches_bulk(
+        self,
+        batches: List[Tuple[UploadBatchCreate, Optional[str]]]
+    ) -> int:
+        """
+        Create several upload batches with a single multi-row insert.
+        
+        Args:
+            batches: Pairs of batch creation data and optional custom batch ID.
+            
+        Returns:
+            Number of created upload batches.
+        """
+        if not batches:
+            return 0
+        
+        try:
+            rows = []
+            for batch_data, batch_id in batches:
+                data = batch_data.model_dump(mode='json')
+                
+                # Use custom batch ID if provided
+                if batch_id:
+                    data['id'] = batch_id
+                
+                rows.append(data)
+            
+            self.client.table('upload_batches')\
+                .insert(rows, returning=ReturnMethod.minimal)\
+                .execute()
+            
+            logger.info("Upload batches created in bulk", created_count=len(rows))
+            
+            return len(rows)
+            
+        except Exception as e:
+            logger.error("Failed to create upload batches in bulk", error=str(e))
+            raise
+    
     async def update_upload_batch(
         self,
         batch_id: UUID,
@@ -424,10 +530,11 @@ class DatabaseService:
             Product if found, None otherwise.
         """
         try:
-            result = self.client.table('products')\
-                .select('*')\
-                .eq('id', str(product_id))\
-                .execute()
+            result = await execute_query(
+                self.client.table('products')
+                .select('*')
+                .eq('id', str(product_id))
+            )
             
             if result.data:
                 return Product(**result.data[0])
@@ -437,7 +544,298 @@ class DatabaseService:
             logger.error("Failed to get product by ID", product_id=str(product_id), error=str(e))
             raise
     
-    async def create_product(self, product_data: ProductCreate) -> Product:
+    async def iter_enrichable_products(
+        self,
+        batch_id: UUID,
+        page_size: int = PRODUCT_PAGE_SIZE
+    ) -> AsyncIterator[List[Product]]:
+        """
+        Yield a batch's DRAFT products that have a supplier SKU and manufacturer, page by page.
+        
+        Pages follow the primary key rather than offsets, so products leaving
+        DRAFT status while earlier pages are enriched do not shift later pages.
+        
+        Args:
+            batch_id: Upload batch ID.
+            page_size: Maximum number of products per page.
+            
+        Yields:
+            Lists of at most page_size products.
+        """
+        last_id = None
+        
+        try:
+            while True:
+                # neq('') also excludes NULLs, which never compare unequal
+                query = self.client.table('products')\
+                    .select('*')\
+                    .eq('batch_id', str(batch_id))\
+                    .eq('status', ProductStatus.DRAFT.value)\
+                    .neq('supplier_sku', '')\
+                    .neq('manufacturer', '')
+                
+                if last_id is not None:
+                    query = query.gt('id', last_id)
+                
+                result = await execute_query(query.order('id').limit(page_size))
+                
+                if result.data:
+                    yield [Product(**item) for item in result.data]
+                
+                if len(result.data) < page_size:
+                    return
+                last_id = result.data[-1]['id']
+                
+        except Exception as e:
+            logger.error("Failed to get enrichable products", batch_id=str(batch_id), error=str(e))
+            raise
+    
+    async def claim_enrichable_products(
+        self,
+        batch_id: UUID,
+        limit: int = ENRICHMENT_CLAIM_SIZE
+    ) -> List[Product]:
+        """
+        Move up to limit enrichable DRAFT products of a batch to PROCESSING and return them.
+        
+        The claim_enrichment_products database function (migration 013) skips
+        rows locked by concurrent claims, so workers claim disjoint products.
+        Without the function, a page of candidates is updated on the condition
+        that it is still DRAFT, which gives the same guarantee in two requests.
+        
+        Args:
+            batch_id: Upload batch ID.
+            limit: Maximum number of products to claim.
+            
+        Returns:
+            Claimed products; empty when the batch has no enrichable DRAFT
+            products left.
+        """
+        try:
+            result = await execute_query(self.client.rpc(
+                'claim_enrichment_products',
+                {'batch_uuid': str(batch_id), 'claim_limit': limit}
+            ))
+            
+        except APIError as e:
+            if e.code != UNDEFINED_FUNCTION:
+                logger.error("Failed to claim products for enrichment", batch_id=str(batch_id), error=str(e))
+                raise
+            
+            logger.warning(
+                "Enrichment claim function missing, claiming by conditional update",
+                batch_id=str(batch_id)
+            )
+            return await self._claim_enrichable_products_by_update(batch_id, limit)
+        
+        return [Product(**item) for item in result.data]
+    
+    async def _claim_enrichable_products_by_update(self, batch_id: UUID, limit: int) -> List[Product]:
+        """
+        Claim enrichable products with a conditional update of candidate pages.
+        
+        Candidates claimed concurrently by another worker no longer match the
+        DRAFT condition, so the next page is tried until one yields products.
+        
+        Args:
+            batch_id: Upload batch ID.
+            limit: Maximum number of products to claim.
+            
+        Returns:
+            Claimed products.
+        """
+        update_data = {
+            'status': ProductStatus.PROCESSING.value,
+            'enrichment_status': 'processing',
+            'last_enrichment_attempt': datetime.utcnow().isoformat()
+        }
+        
+        try:
+            async for candidates in self.iter_enrichable_products(batch_id, page_size=limit):
+                result = await execute_query(
+                    self.client.table('products')
+                    .update(update_data)
+                    .in_('id', [str(product.id) for product in candidates])
+                    .eq('status', ProductStatus.DRAFT.value)
+                )
+                
+                if result.data:
+                    return [Product(**item) for item in result.data]
+            
+            return []
+            
+        except Exception as e:
+            logger.error("Failed to claim products for enrichment", batch_id=str(batch_id), error=str(e))
+            raise
+    
+    async def release_stale_enrichment_claims(self, batch_id: UUID, claimed_before: datetime) -> int:
+        """
+        Return a batch's products stuck in PROCESSING to DRAFT.
+        
+        Products are stuck when the worker enriching them died; every status
+        change refreshes last_enrichment_attempt, so products claimed before
+        the cutoff and still processing are not being worked on.
+        
+        Args:
+            batch_id: Upload batch ID.
+            claimed_before: Claims older than this are released.
+            
+        Returns:
+            Number of released products.
+        """
+        try:
+            result = await execute_query(
+                self.client.table('products')
+                .update({
+                    'status': ProductStatus.DRAFT.value,
+                    'enrichment_status': 'pending'
+                })
+                .eq('batch_id', str(batch_id))
+                .eq('status', ProductStatus.PROCESSING.value)
+                .lt('last_enrichment_attempt', claimed_before.isoformat())
+            )
+            
+            return len(result.data)
+            
+        except Exception as e:
+            logger.error("Failed to release stale enrichment claims", batch_id=str(batch_id), error=str(e))
+            raise
+    
+    async def get_batch_enrichment_counts(self, batch_id: UUID) -> Dict[str, Any]:
+        """
+        Count a batch's products per enrichment state.
+        
+        The counting runs in the get_batch_enrichment_status database function
+        (migration 012), so one row is transferred. Without the function the
+        products' status and confidence columns are read and counted here.
+        
+        Args:
+            batch_id: Upload batch ID.
+            
+        Returns:
+            Dict with total_products, completed_products, failed_products,
+            processing_products and pending_products counts and the
+            avg_confidence_score of completed products.
+        """
+        try:
+            result = await execute_query(self.client.rpc(
+                'get_batch_enrichment_status',
+                {'batch_uuid': str(batch_id)}
+            ))
+            
+        except APIError as e:
+            if e.code != UNDEFINED_FUNCTION:
+                logger.error("Failed to get batch enrichment counts", batch_id=str(batch_id), error=str(e))
+                raise
+            
+            logger.warning(
+                "Batch enrichment status function missing, counting products",
+                batch_id=str(batch_id)
+            )
+            return await self._count_batch_enrichment(batch_id)
+        
+        row = result.data[0]
+        return {
+            'total_products': row['total_products'],
+            'completed_products': row['completed_products'],
+            'failed_products': row['failed_products'],
+            'processing_products': row['processing_products'],
+            'pending_products': row['pending_products'],
+            'avg_confidence_score': float(row['avg_confidence_score'])
+        }
+    
+    async def _count_batch_enrichment(self, batch_id: UUID) -> Dict[str, Any]:
+        """
+        Count a batch's products per enrichment state from their rows.
+        
+        Args:
+            batch_id: Upload batch ID.
+            
+        Returns:
+            Same counts as get_batch_enrichment_counts.
+        """
+        status_counts: Dict[str, int] = {}
+        completed_confidence = 0
+        last_id = None
+        
+        try:
+            while True:
+                query = self.client.table('products')\
+                    .select('id, status, scraping_confidence')\
+                    .eq('batch_id', str(batch_id))
+                
+                if last_id is not None:
+                    query = query.gt('id', last_id)
+                
+                rows = (await execute_query(query.order('id').limit(PRODUCT_PAGE_SIZE))).data
+                
+                for row in rows:
+                    status_counts[row['status']] = status_counts.get(row['status'], 0) + 1
+                    if row['status'] == ProductStatus.READY.value:
+                        completed_confidence += row['scraping_confidence'] or 0
+                
+                if len(rows) < PRODUCT_PAGE_SIZE:
+                    break
+                last_id = rows[-1]['id']
+                
+        except Exception as e:
+            logger.error("Failed to count batch products", batch_id=str(batch_id), error=str(e))
+            raise
+        
+        completed_products = status_counts.get(ProductStatus.READY.value, 0)
+        return {
+            'total_products': sum(status_counts.values()),
+            'completed_products': completed_products,
+            'failed_products': status_counts.get(ProductStatus.FAILED.value, 0),
+            'processing_products': status_counts.get(ProductStatus.PROCESSING.value, 0),
+            'pending_products': status_counts.get(ProductStatus.DRAFT.value, 0),
+            'avg_confidence_score': completed_confidence / completed_products if completed_products else 0.0
+        }
+    
+    async def get_recent_enrichment(
+        self,
+        manufacturer: str,
+        supplier_sku: str,
+        since: datetime,
+        exclude_product_id: Optional[UUID] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest completed enrichment of a SKU from another product row.
+        
+        Args:
+            manufacturer: Product manufacturer.
+            supplier_sku: Supplier SKU.
+            since: Only consider enrichments completed at or after this time.
+            exclude_product_id: Product to leave out (usually the one being enriched).
+            
+        Returns:
+            Product row with its scraped fields if found, None otherwise.
+        """
+        try:
+            query = self.client.table('products')\
+                .select(
+                    'id, scraped_name, scraped_description, scraped_url, scraped_images_urls, '
+                    'scraped_images_metadata, scraping_confidence'
+                )\
+                .eq('manufacturer', manufacturer)\
+                .eq('supplier_sku', supplier_sku)\
+                .eq('enrichment_status', 'completed')\
+                .gte('last_enrichment_attempt', since.isoformat())
+            
+            if exclude_product_id is not None:
+                query = query.neq('id', str(exclude_product_id))
+            
+            result = await execute_query(query.order('last_enrichment_attempt', desc=True).limit(1))
+            
+            if result.data:
+                return result.data[0]
+            return None
+            
+        except Exception as e:
+            logger.error("Failed to get recent enrichment", supplier_sku=supplier_sku, error=str(e))
+            raise
+    
+    async def create_product(self, product_data: ProductCreate) -> Optional[Product]:
         """
         Create a new product.
         
@@ -445,7 +843,8 @@ class DatabaseService:
             product_data: Product creation data.
             
         Returns:
-            Created product.
+            Created product, or None if a product with the same
+            manufacturer_sku already exists (e.g. inserted concurrently).
         """
         try:
             data = product_data.model_dump(mode='json')
@@ -456,11 +855,53 @@ class DatabaseService:
                 return Product(**result.data[0])
             else:
                 raise ValueError("Failed to create product")
+        
+        except APIError as e:
+            if e.code == UNIQUE_VIOLATION:
+                logger.info(
+                    "Product already exists, create skipped",
+                    manufacturer_sku=product_data.manufacturer_sku
+                )
+                return None
+            
+            logger.error("Failed to create product", error=str(e))
+            raise
                 
         except Exception as e:
             logger.error("Failed to create product", error=str(e))
             raise
     
+    async def create_products_bulk(self, products_data: List[ProductCreate]) -> int:
+        """
+        Create several products with a single multi-row insert.
+        
+        The insert is atomic: if any row is rejected (e.g. a duplicate
+        manufacturer_sku), no products are created and the error is raised.
+        The created rows are not sent back, which keeps large inserts cheap.
+        
+        Args:
+            products_data: Product creation data.
+            
+        Returns:
+            Number of created products.
+        """
+        if not products_data:
+            return 0
+        
+        try:
+            rows = [product_data.model_dump(mode='json') for product_data in products_data]
+            self.client.table('products')\
+                .insert(rows, returning=ReturnMethod.minimal)\
+                .execute()
+            
+            logger.info("Products created in bulk", created_count=len(rows))
+            
+            return len(rows)
+            
+        except Exception as e:
+            logger.error("Failed to create products in bulk", error=str(e))
+            raise
+    
     async def update_product(
         self,
         product_id: UUID,
@@ -522,6 +963,64 @@ class DatabaseService:
             logger.error("Failed to get product by manufacturer SKU", manufacturer_sku=manufacturer_sku, error=str(e))
             raise
     
+    async def get_products_by_manufacturer_skus(
+        self,
+        manufacturer_skus: List[str]
+    ) -> List[Product]:
+        """
+        Get all products matching any of the given manufacturer SKUs.
+        
+        The SKUs are looked up in chunks, each read in pages by ID, so large
+        invoices neither exceed URL length limits nor get truncated by
+        PostgREST's max-rows.
+        
+        Args:
+            manufacturer_skus: Manufacturer SKUs to search for.
+            
+        Returns:
+            List of matching products (empty if none match).
+        """
+        if not manufacturer_skus:
+            return []
+        
+        try:
+            products = []
+            
+            for start in range(0, len(manufacturer_skus), SKU_LOOKUP_CHUNK_SIZE):
+                chunk = manufacturer_skus[start:start + SKU_LOOKUP_CHUNK_SIZE]
+                last_id = None
+                
+                while True:
+                    query = self.client.table('products')\
+                        .select('*')\
+                        .in_('manufacturer_sku', chunk)
+                    
+                    if last_id is not None:
+                        query = query.gt('id', last_id)
+                    
+                    rows = query.order('id').limit(PRODUCT_PAGE_SIZE).execute().data
+                    products.extend(Product(**item) for item in rows)
+                    
+                    if len(rows) < PRODUCT_PAGE_SIZE:
+                        break
+                    last_id = rows[-1]['id']
+            
+            logger.info(
+                "Products found by manufacturer SKUs",
+                requested_count=len(manufacturer_skus),
+                found_count=len(products)
+            )
+            
+            return products
+            
+        except Exception as e:
+            logger.error(
+                "Failed to get products by manufacturer SKUs",
+                requested_count=len(manufacturer_skus),
+                error=str(e)
+            )
+            raise
+    
     async def update_product_review_status(
         self,
         product_id: UUID,
@@ -803,6 +1302,74 @@ class DatabaseService:
             logger.error("Failed to list upload batches with filters", error=str(e))
             raise
 
+    # S3 orphan cleanup operations
+    
+    async def enqueue_s3_orphan(self, s3_key: str) -> None:
+        """
+        Queue an S3 invoice file without database records for deletion.
+        
+        Args:
+            s3_key: S3 object key of the orphaned file.
+        """
+        try:
+            self.client.table('s3_orphans')\
+                .upsert({'s3_key': s3_key}, on_conflict='s3_key', ignore_duplicates=True)\
+                .execute()
+            
+            logger.info("S3 orphan queued for cleanup", s3_key=s3_key)
+            
+        except Exception as e:
+            logger.error("Failed to queue S3 orphan", s3_key=s3_key, error=str(e))
+            raise
+    
+    async def get_s3_orphans(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get queued S3 orphans, oldest first.
+        
+        Args:
+            limit: Maximum number of orphans to return.
+            
+        Returns:
+            Orphan rows with id and s3_key.
+        """
+        try:
+            result = self.client.table('s3_orphans')\
+                .select('id, s3_key')\
+                .order('created_at')\
+                .limit(limit)\
+                .execute()
+            
+            return result.data
+            
+        except Exception as e:
+            logger.error("Failed to get S3 orphans", error=str(e))
+            raise
+    
+    async def delete_s3_orphans(self, orphan_ids: List[str]) -> int:
+        """
+        Remove cleaned up S3 orphans from the queue.
+        
+        Args:
+            orphan_ids: IDs of the orphan rows to remove.
+            
+        Returns:
+            Number of removed rows.
+        """
+        if not orphan_ids:
+            return 0
+        
+        try:
+            result = self.client.table('s3_orphans')\
+                .delete()\
+                .in_('id', orphan_ids)\
+                .execute()
+            
+            return len(result.data)
+            
+        except Exception as e:
+            logger.error("Failed to delete S3 orphans", requested_count=len(orphan_ids), error=str(e))
+            raise
+    
     # Health and utility operations
     
     async def health_check(self) -> Dict[str, Any]:
@@ -5,7 +5,8 @@ This module provides the core deduplication logic to prevent duplicate products
 from being created in the database based on manufacturer_sku uniqueness.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 from uuid import UUID
 import structlog
 
@@ -44,7 +45,8 @@ class DeduplicationService:
     async def process_product_with_deduplication(
         self, 
         product_data: ProductCreate, 
-        batch_id: UUID
+        batch_id: UUID,
+        candidate_index: Optional[Dict[str, Product]] = None
     ) -> DeduplicationResult:
         """
         Process a single product with deduplication logic.
@@ -52,6 +54,9 @@ class DeduplicationService:
         Args:
             product_data: Product data to process.
             batch_id: ID of the batch this product belongs to.
+            candidate_index: Optional prefetched existing products keyed by
+                manufacturer_sku. When given, it replaces the per-product
+                database lookup and is updated with newly created products.
             
         Returns:
             DeduplicationResult indicating what action was taken.
@@ -62,9 +67,12 @@ class DeduplicationService:
                 raise ValueError("manufacturer_sku is required for deduplication")
             
             # Check if product with this manufacturer_sku already exists
-            existing_product = await self.db.get_product_by_manufacturer_sku(
-                product_data.manufacturer_sku
-            )
+            if candidate_index is not None:
+                existing_product = candidate_index.get(product_data.manufacturer_sku)
+            else:
+                existing_product = await self.db.get_product_by_manufacturer_sku(
+                    product_data.manufacturer_sku
+                )
             
             if existing_product:
                 # Product exists - check for conflicts
@@ -73,7 +81,9 @@ class DeduplicationService:
                 )
             else:
                 # New product - create it
-                return await self._create_new_product(product_data, batch_id)
+                return await self._create_new_product(
+                    product_data, batch_id, candidate_index
+                )
                 
         except Exception as e:
             logger.error(
@@ -109,10 +119,13 @@ class DeduplicationService:
             total_products=len(products_data)
         )
         
+        # One lookup for the whole batch instead of one query per product
+        candidate_index = await self._build_candidate_index(products_data)
+        
         for product_data in products_data:
             try:
                 result = await self.process_product_with_deduplication(
-                    product_data, batch_id
+                    product_data, batch_id, candidate_index
                 )
                 results.append(result)
                 
@@ -142,14 +155,48 @@ class DeduplicationService:
             results=results
         )
         
+        # Log the counters only; serializing every result is costly for large batches
         logger.info(
             "Batch deduplication completed",
             batch_id=str(batch_id),
-            summary=summary.dict()
+            total_products=summary.total_products,
+            created_new=created_new,
+            duplicates_skipped=duplicates_skipped,
+            conflicts_detected=conflicts_detected,
+            failed=summary.total_products - len(results)
         )
         
         return summary
     
+    async def _build_candidate_index(
+        self, 
+        products_data: List[ProductCreate]
+    ) -> Dict[str, Product]:
+        """
+        Prefetch existing products for a batch and index them by manufacturer_sku.
+        
+        Args:
+            products_data: Product data of the batch being processed.
+            
+        Returns:
+            Mapping of manufacturer_sku to existing product.
+        """
+        manufacturer_skus = list({
+            product_data.manufacturer_sku
+            for product_data in products_data
+            if product_data.manufacturer_sku
+        })
+        
+        existing_products = await self.db.get_products_by_manufacturer_skus(
+            manufacturer_skus
+        )
+        
+        return {
+            product.manufacturer_sku: product
+            for product in existing_products
+            if product.manufacturer_sku
+        }
+    
     async def _handle_existing_product(
         self, 
         existing_product: Product, 
@@ -167,15 +214,16 @@ class DeduplicationService:
         Returns:
             DeduplicationResult indicating action taken.
         """
-        # Detect conflicts between existing and new data
-        conflicts = await self.conflict_detector.detect_conflicts(
+        # Detect and classify conflicts between existing and new data
+        analysis = await self.conflict_detector.analyze_conflicts(
             existing_product, new_data
         )
+        conflicts = analysis.conflicts
         
         if conflicts:
             # Conflicts detected - flag for review
-            severity = self.conflict_detector.classify_conflict_severity(conflicts)
-            can_auto_resolve = self.conflict_detector.can_auto_resolve(conflicts)
+            severity = analysis.severity
+            can_auto_resolve = analysis.can_auto_resolve
             
             if can_auto_resolve and self.config.auto_resolve_minor_conflicts:
                 # Auto-resolve minor conflicts
@@ -236,7 +284,8 @@ class DeduplicationService:
     async def _create_new_product(
         self, 
         product_data: ProductCreate, 
-        batch_id: UUID
+        batch_id: UUID,
+        candidate_index: Optional[Dict[str, Product]] = None
     ) -> DeduplicationResult:
         """
         Create a new product.
@@ -244,6 +293,8 @@ class DeduplicationService:
         Args:
             product_data: Product data to create.
             batch_id: ID of the current batch.
+            candidate_index: Optional batch candidate index to register the
+                created product in.
             
         Returns:
             DeduplicationResult for the created product.
@@ -255,6 +306,16 @@ class DeduplicationService:
             
             new_product = await self.db.create_product(product_data)
             
+            if new_product is None:
+                # Lost an insert race (e.g. a concurrent batch with the same SKU)
+                return await self._handle_create_conflict(
+                    product_data, batch_id, candidate_index
+                )
+            
+            # Later products in the same batch must see this one as existing
+            if candidate_index is not None:
+                candidate_index[product_data.manufacturer_sku] = new_product
+            
             logger.info(
                 "New product created",
                 product_id=str(new_product.id),
@@ -277,6 +338,47 @@ class DeduplicationService:
             )
             raise
     
+    async def _handle_create_conflict(
+        self, 
+        product_data: ProductCreate, 
+        batch_id: UUID,
+        candidate_index: Optional[Dict[str, Product]] = None
+    ) -> DeduplicationResult:
+        """
+        Handle a create that was rejected because the manufacturer_sku exists.
+        
+        Args:
+            product_data: Product data that could not be created.
+            batch_id: ID of the current batch.
+            candidate_index: Optional batch candidate index to register the
+                existing product in.
+            
+        Returns:
+            DeduplicationResult from handling the now-existing product.
+        """
+        existing_product = await self.db.get_product_by_manufacturer_sku(
+            product_data.manufacturer_sku
+        )
+        
+        if existing_product is None:
+            raise ValueError(
+                f"Product with manufacturer_sku {product_data.manufacturer_sku} "
+                "was rejected as duplicate but could not be found"
+            )
+        
+        logger.info(
+            "Product created concurrently, handling as existing",
+            manufacturer_sku=product_data.manufacturer_sku,
+            product_id=str(existing_product.id)
+        )
+        
+        if candidate_index is not None:
+            candidate_index[product_data.manufacturer_sku] = existing_product
+        
+        return await self._handle_existing_product(
+            existing_product, product_data, batch_id
+        )
+    
     async def _auto_resolve_conflicts(
         self, 
         existing_product: Product, 
@@ -370,9 +472,18 @@ class DeduplicationService:
             raise
 
 
+@lru_cache(maxsize=8)
+def _get_cached_deduplication_service(config: DeduplicationConfig) -> DeduplicationService:
+    """Create and cache one deduplication service per distinct configuration."""
+    return DeduplicationService(config)
+
+
 def get_deduplication_service(config: Optional[DeduplicationConfig] = None) -> DeduplicationService:
     """
-    Get a deduplication service instance.
+    Get the deduplication service instance for a configuration.
+    
+    Instances are cached per configuration, so repeated calls (e.g. once per
+    request) reuse the same service and conflict detector.
     
     Args:
         config: Optional configuration for deduplication behavior.
@@ -380,4 +491,9 @@ def get_deduplication_service(config: Optional[DeduplicationConfig] = None) -> D
     Returns:
         DeduplicationService instance.
     """
-    return DeduplicationService(config)
+    return _get_cached_deduplication_service(config or DeduplicationConfig())
+
+
+def reset_deduplication_service() -> None:
+    """Reset the cached deduplication service instances (useful for testing)."""
+    _get_cached_deduplication_service.cache_clear()
@@ -6,11 +6,16 @@ retry logic, rate limiting, and response processing for the product enrichment s
 """
 
 import os
+import re
 import time
 import asyncio
-from typing import Optional, Dict, Any
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit
 import structlog
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from ..models.enrichment import FirecrawlResponse, EnrichmentConfig
@@ -23,6 +28,72 @@ from ..exceptions.enrichment import (
 
 logger = structlog.get_logger(__name__)
 
+# Content shorter than this is treated as an error page
+_MIN_CONTENT_LENGTH = 100
+
+# Number of leading characters scanned for 404 indicators
+_ERROR_SCAN_PREFIX_CHARS = 2048
+
+# Common 404 indicators
+_ERROR_INDICATORS: Tuple[str, ...] = (
+    "404",
+    "page not found",
+    "not found",
+    "page does not exist",
+    "page you requested does not exist",
+    "sorry, the page you requested does not exist",
+    "the page you are looking for could not be found",
+    "this page could not be found",
+    "page cannot be found",
+    "error 404",
+    "http 404",
+    "file not found",
+    "document not found"
+)
+
+# LawnFawn-specific error patterns (only checked for lawnfawn.com URLs)
+_LAWNFAWN_ERROR_PATTERNS: Tuple[str, ...] = (
+    "back to home",
+    "page not found",
+    "sorry, the page you requested does not exist"
+)
+
+
+# Page options sent with every scrape request
+_DEFAULT_PAGE_OPTIONS: Dict[str, Any] = {
+    "includeTags": ["a", "img", "h1", "h2", "h3", "p", "div", "span"],
+    "excludeTags": ["script", "style", "nav", "footer"],
+    "waitFor": 2000,  # Wait for JavaScript to load
+}
+
+# httpx's default idle connection lifetime, kept as the lower bound
+_MIN_KEEPALIVE_EXPIRY_SECONDS = 5.0
+
+# Seconds between status polls of a running batch scrape job
+_BATCH_POLL_INTERVAL_SECONDS = 2.0
+
+
+def _compile_alternation(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile literal patterns into one case-insensitive alternation.
+    
+    Longer patterns come first so the reported match is the most specific one.
+    
+    Args:
+        patterns: Literal substrings to match
+        
+    Returns:
+        re.Pattern[str]: Compiled pattern
+    """
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile("|".join(re.escape(pattern) for pattern in ordered), re.IGNORECASE)
+
+
+_ERROR_RE = _compile_alternation(_ERROR_INDICATORS)
+
+# LawnFawn pages are checked for both sets in a single search
+_LAWNFAWN_ERROR_RE = _compile_alternation(_ERROR_INDICATORS + _LAWNFAWN_ERROR_PATTERNS)
+
 
 class FirecrawlClient:
     """
@@ -52,12 +123,28 @@ class FirecrawlClient:
             self.timeout = config.firecrawl_timeout
             self.retry_attempts = config.retry_attempts
             self.retry_delay = config.retry_delay
+            self.cache_ttl_seconds = config.cache_ttl_seconds
+            self.cache_max_entries = config.cache_max_entries
+            self.max_concurrent_requests = config.max_concurrent_requests
+            self.default_formats = list(config.default_formats)
+            self.keep_raw_response = config.keep_raw_response
+            requests_per_minute = config.rate_limit_requests_per_minute
+            burst_limit = config.rate_limit_burst
+            domain_delay_ms = config.domain_delay_ms
         else:
             self.api_key = os.getenv('FIRECRAWL_API_KEY')
             self.base_url = os.getenv('FIRECRAWL_BASE_URL', 'https://api.firecrawl.dev')
             self.timeout = int(os.getenv('FIRECRAWL_TIMEOUT', '30'))
             self.retry_attempts = int(os.getenv('FIRECRAWL_MAX_RETRIES', '3'))
             self.retry_delay = int(os.getenv('FIRECRAWL_RETRY_DELAY', '2'))
+            self.cache_ttl_seconds = int(os.getenv('FIRECRAWL_CACHE_TTL', '3600'))
+            self.cache_max_entries = int(os.getenv('FIRECRAWL_CACHE_MAX_ENTRIES', '1000'))
+            self.max_concurrent_requests = int(os.getenv('ENRICHMENT_MAX_CONCURRENT', '5'))
+            self.default_formats = os.getenv('FIRECRAWL_FORMATS', 'markdown').split(',')
+            self.keep_raw_response = os.getenv('FIRECRAWL_KEEP_RAW_RESPONSE', 'false').lower() == 'true'
+            requests_per_minute = int(os.getenv('SCRAPING_REQUESTS_PER_MINUTE', '30'))
+            burst_limit = int(os.getenv('SCRAPING_BURST_LIMIT', '10'))
+            domain_delay_ms = int(os.getenv('SCRAPING_DOMAIN_DELAY_MS', '200'))
         
         if not self.api_key:
             raise ConfigurationError(
@@ -65,9 +152,41 @@ class FirecrawlClient:
                 config_key="FIRECRAWL_API_KEY"
             )
         
-        # Rate limiting state
-        self._last_request_time = 0.0
-        self._min_request_interval = 60.0 / int(os.getenv('SCRAPING_REQUESTS_PER_MINUTE', '30'))
+        # Long-lived HTTP client so the connection pool, HTTP/2 streams and
+        # TLS sessions are reused across scrape calls. Idle connections are
+        # kept for twice the rate-limited request interval so they survive
+        # the waits between scrapes instead of being re-established.
+        keepalive_expiry = max(_MIN_KEEPALIVE_EXPIRY_SECONDS, 2 * 60.0 / requests_per_minute)
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=keepalive_expiry
+            ),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+        )
+        
+        # Response cache (key -> (stored_at, response)) kept in LRU order, and
+        # in-flight scrapes so concurrent requests for the same URL share one call
+        self._cache: "OrderedDict[str, Tuple[float, FirecrawlResponse]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[FirecrawlResponse]"] = {}
+        
+        # Token-bucket rate limiting state, shared by all concurrent scrapes
+        self._refill_rate = requests_per_minute / 60.0
+        self._burst_limit = float(burst_limit)
+        self._tokens = self._burst_limit
+        self._last_refill = time.monotonic()
+        self._rate_limit_lock = asyncio.Lock()
+        
+        # Per-domain spacing so concurrent scrapes do not hammer one site
+        self._domain_delay = domain_delay_ms / 1000.0
+        self._domain_next_slot: Dict[str, float] = {}
+        self._domain_lock = asyncio.Lock()
         
         logger.info(
             "Firecrawl client initialized",
@@ -77,16 +196,114 @@ class FirecrawlClient:
         )
     
     async def _wait_for_rate_limit(self) -> None:
-        """Wait if necessary to respect rate limiting."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """
+        Take one token from the rate-limit bucket, waiting until one is available.
         
-        if time_since_last < self._min_request_interval:
-            wait_time = self._min_request_interval - time_since_last
-            logger.debug("Rate limiting: waiting", wait_time_seconds=wait_time)
+        The bucket refills at the configured requests-per-minute rate up to the
+        burst limit. The lock keeps concurrent scrapes from racing on the bucket
+        and makes waiters acquire tokens in arrival order.
+        """
+        async with self._rate_limit_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst_limit,
+                self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            self._last_refill = now
+            
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) / self._refill_rate
+                logger.debug("Rate limiting: waiting", wait_time_seconds=wait_time)
+                await asyncio.sleep(wait_time)
+                
+                # The bucket refilled to exactly one token while sleeping
+                self._tokens = 1.0
+                self._last_refill = now + wait_time
+            
+            self._tokens -= 1
+    
+    async def _wait_for_domain_slot(self, url: str) -> None:
+        """
+        Wait until the minimum delay since the last scrape of the URL's domain has passed.
+        
+        Each caller reserves the next free slot under the lock and sleeps
+        outside it, so scrapes of other domains are not held up.
+        
+        Args:
+            url: URL about to be scraped
+        """
+        if self._domain_delay <= 0:
+            return
+        
+        domain = urlsplit(url).hostname or ""
+        
+        async with self._domain_lock:
+            now = time.monotonic()
+            slot = max(now, self._domain_next_slot.get(domain, now))
+            self._domain_next_slot[domain] = slot + self._domain_delay
+        
+        wait_time = slot - now
+        if wait_time > 0:
+            logger.debug("Domain delay: waiting", domain=domain, wait_time_seconds=wait_time)
             await asyncio.sleep(wait_time)
+    
+    @staticmethod
+    def _cache_key(url: str, options: Dict[str, Any]) -> str:
+        """
+        Build the response cache key for a scrape request.
+        
+        Args:
+            url: URL to scrape
+            options: Additional Firecrawl parameters
+            
+        Returns:
+            str: Hex digest identifying the request
+        """
+        raw_options = orjson.dumps(options, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.blake2b(url.encode() + b"|" + raw_options, digest_size=16).hexdigest()
+    
+    def _get_cached_response(self, key: str) -> Optional[FirecrawlResponse]:
+        """
+        Return a cached response if present and not expired.
+        
+        Args:
+            key: Response cache key
+            
+        Returns:
+            Optional[FirecrawlResponse]: Cached response or None
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.cache_ttl_seconds:
+            del self._cache[key]
+            return None
         
-        self._last_request_time = time.time()
+        self._cache.move_to_end(key)
+        return response
+    
+    def _store_cached_response(self, key: str, response: FirecrawlResponse) -> None:
+        """
+        Store a successful response, evicting the least recently used entries.
+        
+        Args:
+            key: Response cache key
+            response: Response to cache
+        """
+        if not response.success or self.cache_ttl_seconds <= 0 or self.cache_max_entries <= 0:
+            return
+        
+        self._cache[key] = (time.monotonic(), response)
+        self._cache.move_to_end(key)
+        
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached scrape responses."""
+        self._cache.clear()
     
     def _detect_404_content(self, content: str, url: str) -> bool:
         """
@@ -102,37 +319,8 @@ class FirecrawlClient:
         if not content:
             return False
         
-        content_lower = content.lower()
-        
-        # Common 404 indicators
-        error_indicators = [
-            "404",
-            "page not found",
-            "not found",
-            "page does not exist",
-            "page you requested does not exist",
-            "sorry, the page you requested does not exist",
-            "the page you are looking for could not be found",
-            "this page could not be found",
-            "page cannot be found",
-            "error 404",
-            "http 404",
-            "file not found",
-            "document not found"
-        ]
-        
-        # Check for error indicators
-        for indicator in error_indicators:
-            if indicator in content_lower:
-                logger.debug(
-                    "404 indicator found in content",
-                    url=url,
-                    indicator=indicator
-                )
-                return True
-        
-        # Check for very short content (likely error page)
-        if len(content.strip()) < 100:
+        # Check for very short content first (likely error page)
+        if len(content) < _MIN_CONTENT_LENGTH:
             logger.debug(
                 "Very short content detected, possible error page",
                 url=url,
@@ -140,31 +328,126 @@ class FirecrawlClient:
             )
             return True
         
-        # LawnFawn-specific error patterns
-        if "lawnfawn.com" in url.lower():
-            lawnfawn_error_patterns = [
-                "back to home",
-                "page not found",
-                "sorry, the page you requested does not exist"
-            ]
-            
-            for pattern in lawnfawn_error_patterns:
-                if pattern in content_lower:
-                    logger.debug(
-                        "LawnFawn-specific error pattern found",
-                        url=url,
-                        pattern=pattern
-                    )
-                    return True
+        # Error markers appear near the top of the page, so only the head
+        # of the content is scanned, case-insensitively and without copying
+        # it to lowercase first
+        head = content[:_ERROR_SCAN_PREFIX_CHARS]
+        
+        if "lawnfawn.com" in url.casefold():
+            error_pattern = _LAWNFAWN_ERROR_RE
+        else:
+            error_pattern = _ERROR_RE
+        
+        # The search stops at the first indicator found
+        match = error_pattern.search(head)
+        if match is not None:
+            logger.debug(
+                "404 indicator found in content",
+                url=url,
+                indicator=match.group(0).casefold()
+            )
+            return True
         
         return False
     
+    def _build_response(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        raw_data: Dict[str, Any],
+        credits_used: int,
+        processing_time_ms: int
+    ) -> FirecrawlResponse:
+        """
+        Build a response from a scraped page payload, flagging 404 pages.
+        
+        Args:
+            url: URL that was scraped
+            data: Page payload returned by Firecrawl
+            raw_data: Raw response data to keep on the response
+            credits_used: Credits charged for the page
+            processing_time_ms: Time spent scraping the page
+            
+        Returns:
+            FirecrawlResponse: Scraped content and metadata
+        """
+        # Check for 404 or error content in the scraped data
+        content = data.get('content', '')
+        is_404 = self._detect_404_content(content, url)
+        
+        if is_404:
+            logger.warning(
+                "404 page detected in scraped content",
+                url=url,
+                processing_time_ms=processing_time_ms
+            )
+        
+        return FirecrawlResponse(
+            url=url,
+            content=content,
+            markdown=data.get('markdown', ''),
+            metadata=data.get('metadata', {}),
+            raw_data=raw_data,
+            success=not is_404,
+            error_message="404 Page Not Found" if is_404 else None,
+            credits_used=credits_used,
+            processing_time_ms=processing_time_ms
+        )
+    
+    async def scrape_page(
+        self,
+        url: str,
+        formats: Optional[List[str]] = None,
+        **kwargs
+    ) -> FirecrawlResponse:
+        """
+        Scrape a single page, serving repeated requests from the response cache.
+        
+        Successful responses are cached per URL and options for the configured
+        TTL. Concurrent requests for the same page share a single API call.
+        
+        Args:
+            url: URL to scrape
+            formats: Firecrawl output formats to request (defaults to the
+                configured default formats, markdown only)
+            **kwargs: Additional Firecrawl parameters
+            
+        Returns:
+            FirecrawlResponse: Scraped content and metadata
+            
+        Raises:
+            FirecrawlAPIError: For API-related errors
+            ScrapingError: For scraping-specific errors
+            RateLimitError: When rate limit is exceeded
+        """
+        if formats is not None:
+            kwargs["formats"] = formats
+        
+        key = self._cache_key(url, kwargs)
+        
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            logger.debug("Serving page scrape from cache", url=url)
+            return cached
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._scrape_page(url, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield the shared scrape so one cancelled caller does not cancel it for all
+        response = await asyncio.shield(task)
+        self._store_cached_response(key, response)
+        
+        return response
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError, RateLimitError))
     )
-    async def scrape_page(self, url: str, **kwargs) -> FirecrawlResponse:
+    async def _scrape_page(self, url: str, **kwargs) -> FirecrawlResponse:
         """
         Scrape a single page using Firecrawl API.
         
@@ -180,136 +463,106 @@ class FirecrawlClient:
             ScrapingError: For scraping-specific errors
             RateLimitError: When rate limit is exceeded
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
         logger.info("Starting page scrape", url=url)
         
         try:
             # Respect rate limiting
             await self._wait_for_rate_limit()
+            await self._wait_for_domain_slot(url)
             
-            # Prepare request payload
+            # Prepare request payload. Only the configured formats are requested;
+            # the HTML rendering is not consumed downstream.
             payload = {
                 "url": url,
-                "formats": ["markdown", "html"],
-                "includeTags": ["a", "img", "h1", "h2", "h3", "p", "div", "span"],
-                "excludeTags": ["script", "style", "nav", "footer"],
-                "waitFor": 2000,  # Wait for JavaScript to load
+                "formats": self.default_formats,
+                **_DEFAULT_PAGE_OPTIONS,
                 **kwargs
             }
             
             # Make API request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/v0/scrape",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json=payload
-                )
-                
-                processing_time_ms = int((time.time() - start_time) * 1000)
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = response.headers.get('Retry-After')
-                    retry_after_int = int(retry_after) if retry_after else None
-                    
-                    logger.warning(
-                        "Rate limit exceeded",
-                        url=url,
-                        retry_after=retry_after_int
-                    )
-                    
-                    raise RateLimitError(
-                        "Firecrawl API rate limit exceeded",
-                        retry_after=retry_after_int
-                    )
-                
-                # Handle other HTTP errors
-                if not response.is_success:
-                    error_data = None
-                    try:
-                        error_data = response.json()
-                    except Exception:
-                        pass
-                    
-                    logger.error(
-                        "Firecrawl API error",
-                        url=url,
-                        status_code=response.status_code,
-                        error_data=error_data
-                    )
-                    
-                    raise FirecrawlAPIError(
-                        f"Firecrawl API returned {response.status_code}: {response.text}",
-                        status_code=response.status_code,
-                        response_data=error_data,
-                        url=url
-                    )
-                
-                # Parse successful response
-                result = response.json()
-                
-                # Extract data from response
-                data = result.get('data', {})
-                if not data:
-                    raise ScrapingError(
-                        "No data returned from Firecrawl API",
-                        product_url=url
-                    )
-                
-                # Determine credits used (default to 1 if not provided)
-                credits_used = result.get('credits_used', 1)
+            response = await self._client.post(
+                f"{self.base_url}/v0/scrape",
+                json=payload
+            )
+            
+            processing_time_ms = int((time.monotonic() - start_time) * 1000)
+            
+            # Handle rate limiting
+            if response.status_code == 429:
+                retry_after = response.headers.get('Retry-After')
+                retry_after_int = int(retry_after) if retry_after else None
                 
-                logger.info(
-                    "Page scrape completed successfully",
+                logger.warning(
+                    "Rate limit exceeded",
                     url=url,
-                    processing_time_ms=processing_time_ms,
-                    credits_used=credits_used,
-                    content_length=len(data.get('html', ''))
+                    retry_after=retry_after_int
                 )
                 
-                # Check for 404 or error content in the scraped data
-                content = data.get('content', '')
-                is_404 = self._detect_404_content(content, url)
-                
-                if is_404:
-                    logger.warning(
-                        "404 page detected in scraped content",
-                        url=url,
-                        processing_time_ms=processing_time_ms
-                    )
-                    
-                    return FirecrawlResponse(
-                        url=url,
-                        content=content,
-                        markdown=data.get('markdown', ''),
-                        metadata=data.get('metadata', {}),
-                        raw_data=result,
-                        success=False,
-                        error_message="404 Page Not Found",
-                        credits_used=credits_used,
-                        processing_time_ms=processing_time_ms
-                    )
+                raise RateLimitError(
+                    "Firecrawl API rate limit exceeded",
+                    retry_after=retry_after_int
+                )
+            
+            # Handle other HTTP errors
+            if not response.is_success:
+                error_data = None
+                try:
+                    error_data = orjson.loads(response.content)
+                except Exception:
+                    pass
                 
-                return FirecrawlResponse(
+                logger.error(
+                    "Firecrawl API error",
                     url=url,
-                    content=content,
-                    markdown=data.get('markdown', ''),
-                    metadata=data.get('metadata', {}),
-                    raw_data=result,
-                    success=True,
-                    credits_used=credits_used,
-                    processing_time_ms=processing_time_ms
+                    status_code=response.status_code,
+                    error_data=error_data
                 )
                 
+                raise FirecrawlAPIError(
+                    f"Firecrawl API returned {response.status_code}: {response.text}",
+                    status_code=response.status_code,
+                    response_data=error_data,
+                    url=url
+                )
+            
+            # Parse successful response straight from the raw bytes
+            result = orjson.loads(response.content)
+            
+            # Extract data from response
+            data = result.get('data', {})
+            if not data:
+                raise ScrapingError(
+                    "No data returned from Firecrawl API",
+                    product_url=url
+                )
+            
+            # Determine credits used (default to 1 if not provided)
+            credits_used = result.get('credits_used', 1)
+            
+            logger.info(
+                "Page scrape completed successfully",
+                url=url,
+                processing_time_ms=processing_time_ms,
+                credits_used=credits_used,
+                content_length=len(data.get('content', ''))
+            )
+            
+            # The page payload under 'data' is already lifted into the response
+            # fields, so only the remaining top-level keys are kept by default
+            if self.keep_raw_response:
+                raw_data = result
+            else:
+                raw_data = {key: value for key, value in result.items() if key != 'data'}
+            
+            return self._build_response(url, data, raw_data, credits_used, processing_time_ms)
+            
         except (RateLimitError, FirecrawlAPIError):
             # Re-raise these specific errors
             raise
         except httpx.TimeoutException as e:
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = int((time.monotonic() - start_time) * 1000)
             logger.error(
                 "Firecrawl API timeout",
                 url=url,
@@ -322,7 +575,7 @@ class FirecrawlClient:
                 product_url=url
             )
         except httpx.ConnectError as e:
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = int((time.monotonic() - start_time) * 1000)
             logger.error(
                 "Firecrawl API connection error",
                 url=url,
@@ -335,7 +588,7 @@ class FirecrawlClient:
                 url=url
             )
         except Exception as e:
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = int((time.monotonic() - start_time) * 1000)
             logger.error(
                 "Unexpected error during page scrape",
                 url=url,
@@ -355,6 +608,281 @@ class FirecrawlClient:
                 processing_time_ms=processing_time_ms
             )
     
+    async def scrape_many(
+        self,
+        urls: List[str],
+        concurrency: Optional[int] = None,
+        **kwargs
+    ) -> List[FirecrawlResponse]:
+        """
+        Scrape multiple pages concurrently.
+        
+        In-flight requests are bounded by a semaphore while the shared token
+        bucket keeps the overall request rate within the API limit.
+        
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum in-flight scrapes (defaults to max_concurrent_requests)
+            **kwargs: Additional Firecrawl parameters applied to every URL
+            
+        Returns:
+            List[FirecrawlResponse]: Responses in the same order as ``urls``.
+                Scrapes that raised are returned as unsuccessful responses.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrent_requests)
+        
+        async def scrape_one(url: str) -> FirecrawlResponse:
+            async with semaphore:
+                return await self.scrape_page(url, **kwargs)
+        
+        results = await asyncio.gather(
+            *[scrape_one(url) for url in urls],
+            return_exceptions=True
+        )
+        
+        responses = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Page scrape failed in batch",
+                    url=url,
+                    error=str(result),
+                    error_type=type(result).__name__
+                )
+                result = FirecrawlResponse(
+                    url=url,
+                    content="",
+                    success=False,
+                    error_message=str(result)
+                )
+            responses.append(result)
+        
+        return responses
+    
+    async def batch_scrape(
+        self,
+        urls: List[str],
+        formats: Optional[List[str]] = None,
+        **kwargs
+    ) -> List[FirecrawlResponse]:
+        """
+        Scrape multiple pages with a single Firecrawl batch scrape job.
+        
+        Cached pages are served from the response cache and only the remaining
+        URLs are submitted. Pages missing from the batch result, or all pages if
+        the batch job fails, are scraped individually through ``scrape_many``.
+        
+        Args:
+            urls: URLs to scrape
+            formats: Firecrawl output formats to request (defaults to the
+                configured default formats, markdown only)
+            **kwargs: Additional Firecrawl parameters applied to every URL
+            
+        Returns:
+            List[FirecrawlResponse]: Responses in the same order as ``urls``
+        """
+        if formats is not None:
+            kwargs["formats"] = formats
+        
+        responses: Dict[str, FirecrawlResponse] = {}
+        pending: List[str] = []
+        
+        for url in dict.fromkeys(urls):
+            cached = self._get_cached_response(self._cache_key(url, kwargs))
+            if cached is not None:
+                responses[url] = cached
+            else:
+                pending.append(url)
+        
+        # A single page gains nothing from a batch job
+        if len(pending) > 1:
+            try:
+                batch_responses = await self._batch_scrape(pending, **kwargs)
+            except Exception as e:
+                logger.warning(
+                    "Batch scrape failed, falling back to per-URL scrapes",
+                    total_urls=len(pending),
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                batch_responses = {}
+            
+            for url, response in batch_responses.items():
+                self._store_cached_response(self._cache_key(url, kwargs), response)
+                responses[url] = response
+        
+        missing = [url for url in pending if url not in responses]
+        if missing:
+            if len(pending) > 1:
+                logger.info(
+                    "Scraping pages missing from batch individually",
+                    missing_urls=len(missing),
+                    total_urls=len(pending)
+                )
+            fallback = await self.scrape_many(missing, **kwargs)
+            responses.update(zip(missing, fallback))
+        
+        return [responses[url] for url in urls]
+    
+    async def _batch_scrape(self, urls: List[str], **kwargs) -> Dict[str, FirecrawlResponse]:
+        """
+        Submit a batch scrape job and wait for its results.
+        
+        Args:
+            urls: URLs to scrape
+            **kwargs: Additional Firecrawl parameters applied to every URL
+            
+        Returns:
+            Dict[str, FirecrawlResponse]: Responses keyed by requested URL.
+                Pages the job did not return are absent.
+            
+        Raises:
+            FirecrawlAPIError: For API-related errors
+            ScrapingError: If the job fails or does not finish in time
+            RateLimitError: When rate limit is exceeded
+        """
+        start_time = time.monotonic()
+        
+        logger.info("Starting batch scrape", total_urls=len(urls))
+        
+        # The job scrapes every URL, so each one is charged to the rate limit
+        # and the domain spacing like a single scrape would be
+        for url in urls:
+            await self._wait_for_rate_limit()
+            await self._wait_for_domain_slot(url)
+        
+        payload = {
+            "urls": urls,
+            "formats": self.default_formats,
+            **_DEFAULT_PAGE_OPTIONS,
+            **kwargs
+        }
+        
+        result = self._parse_batch_response(
+            await self._client.post(f"{self.base_url}/v1/batch/scrape", json=payload)
+        )
+        job_id = result.get('id')
+        if not job_id:
+            raise ScrapingError("Batch scrape job was not created")
+        
+        # Large jobs are given proportionally longer to finish
+        rounds = 1 + len(urls) // max(self.max_concurrent_requests, 1)
+        deadline = start_time + self.timeout * rounds
+        status_url = f"{self.base_url}/v1/batch/scrape/{job_id}"
+        
+        while True:
+            await asyncio.sleep(_BATCH_POLL_INTERVAL_SECONDS)
+            result = self._parse_batch_response(await self._client.get(status_url))
+            
+            status = result.get('status')
+            if status == 'completed':
+                break
+            if status == 'failed':
+                raise ScrapingError(f"Batch scrape job {job_id} failed")
+            if time.monotonic() > deadline:
+                raise ScrapingError(f"Batch scrape job {job_id} did not finish in time")
+        
+        pages = list(result.get('data') or [])
+        
+        # Large results are paginated
+        next_url = result.get('next')
+        while next_url:
+            result = self._parse_batch_response(await self._client.get(next_url))
+            pages.extend(result.get('data') or [])
+            next_url = result.get('next')
+        
+        processing_time_ms = int((time.monotonic() - start_time) * 1000)
+        
+        requested = set(urls)
+        responses: Dict[str, FirecrawlResponse] = {}
+        
+        for page in pages:
+            metadata = page.get('metadata') or {}
+            url = metadata.get('sourceURL') or metadata.get('url')
+            if url not in requested:
+                continue
+            
+            page = self._to_v0_page(page)
+            raw_data = {"batch_id": job_id, "data": page} if self.keep_raw_response else {"batch_id": job_id}
+            responses[url] = self._build_response(url, page, raw_data, 1, processing_time_ms)
+        
+        logger.info(
+            "Batch scrape completed",
+            batch_id=job_id,
+            total_urls=len(urls),
+            pages_returned=len(responses),
+            processing_time_ms=processing_time_ms
+        )
+        
+        return responses
+    
+    @staticmethod
+    def _to_v0_page(page: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a v1 batch scrape page into the v0 scrape payload shape.
+        
+        Batch jobs only exist in the v1 API, while single scrapes use v0.
+        Both end up in the same response cache, so batch pages are stored
+        exactly as a single scrape of the URL would have returned them.
+        
+        Args:
+            page: Page payload from a v1 batch scrape result
+            
+        Returns:
+            Dict[str, Any]: Page payload in the v0 shape
+        """
+        metadata = dict(page.get('metadata') or {})
+        if 'sourceURL' not in metadata and 'url' in metadata:
+            metadata['sourceURL'] = metadata['url']
+        if 'statusCode' in metadata:
+            metadata['pageStatusCode'] = metadata.pop('statusCode')
+        if 'error' in metadata:
+            metadata['pageError'] = metadata.pop('error')
+        
+        # v1 has no 'content'; in v0 it holds the page text as markdown
+        markdown = page.get('markdown') or ''
+        converted = {
+            'content': markdown,
+            'markdown': markdown,
+            'metadata': metadata
+        }
+        if 'html' in page:
+            converted['html'] = page['html']
+        if 'rawHtml' in page:
+            converted['rawHtml'] = page['rawHtml']
+        
+        return converted
+    
+    @staticmethod
+    def _parse_batch_response(response: httpx.Response) -> Dict[str, Any]:
+        """
+        Decode a batch scrape API response, raising on HTTP errors.
+        
+        Args:
+            response: HTTP response from a batch scrape endpoint
+            
+        Returns:
+            Dict[str, Any]: Decoded response body
+            
+        Raises:
+            FirecrawlAPIError: For non-success responses
+            RateLimitError: When rate limit is exceeded
+        """
+        if response.status_code == 429:
+            retry_after = response.headers.get('Retry-After')
+            raise RateLimitError(
+                "Firecrawl API rate limit exceeded",
+                retry_after=int(retry_after) if retry_after else None
+            )
+        
+        if not response.is_success:
+            raise FirecrawlAPIError(
+                f"Firecrawl API returned {response.status_code}: {response.text}",
+                status_code=response.status_code
+            )
+        
+        return orjson.loads(response.content)
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform a health check of the Firecrawl API.
@@ -362,34 +890,33 @@ class FirecrawlClient:
         Returns:
             Dict[str, Any]: Health check results with expected structure
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Test basic connectivity with root endpoint
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/")
-                
-                response_time_ms = int((time.time() - start_time) * 1000)
+            response = await self._client.get(f"{self.base_url}/")
+            
+            response_time_ms = int((time.monotonic() - start_time) * 1000)
+            
+            if response.is_success:
+                return {
+                    "status": "healthy",
+                    "service": "firecrawl-api",
+                    "response_time_ms": response_time_ms,
+                    "api_accessible": True,
+                    "base_url": self.base_url
+                }
+            else:
+                return {
+                    "status": "unhealthy", 
+                    "service": "firecrawl-api",
+                    "response_time_ms": response_time_ms,
+                    "api_accessible": False,
+                    "error": f"HTTP {response.status_code}: {response.text}"
+                }
                 
-                if response.is_success:
-                    return {
-                        "status": "healthy",
-                        "service": "firecrawl-api",
-                        "response_time_ms": response_time_ms,
-                        "api_accessible": True,
-                        "base_url": self.base_url
-                    }
-                else:
-                    return {
-                        "status": "unhealthy", 
-                        "service": "firecrawl-api",
-                        "response_time_ms": response_time_ms,
-                        "api_accessible": False,
-                        "error": f"HTTP {response.status_code}: {response.text}"
-                    }
-                    
         except Exception as e:
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = int((time.monotonic() - start_time) * 1000)
             logger.error("Firecrawl health check failed", error=str(e))
             
             return {
@@ -400,6 +927,10 @@ class FirecrawlClient:
                 "error": str(e)
             }
     
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._client.aclose()
+    
     async def get_credits_info(self) -> Dict[str, Any]:
         """
         Get information about Firecrawl API credits usage.
@@ -445,7 +976,11 @@ def get_firecrawl_client(config: Optional[EnrichmentConfig] = None) -> Firecrawl
     return _firecrawl_client
 
 
-def reset_firecrawl_client() -> None:
-    """Reset the global Firecrawl client instance (useful for testing)."""
+async def reset_firecrawl_client() -> None:
+    """Close and reset the global Firecrawl client instance (useful for testing)."""
     global _firecrawl_client
+    
+    if _firecrawl_client is not None:
+        await _firecrawl_client.aclose()
+    
     _firecrawl_client = None
@@ -5,13 +5,22 @@ This module orchestrates the complete invoice processing pipeline from
 PDF upload to database storage, integrating all components.
 """
 
+import asyncio
+import hashlib
+import importlib
+import threading
 import uuid
 import structlog
-from datetime import datetime
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from importlib.metadata import entry_points
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple, TypeVar
+from uuid import UUID
 from app.models.invoice import (
     InvoiceUploadResponse, 
     InvoiceParsingResult,
+    SupplierDetectionResult,
     UnknownSupplierError,
     S3UploadError,
     PDFParsingError
@@ -19,12 +28,158 @@ from app.models.invoice import (
 from app.services.pdf_parser import PDFParserService
 from app.services.supplier_detector import SupplierDetectionService
 from app.services.s3_manager import S3InvoiceManager
-from app.parsers import LawnFawnParsingStrategy
 from app.services.database_service import DatabaseService
+from app.models.base import BatchStatus, FileType
+from app.models.product import ProductCreate
+from app.models.upload_batch import UploadBatchCreate, UploadBatchUpdate
 from app.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Micro-batching of process_invoice_batch: a stage handles up to
+# PIPELINE_CHUNK_SIZE invoices at once, waiting at most
+# PIPELINE_CHUNK_MAX_WAIT_SECONDS for a chunk to fill
+PIPELINE_CHUNK_SIZE = 32
+PIPELINE_CHUNK_MAX_WAIT_SECONDS = 0.25
+PIPELINE_QUEUE_SIZE = PIPELINE_CHUNK_SIZE
+
+# Built-in parsing strategies as "module:Class" paths, imported on first use.
+# Packages can add suppliers through the "app.parsers" entry point group.
+BUILTIN_PARSING_STRATEGIES = {
+    'lawnfawn': 'app.parsers.lawnfawn:LawnFawnParsingStrategy'
+}
+PARSING_STRATEGY_ENTRY_POINT_GROUP = "app.parsers"
+
+# Invoices with more pages than this are split into page ranges across the
+# PDF pool workers; shorter ones are extracted by a single worker
+PDF_PAGE_SPLIT_THRESHOLD = 2
+
+# Files at least this large are hashed in a worker thread; hashlib releases
+# the GIL while hashing, so the event loop keeps serving other requests
+HASH_IN_THREAD_MIN_BYTES = 1024 * 1024
+
+# Extracted PDF content is kept by file hash so a retried upload of the
+# same file skips extraction; bounded by cached text and cell characters
+EXTRACTED_CONTENT_CACHE_MAX_CHARS = 16 * 1024 * 1024
+
+# Presigned download URLs are reused until shortly before they expire
+DOWNLOAD_URL_CACHE_MAX_ENTRIES = 1024
+DOWNLOAD_URL_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Orphaned S3 files removed per cleanup run
+S3_ORPHAN_CLEANUP_BATCH_SIZE = 100
+
+# Shared pool for blocking boto3 calls
+_s3_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_s3_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used for blocking S3 operations.
+    
+    Args:
+        max_workers: Pool size used when the pool is first created
+        
+    Returns:
+        ThreadPoolExecutor: Shared S3 executor
+    """
+    global _s3_executor
+    if _s3_executor is None:
+        _s3_executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="s3"
+        )
+    return _s3_executor
+
+
+# Optional process pool for CPU-bound PDF extraction
+_pdf_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_process_pool(max_workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool used for PDF text and table extraction.
+    
+    Args:
+        max_workers: Pool size used when the pool is first created; 0
+            disables the pool so extraction runs in worker threads
+        
+    Returns:
+        Optional[ProcessPoolExecutor]: Shared pool or None if disabled
+    """
+    global _pdf_process_pool
+    if _pdf_process_pool is None and max_workers > 0:
+        _pdf_process_pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _pdf_process_pool
+
+
+def shutdown_executors() -> None:
+    """Shut down the shared S3 and PDF pools (used on shutdown and in tests)."""
+    global _s3_executor, _pdf_process_pool
+    if _s3_executor is not None:
+        _s3_executor.shutdown(wait=True)
+        _s3_executor = None
+    if _pdf_process_pool is not None:
+        _pdf_process_pool.shutdown(wait=True)
+        _pdf_process_pool = None
+
+
+# PDF parser of the current PDF pool worker process, created on first use
+_process_pdf_parser: Optional[PDFParserService] = None
+
+
+def _get_process_pdf_parser() -> PDFParserService:
+    """Get the PDF parser of the current PDF pool worker process."""
+    global _process_pdf_parser
+    if _process_pdf_parser is None:
+        _process_pdf_parser = PDFParserService()
+    return _process_pdf_parser
+
+
+def _extract_pdf_content(file_data: bytes) -> Tuple[str, List[List[List[str]]]]:
+    """
+    Extract PDF text and tables; runs inside a PDF pool worker process.
+    
+    Args:
+        file_data: PDF file content as bytes
+        
+    Returns:
+        Tuple of (full_text, tables)
+    """
+    return _get_process_pdf_parser().extract_text_and_tables(file_data)
+
+
+def _extract_pdf_pages(file_data: bytes, page_numbers: List[int]) -> Tuple[str, List[List[List[str]]]]:
+    """
+    Extract text and tables of some PDF pages; runs inside a PDF pool worker process.
+    
+    Args:
+        file_data: PDF file content as bytes
+        page_numbers: 1-based numbers of the pages to extract
+        
+    Returns:
+        Tuple of (unstripped text, tables)
+    """
+    return _get_process_pdf_parser().extract_pages(file_data, page_numbers)
+
+
+class _InvoiceJob:
+    """State of one invoice as it moves through the processing stages."""
+    
+    def __init__(self, file_data: bytes, filename: str):
+        self.batch_id = str(uuid.uuid4())
+        self.file_data = file_data
+        self.filename = filename
+        self.detection_result: Optional[SupplierDetectionResult] = None
+        self.pdf_text: Optional[str] = None
+        self.tables: Optional[List[Any]] = None
+        self.parsing_result: Optional[InvoiceParsingResult] = None
+        self.s3_info: Optional[Dict[str, Any]] = None
+        self.content_sha256: Optional[str] = None
+        self.response: Optional[InvoiceUploadResponse] = None
+
 
 class InvoiceProcessorService:
     """
@@ -47,11 +202,22 @@ class InvoiceProcessorService:
         self.supplier_detector = SupplierDetectionService()
         self.s3_manager = S3InvoiceManager()
         self.db_service = DatabaseService()
+        self.s3_executor = get_s3_executor(self.settings.s3_concurrency)
+        # S3 calls beyond the executor's capacity wait here, not in its queue
+        self._s3_slots = asyncio.Semaphore(self.settings.s3_concurrency)
+        self._s3_waiting = 0
+        self._s3_in_flight = 0
+        self.pdf_process_pool = get_pdf_process_pool(self.settings.pdf_parser_processes)
+        self._download_urls: "OrderedDict[str, Tuple[str, datetime]]" = OrderedDict()
+        # Extraction runs in worker threads, so the content cache is locked
+        self._extracted_content: "OrderedDict[str, Tuple[str, List[List[List[str]]], int]]" = OrderedDict()
+        self._extracted_content_chars = 0
+        self._extracted_content_lock = threading.Lock()
+        self._background_tasks: Set[asyncio.Task] = set()
         
-        # Initialize parsing strategies
-        self.parsing_strategies = {
-            'lawnfawn': LawnFawnParsingStrategy()
-        }
+        # Parsing strategy registry; classes are imported lazily on first use
+        self.parsing_strategies = self._discover_parsing_strategies()
+        self._strategy_classes: Dict[str, type] = {}
         
         logger.info("Invoice processor initialized")
     
@@ -66,166 +232,926 @@ class InvoiceProcessorService:
         Returns:
             InvoiceUploadResponse: Complete processing result
         """
-        batch_id = str(uuid.uuid4())
+        job = _InvoiceJob(file_data, filename)
         
         logger.info(
             "Starting invoice processing",
-            batch_id=batch_id,
+            batch_id=job.batch_id,
             filename=filename,
             file_size=len(file_data)
         )
         
         try:
-            # Step 1: Validate PDF file
-            if not self.pdf_parser.validate_pdf_file(file_data):
-                return InvoiceUploadResponse(
-                    success=False,
-                    error="invalid_file",
-                    message="File is not a valid PDF document"
-                )
+            if not self._quick_pdf_signature_ok(file_data):
+                return self._invalid_file_response()
             
-            # Step 2: Extract PDF content
-            logger.info("Extracting PDF content", batch_id=batch_id)
-            pdf_text, tables = self.pdf_parser.extract_text_and_tables(file_data)
-            
-            if not pdf_text.strip():
-                return InvoiceUploadResponse(
-                    success=False,
-                    error="empty_pdf",
-                    message="PDF contains no readable text content"
-                )
+            job.response = await self._duplicate_response(job)
+            if job.response is not None:
+                return job.response
             
-            # Step 3: Detect supplier
-            logger.info("Detecting supplier", batch_id=batch_id)
-            try:
-                detection_result = self.supplier_detector.detect_supplier(pdf_text)
-            except UnknownSupplierError as e:
-                logger.warning("Unknown supplier detected", batch_id=batch_id, error=str(e))
-                return InvoiceUploadResponse(
-                    success=False,
-                    error="unknown_supplier",
-                    message=e.message,
-                    supported_suppliers=e.supported_suppliers
-                )
+            await asyncio.to_thread(self._detect_stage, job)
+            if job.response is None:
+                await self._parse_and_upload_stage(job)
+            if job.response is None:
+                await self._store_stage(job)
+        except Exception as e:
+            job.response = self._error_response(job, e)
+        
+        return job.response
+    
+    async def process_invoice_batch(
+        self,
+        files: List[Tuple[bytes, str]]
+    ) -> List[InvoiceUploadResponse]:
+        """
+        Process several invoices through a staged pipeline.
+        
+        Parsing, S3 upload and database storage run as separate workers
+        connected by bounded queues, so parsing of one invoice overlaps with
+        the upload and storage of the previous ones.
+        
+        Args:
+            files: List of (file_data, filename) tuples
             
-            # Step 4: Parse invoice using supplier-specific strategy
-            logger.info(
-                "Parsing invoice content",
-                batch_id=batch_id,
-                supplier=detection_result.supplier_code
-            )
+        Returns:
+            List[InvoiceUploadResponse]: Results in the same order as files
+        """
+        jobs = [_InvoiceJob(file_data, filename) for file_data, filename in files]
+        
+        logger.info("Starting invoice batch processing", total_invoices=len(jobs))
+        
+        parsed_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        uploaded_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        
+        await asyncio.gather(
+            self._parse_worker(jobs, parsed_q),
+            self._upload_worker(parsed_q, uploaded_q),
+            self._store_worker(uploaded_q)
+        )
+        
+        responses = [job.response for job in jobs]
+        
+        logger.info(
+            "Invoice batch processing completed",
+            total_invoices=len(jobs),
+            succeeded=sum(1 for response in responses if response.success)
+        )
+        
+        return responses
+    
+    async def _parse_worker(self, jobs: List["_InvoiceJob"], parsed_q: asyncio.Queue) -> None:
+        """Parse invoices off the event loop and feed them to the upload stage."""
+        try:
+            for job in jobs:
+                if not self._quick_pdf_signature_ok(job.file_data):
+                    job.response = self._invalid_file_response()
+                    continue
+                
+                try:
+                    job.response = await self._duplicate_response(job)
+                    if job.response is not None:
+                        continue
+                    await asyncio.to_thread(self._parse_stage, job)
+                except Exception as e:
+                    job.response = self._error_response(job, e)
+                
+                if job.response is None:
+                    await parsed_q.put(job)
+        finally:
+            await parsed_q.put(None)
+    
+    async def _next_chunk(self, queue: asyncio.Queue) -> Tuple[List["_InvoiceJob"], bool]:
+        """
+        Collect the next chunk of jobs from a pipeline queue.
+        
+        Waits for the first job, then keeps taking jobs until the chunk is
+        full or PIPELINE_CHUNK_MAX_WAIT_SECONDS have passed, so busy batches
+        are handled in bulk without delaying quiet ones.
+        
+        Args:
+            queue: Pipeline queue terminated by a None sentinel
             
-            parsing_strategy = self.get_parsing_strategy(detection_result.supplier_code)
-            if not parsing_strategy:
-                return InvoiceUploadResponse(
-                    success=False,
-                    error="unsupported_supplier",
-                    message=f"No parsing strategy available for supplier: {detection_result.supplier_code}"
-                )
+        Returns:
+            Tuple of (jobs, finished) where finished is True once the
+            sentinel has been read
+        """
+        job = await queue.get()
+        if job is None:
+            return [], True
+        
+        jobs = [job]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + PIPELINE_CHUNK_MAX_WAIT_SECONDS
+        
+        while len(jobs) < PIPELINE_CHUNK_SIZE:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    job = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
             
-            parsing_result = parsing_strategy.parse_invoice(pdf_text, tables)
+            if job is None:
+                return jobs, True
+            jobs.append(job)
+        
+        return jobs, False
+    
+    async def _upload_worker(self, parsed_q: asyncio.Queue, uploaded_q: asyncio.Queue) -> None:
+        """Upload chunks of parsed invoices to S3 and feed them to the storage stage."""
+        try:
+            finished = False
+            while not finished:
+                jobs, finished = await self._next_chunk(parsed_q)
+                
+                # Uploads of a chunk run in parallel on the bounded S3 executor
+                await asyncio.gather(*(self._upload_job(job) for job in jobs))
+                
+                for job in jobs:
+                    if job.response is None:
+                        await uploaded_q.put(job)
+        finally:
+            await uploaded_q.put(None)
+    
+    async def _upload_job(self, job: "_InvoiceJob") -> None:
+        """Upload one invoice of the batch pipeline, recording any failure."""
+        try:
+            await self._upload_stage(job)
+        except Exception as e:
+            job.response = self._error_response(job, e)
+    
+    async def _store_worker(self, uploaded_q: asyncio.Queue) -> None:
+        """Store chunks of uploaded invoices in the database."""
+        finished = False
+        while not finished:
+            jobs, finished = await self._next_chunk(uploaded_q)
+            if not jobs:
+                continue
             
-            # Step 5: Upload to S3
-            logger.info("Uploading to S3", batch_id=batch_id)
             try:
-                s3_info = self.s3_manager.upload_invoice(
-                    file_data, 
-                    detection_result.supplier_code, 
-                    filename
-                )
-            except S3UploadError as e:
-                logger.error("S3 upload failed", batch_id=batch_id, error=str(e))
-                return InvoiceUploadResponse(
-                    success=False,
-                    error="s3_upload_failed",
-                    message=f"Failed to store invoice: {e.message}"
-                )
+                if len(jobs) == 1:
+                    await self._store_stage(jobs[0])
+                else:
+                    await self._store_chunk(jobs)
+            except Exception as e:
+                for job in jobs:
+                    if job.response is None:
+                        job.response = self._error_response(job, e)
+    
+    async def _duplicate_response(self, job: "_InvoiceJob") -> Optional[InvoiceUploadResponse]:
+        """
+        Hash the invoice file and answer with its earlier result if already processed.
+        
+        Args:
+            job: Invoice job with file data
             
-            # Step 6: Store in database
-            logger.info("Storing in database", batch_id=batch_id)
+        Returns:
+            InvoiceUploadResponse of the earlier batch, or None if the file is new
+        """
+        if len(job.file_data) >= HASH_IN_THREAD_MIN_BYTES:
+            digest = await asyncio.to_thread(hashlib.sha256, job.file_data)
+        else:
+            digest = hashlib.sha256(job.file_data)
+        job.content_sha256 = digest.hexdigest()
+        
+        try:
+            batch = await self.db_service.get_completed_batch_by_hash(job.content_sha256)
+        except Exception as e:
+            # A failed lookup only costs reprocessing the file
+            logger.warning("Duplicate invoice lookup failed", batch_id=job.batch_id, error=str(e))
+            return None
+        
+        if batch is None:
+            return None
+        
+        logger.info("Invoice already processed", batch_id=batch['id'], filename=job.filename)
+        
+        download_url = None
+        if batch.get('s3_key'):
             try:
-                await self.store_processing_results(
-                    batch_id,
-                    detection_result,
-                    parsing_result,
-                    s3_info,
-                    filename,
-                    len(file_data)
-                )
+                download_url, _ = await self._get_download_url(batch['s3_key'])
             except Exception as e:
-                logger.error("Database storage failed", batch_id=batch_id, error=str(e))
-                # Try to cleanup S3 file on database failure
-                try:
-                    self.s3_manager.delete_invoice(s3_info['s3_key'])
-                except Exception:
-                    pass  # Don't fail if cleanup fails
-                
-                return InvoiceUploadResponse(
-                    success=False,
-                    error="database_error",
-                    message=f"Failed to store processing results: {e}"
-                )
+                logger.warning("Failed to generate download URL", batch_id=batch['id'], error=str(e))
+        
+        total_amount = batch.get('total_amount_original')
+        return InvoiceUploadResponse(
+            success=True,
+            batch_id=str(batch['id']),
+            supplier=batch.get('supplier_code'),
+            total_products=batch.get('total_products'),
+            parsing_success_rate=batch.get('parsing_success_rate'),
+            invoice_metadata={
+                'invoice_number': batch.get('invoice_number'),
+                'invoice_date': batch.get('invoice_date'),
+                'currency': batch.get('currency_code'),
+                'total_amount': str(total_amount) if total_amount else None
+            },
+            s3_key=batch.get('s3_key'),
+            download_url=download_url,
+            message="Invoice was already processed"
+        )
+    
+    def _parse_stage(self, job: "_InvoiceJob") -> None:
+        """
+        Validate, extract, detect supplier and parse the invoice.
+        
+        Blocking; sets job.response on failure.
+        
+        Args:
+            job: Invoice job to parse
+        """
+        self._detect_stage(job)
+        if job.response is None:
+            self._strategy_parse(job)
+    
+    @staticmethod
+    def _quick_pdf_signature_ok(file_data: bytes) -> bool:
+        """
+        Cheap check for the PDF header and end-of-file marker.
+        
+        Rejects obvious non-PDF uploads before the full validation, which
+        parses the document with pdfplumber.
+        
+        Args:
+            file_data: Uploaded file content
             
-            # Step 7: Generate download URL
-            try:
-                download_url, expires_at = self.s3_manager.generate_download_url(s3_info['s3_key'])
-            except S3UploadError as e:
-                logger.warning("Failed to generate download URL", batch_id=batch_id, error=str(e))
-                download_url = None
-            
-            # Success response
-            logger.info(
-                "Invoice processing completed successfully",
-                batch_id=batch_id,
-                supplier=detection_result.supplier_code,
-                total_products=len(parsing_result.products),
-                success_rate=parsing_result.parsing_success_rate
-            )
+        Returns:
+            bool: False if the file cannot be a PDF
+        """
+        return file_data[:5] == b'%PDF-' and b'%%EOF' in file_data[-1024:]
+    
+    @staticmethod
+    def _invalid_file_response() -> InvoiceUploadResponse:
+        """Build the response for uploads that are not valid PDF documents."""
+        return InvoiceUploadResponse(
+            success=False,
+            error="invalid_file",
+            message="File is not a valid PDF document"
+        )
+    
+    def _detect_stage(self, job: "_InvoiceJob") -> None:
+        """
+        Validate and extract the PDF and detect its supplier.
+        
+        Blocking; sets job.response on failure.
+        
+        Args:
+            job: Invoice job to inspect
+        """
+        batch_id = job.batch_id
+        
+        try:
+            # Step 1: Validate PDF file
+            if not self.pdf_parser.validate_pdf_file(job.file_data):
+                job.response = self._invalid_file_response()
+                return
             
-            return InvoiceUploadResponse(
-                success=True,
-                batch_id=batch_id,
-                supplier=detection_result.supplier_code,
-                total_products=len(parsing_result.products),
-                parsing_success_rate=parsing_result.parsing_success_rate,
-                invoice_metadata={
-                    'invoice_number': parsing_result.metadata.invoice_number,
-                    'invoice_date': parsing_result.metadata.invoice_date,
-                    'currency': parsing_result.metadata.currency,
-                    'total_amount': str(parsing_result.metadata.total_amount) if parsing_result.metadata.total_amount else None
-                },
-                s3_key=s3_info['s3_key'],
-                download_url=download_url,
-                message="Invoice processed successfully"
+            # Step 2: Extract PDF content
+            logger.debug("Extracting PDF content", batch_id=batch_id)
+            pdf_text, tables = self._extract_content(job.file_data, job.content_sha256)
+        finally:
+            # Validation keeps the document open for an extraction in this
+            # thread; cache hits and the process pool never close it
+            self.pdf_parser.close_open_document()
+        
+        if not pdf_text.strip():
+            job.response = InvoiceUploadResponse(
+                success=False,
+                error="empty_pdf",
+                message="PDF contains no readable text content"
+            )
+            return
+        
+        # Step 3: Detect supplier
+        logger.debug("Detecting supplier", batch_id=batch_id)
+        try:
+            detection_result = self.supplier_detector.detect_supplier(pdf_text)
+        except UnknownSupplierError as e:
+            logger.warning("Unknown supplier detected", batch_id=batch_id, error=str(e))
+            job.response = InvoiceUploadResponse(
+                success=False,
+                error="unknown_supplier",
+                message=e.message,
+                supported_suppliers=e.supported_suppliers
             )
+            return
+        
+        if detection_result.supplier_code not in self.parsing_strategies:
+            job.response = InvoiceUploadResponse(
+                success=False,
+                error="unsupported_supplier",
+                message=f"No parsing strategy available for supplier: {detection_result.supplier_code}"
+            )
+            return
+        
+        job.detection_result = detection_result
+        job.pdf_text = pdf_text
+        job.tables = tables
+    
+    def _extract_content(
+        self,
+        file_data: bytes,
+        content_sha256: Optional[str] = None
+    ) -> Tuple[str, List[List[List[str]]]]:
+        """
+        Extract PDF text and tables, reusing earlier results for the same file.
+        
+        Blocking; called from worker threads.
+        
+        Args:
+            file_data: PDF file content as bytes
+            content_sha256: SHA-256 hex digest of the file; enables the cache
             
-        except PDFParsingError as e:
-            logger.error("PDF parsing error", batch_id=batch_id, error=str(e))
-            return InvoiceUploadResponse(
+        Returns:
+            Tuple of (full_text, tables)
+        """
+        if content_sha256 is None:
+            return self._extract_uncached_content(file_data)
+        
+        with self._extracted_content_lock:
+            cached = self._extracted_content.get(content_sha256)
+            if cached is not None:
+                self._extracted_content.move_to_end(content_sha256)
+        
+        if cached is not None:
+            logger.debug("Reusing extracted PDF content", content_sha256=content_sha256)
+            return cached[0], cached[1]
+        
+        pdf_text, tables = self._extract_uncached_content(file_data)
+        
+        chars = len(pdf_text) + sum(len(cell) for table in tables for row in table for cell in row)
+        with self._extracted_content_lock:
+            if content_sha256 not in self._extracted_content:
+                self._extracted_content[content_sha256] = (pdf_text, tables, chars)
+                self._extracted_content_chars += chars
+            while self._extracted_content_chars > EXTRACTED_CONTENT_CACHE_MAX_CHARS:
+                _, (_, _, evicted_chars) = self._extracted_content.popitem(last=False)
+                self._extracted_content_chars -= evicted_chars
+        
+        return pdf_text, tables
+    
+    def _extract_uncached_content(self, file_data: bytes) -> Tuple[str, List[List[List[str]]]]:
+        """
+        Extract PDF text and tables, in the PDF process pool when enabled.
+        
+        Blocking; called from worker threads.
+        
+        Args:
+            file_data: PDF file content as bytes
+            
+        Returns:
+            Tuple of (full_text, tables)
+        """
+        if self.pdf_process_pool is None:
+            return self.pdf_parser.extract_text_and_tables(file_data)
+        
+        workers = self.settings.pdf_parser_processes
+        page_count = self.pdf_parser.get_page_count(file_data) if workers > 1 else 0
+        if page_count <= PDF_PAGE_SPLIT_THRESHOLD:
+            return self.pdf_process_pool.submit(_extract_pdf_content, file_data).result()
+        
+        # Split long invoices into consecutive page ranges, one per worker,
+        # and merge the results in page order
+        pages_per_task = -(-page_count // min(workers, page_count))
+        futures = [
+            self.pdf_process_pool.submit(
+                _extract_pdf_pages,
+                file_data,
+                list(range(first_page, min(first_page + pages_per_task, page_count + 1)))
+            )
+            for first_page in range(1, page_count + 1, pages_per_task)
+        ]
+        
+        text_parts = []
+        tables = []
+        for future in futures:
+            part_text, part_tables = future.result()
+            text_parts.append(part_text)
+            tables.extend(part_tables)
+        
+        logger.info(
+            "PDF extracted across workers",
+            page_count=page_count,
+            tasks=len(futures),
+            tables_found=len(tables)
+        )
+        
+        return "".join(text_parts).strip(), tables
+    
+    def _strategy_parse(self, job: "_InvoiceJob") -> None:
+        """
+        Parse the extracted content with the supplier-specific strategy.
+        
+        Blocking; requires a successful _detect_stage.
+        
+        Args:
+            job: Invoice job with detected supplier
+        """
+        # Step 4: Parse invoice using supplier-specific strategy
+        supplier_code = job.detection_result.supplier_code
+        logger.debug(
+            "Parsing invoice content",
+            batch_id=job.batch_id,
+            supplier=supplier_code
+        )
+        
+        parsing_strategy = self.get_parsing_strategy(supplier_code)
+        job.parsing_result = parsing_strategy.parse_invoice(job.pdf_text, job.tables)
+    
+    async def _parse_and_upload_stage(self, job: "_InvoiceJob") -> None:
+        """
+        Parse the invoice while uploading it to S3.
+        
+        The S3 key only needs the detected supplier, so the upload does not
+        have to wait for the strategy parse. The uploaded file is removed
+        again if parsing fails.
+        
+        Args:
+            job: Invoice job with detected supplier
+        """
+        upload_result, parse_result = await asyncio.gather(
+            self._upload_stage(job),
+            asyncio.to_thread(self._strategy_parse, job),
+            return_exceptions=True
+        )
+        
+        if isinstance(parse_result, Exception):
+            if job.s3_info:
+                self._schedule_orphan_cleanup(job.s3_info['s3_key'])
+            raise parse_result
+        
+        if isinstance(upload_result, Exception):
+            raise upload_result
+    
+    async def _upload_stage(self, job: "_InvoiceJob") -> None:
+        """
+        Upload the invoice PDF to S3.
+        
+        Sets job.response on failure.
+        
+        Args:
+            job: Invoice job with detected supplier
+        """
+        # Step 5: Upload to S3
+        logger.debug("Uploading to S3", batch_id=job.batch_id)
+        try:
+            job.s3_info = await self._run_s3(
+                self.s3_manager.upload_invoice,
+                job.file_data, 
+                job.detection_result.supplier_code, 
+                job.filename
+            )
+        except S3UploadError as e:
+            logger.error("S3 upload failed", batch_id=job.batch_id, error=str(e))
+            job.response = InvoiceUploadResponse(
                 success=False,
-                error="pdf_parsing_failed",
-                message=f"Failed to parse PDF: {e.message}"
+                error="s3_upload_failed",
+                message=f"Failed to store invoice: {e.message}"
+            )
+    
+    async def _store_stage(self, job: "_InvoiceJob") -> None:
+        """
+        Store results in the database and build the success response.
+        
+        Args:
+            job: Uploaded invoice job
+        """
+        # Steps 6 and 7: Store in database while generating the download URL
+        logger.debug("Storing in database", batch_id=job.batch_id)
+        store_result, url_result = await asyncio.gather(
+            self.store_processing_results(
+                job.batch_id,
+                job.detection_result,
+                job.parsing_result,
+                job.s3_info,
+                job.filename,
+                len(job.file_data),
+                job.content_sha256
+            ),
+            self._get_download_url(job.s3_info['s3_key']),
+            return_exceptions=True
+        )
+        
+        if isinstance(store_result, Exception):
+            await self._fail_store(job, store_result)
+        else:
+            self._complete_job(job, url_result)
+    
+    async def _store_chunk(self, jobs: List["_InvoiceJob"]) -> None:
+        """
+        Store several uploaded invoices with one bulk insert per table.
+        
+        Falls back to storing invoices one by one if the upload batch insert
+        is rejected, and to single product inserts if the products are.
+        
+        Args:
+            jobs: Uploaded invoice jobs
+        """
+        logger.debug("Storing invoice chunk in database", invoices=len(jobs))
+        
+        url_task = asyncio.gather(
+            *(self._get_download_url(job.s3_info['s3_key']) for job in jobs),
+            return_exceptions=True
+        )
+        
+        store_errors: Dict[str, Exception] = {}
+        supplier_ids: Dict[str, UUID] = {}
+        prepared = []
+        
+        for job in jobs:
+            supplier_code = job.detection_result.supplier_code
+            try:
+                if supplier_code not in supplier_ids:
+                    supplier_ids[supplier_code] = await self._resolve_supplier_id(job.detection_result)
+            except Exception as e:
+                store_errors[job.batch_id] = e
+                continue
+            prepared.append((job, supplier_ids[supplier_code]))
+        
+        try:
+            await self.db_service.create_upload_batches_bulk([
+                (
+                    self._build_upload_batch(
+                        job.detection_result,
+                        job.parsing_result,
+                        job.s3_info,
+                        job.filename,
+                        len(job.file_data),
+                        supplier_id,
+                        job.content_sha256
+                    ),
+                    job.batch_id
+                )
+                for job, supplier_id in prepared
+            ])
+        except Exception as e:
+            logger.warning(
+                "Bulk upload batch insert failed, storing invoices individually",
+                invoices=len(prepared),
+                error=str(e)
+            )
+            results = await asyncio.gather(
+                *(
+                    self.store_processing_results(
+                        job.batch_id,
+                        job.detection_result,
+                        job.parsing_result,
+                        job.s3_info,
+                        job.filename,
+                        len(job.file_data),
+                        job.content_sha256
+                    )
+                    for job, _ in prepared
+                ),
+                return_exceptions=True
+            )
+            for (job, _), result in zip(prepared, results):
+                if isinstance(result, Exception):
+                    store_errors[job.batch_id] = result
+        else:
+            await self._store_chunk_products(prepared, store_errors)
+        
+        url_results = await url_task
+        for job, url_result in zip(jobs, url_results):
+            if job.batch_id in store_errors:
+                await self._fail_store(job, store_errors[job.batch_id])
+            else:
+                self._complete_job(job, url_result)
+    
+    async def _store_chunk_products(
+        self,
+        prepared: List[Tuple["_InvoiceJob", UUID]],
+        store_errors: Dict[str, Exception]
+    ) -> None:
+        """
+        Store the products of a chunk whose upload batches already exist.
+        
+        Args:
+            prepared: Jobs with their resolved supplier IDs
+            store_errors: Collects storage errors by batch ID
+        """
+        product_rows = {}
+        products_failed = {}
+        for job, supplier_id in prepared:
+            product_rows[job.batch_id], products_failed[job.batch_id] = self._build_product_rows(
+                job.batch_id, supplier_id, job.parsing_result
             )
         
+        products_stored = {}
+        try:
+            await self.db_service.create_products_bulk(
+                [row for rows in product_rows.values() for row in rows]
+            )
+            products_stored = {batch_id: len(rows) for batch_id, rows in product_rows.items()}
         except Exception as e:
-            logger.error("Unexpected processing error", batch_id=batch_id, error=str(e))
+            logger.warning(
+                "Bulk product insert failed, storing products individually",
+                invoices=len(prepared),
+                error=str(e)
+            )
+            for batch_id, rows in product_rows.items():
+                stored, failed = await self._store_products_individually(rows)
+                products_stored[batch_id] = stored
+                products_failed[batch_id] += failed
+        
+        results = await asyncio.gather(
+            *(
+                self._complete_upload_batch(
+                    job.batch_id,
+                    len(job.parsing_result.products),
+                    products_stored[job.batch_id],
+                    products_failed[job.batch_id]
+                )
+                for job, _ in prepared
+            ),
+            return_exceptions=True
+        )
+        for (job, _), result in zip(prepared, results):
+            if isinstance(result, Exception):
+                store_errors[job.batch_id] = result
+    
+    async def _fail_store(self, job: "_InvoiceJob", error: Exception) -> None:
+        """
+        Record a database failure and queue the uploaded file for removal.
+        
+        Args:
+            job: Invoice job that could not be stored
+            error: Storage error
+        """
+        logger.error("Database storage failed", batch_id=job.batch_id, exc_info=error)
+        
+        # S3 file is cleaned up in the background, not on the response path
+        self._download_urls.pop(job.s3_info['s3_key'], None)
+        self._schedule_orphan_cleanup(job.s3_info['s3_key'])
+        
+        job.response = InvoiceUploadResponse(
+            success=False,
+            error="database_error",
+            message=f"Failed to store processing results: {error}"
+        )
+    
+    def _complete_job(self, job: "_InvoiceJob", url_result: Any) -> None:
+        """
+        Build the success response of a stored invoice.
+        
+        Args:
+            job: Stored invoice job
+            url_result: (download_url, expires_at) or the URL generation error
+        """
+        batch_id = job.batch_id
+        detection_result = job.detection_result
+        parsing_result = job.parsing_result
+        
+        if isinstance(url_result, S3UploadError):
+            logger.warning("Failed to generate download URL", batch_id=batch_id, error=str(url_result))
+            download_url = None
+        elif isinstance(url_result, Exception):
+            job.response = self._error_response(job, url_result)
+            return
+        else:
+            download_url, expires_at = url_result
+        
+        # Success response
+        logger.info(
+            "Invoice processing completed successfully",
+            batch_id=batch_id,
+            supplier=detection_result.supplier_code,
+            total_products=len(parsing_result.products),
+            success_rate=parsing_result.parsing_success_rate
+        )
+        
+        job.response = InvoiceUploadResponse(
+            success=True,
+            batch_id=batch_id,
+            supplier=detection_result.supplier_code,
+            total_products=len(parsing_result.products),
+            parsing_success_rate=parsing_result.parsing_success_rate,
+            invoice_metadata={
+                'invoice_number': parsing_result.metadata.invoice_number,
+                'invoice_date': parsing_result.metadata.invoice_date,
+                'currency': parsing_result.metadata.currency,
+                'total_amount': str(parsing_result.metadata.total_amount) if parsing_result.metadata.total_amount else None
+            },
+            s3_key=job.s3_info['s3_key'],
+            download_url=download_url,
+            message="Invoice processed successfully"
+        )
+    
+    def _error_response(self, job: "_InvoiceJob", error: Exception) -> InvoiceUploadResponse:
+        """
+        Build the failure response for an exception raised by a stage.
+        
+        Args:
+            job: Invoice job that failed
+            error: Raised exception
+            
+        Returns:
+            InvoiceUploadResponse: Failure response
+        """
+        if isinstance(error, PDFParsingError):
+            logger.error("PDF parsing error", batch_id=job.batch_id, error=str(error))
             return InvoiceUploadResponse(
                 success=False,
-                error="processing_failed",
-                message=f"Unexpected error during processing: {e}"
+                error="pdf_parsing_failed",
+                message=f"Failed to parse PDF: {error.message}"
             )
+        
+        logger.error("Unexpected processing error", batch_id=job.batch_id, error=str(error))
+        return InvoiceUploadResponse(
+            success=False,
+            error="processing_failed",
+            message=f"Unexpected error during processing: {error}"
+        )
+    
+    async def _run_s3(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking S3 call on the shared executor.
+        
+        At most s3_concurrency calls run at once; further calls queue for a
+        free slot.
+        
+        Args:
+            func: Blocking S3 manager method
+            *args: Positional arguments for the call
+            
+        Returns:
+            The call's return value
+        """
+        if self._s3_slots.locked():
+            logger.debug("S3 operations at capacity", waiting=self._s3_waiting + 1)
+        
+        self._s3_waiting += 1
+        try:
+            await self._s3_slots.acquire()
+        finally:
+            self._s3_waiting -= 1
+        
+        self._s3_in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.s3_executor, func, *args)
+        finally:
+            self._s3_in_flight -= 1
+            self._s3_slots.release()
+    
+    def get_queue_stats(self) -> Dict[str, int]:
+        """
+        Get the current load of the S3 and background cleanup queues.
+        
+        Returns:
+            Dict with S3 capacity, running and waiting calls and pending
+            orphan cleanups
+        """
+        return {
+            's3_capacity': self.settings.s3_concurrency,
+            's3_in_flight': self._s3_in_flight,
+            's3_waiting': self._s3_waiting,
+            'orphan_cleanups_pending': len(self._background_tasks)
+        }
+    
+    def _schedule_orphan_cleanup(self, s3_key: str) -> None:
+        """
+        Queue an uploaded file without database records for deletion.
+        
+        Args:
+            s3_key: S3 object key of the orphaned file
+        """
+        task = asyncio.create_task(self._enqueue_orphan_cleanup(s3_key))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _enqueue_orphan_cleanup(self, s3_key: str) -> None:
+        """
+        Record an orphaned S3 file, deleting it directly if it cannot be queued.
+        
+        Args:
+            s3_key: S3 object key of the orphaned file
+        """
+        try:
+            await self.db_service.enqueue_s3_orphan(s3_key)
+        except Exception as e:
+            logger.warning("Could not queue S3 orphan, deleting directly", s3_key=s3_key, error=str(e))
+            try:
+                await self._run_s3(self.s3_manager.delete_invoice, s3_key)
+            except Exception:
+                pass  # Don't fail if cleanup fails
+    
+    async def cleanup_s3_orphans(self, limit: int = S3_ORPHAN_CLEANUP_BATCH_SIZE) -> int:
+        """
+        Delete queued orphaned invoice files from S3.
+        
+        Files that fail to delete stay queued for the next run.
+        
+        Args:
+            limit: Maximum number of orphans to clean up
+            
+        Returns:
+            int: Number of deleted files
+        """
+        orphans = await self.db_service.get_s3_orphans(limit)
+        if not orphans:
+            return 0
+        
+        results = await asyncio.gather(
+            *(self._run_s3(self.s3_manager.delete_invoice, orphan['s3_key']) for orphan in orphans),
+            return_exceptions=True
+        )
+        
+        deleted_ids = [
+            orphan['id'] for orphan, result in zip(orphans, results)
+            if not isinstance(result, Exception)
+        ]
+        await self.db_service.delete_s3_orphans(deleted_ids)
+        
+        logger.info(
+            "S3 orphans cleaned up",
+            queued_count=len(orphans),
+            deleted_count=len(deleted_ids)
+        )
+        
+        return len(deleted_ids)
+    
+    async def _get_download_url(self, s3_key: str) -> Tuple[str, datetime]:
+        """
+        Get a presigned download URL, reusing a cached one while it stays valid.
+        
+        Args:
+            s3_key: S3 object key
+            
+        Returns:
+            Tuple of (presigned_url, expiration_datetime)
+            
+        Raises:
+            S3UploadError: If URL generation fails
+        """
+        cached = self._download_urls.get(s3_key)
+        if cached is not None:
+            if datetime.utcnow() < cached[1] - DOWNLOAD_URL_REFRESH_MARGIN:
+                self._download_urls.move_to_end(s3_key)
+                return cached
+            del self._download_urls[s3_key]
+        
+        download_url, expires_at = await self._run_s3(
+            self.s3_manager.generate_download_url, s3_key
+        )
+        
+        self._download_urls[s3_key] = (download_url, expires_at)
+        while len(self._download_urls) > DOWNLOAD_URL_CACHE_MAX_ENTRIES:
+            self._download_urls.popitem(last=False)
+        
+        return download_url, expires_at
+    
+    @staticmethod
+    def _discover_parsing_strategies() -> Dict[str, str]:
+        """
+        Collect parsing strategy import paths by supplier code.
+        
+        Returns:
+            Dict mapping supplier codes to "module:Class" paths
+        """
+        strategies = dict(BUILTIN_PARSING_STRATEGIES)
+        
+        # Python 3.9 has no group selection and returns a dict of groups
+        installed = entry_points()
+        if hasattr(installed, 'select'):
+            group = installed.select(group=PARSING_STRATEGY_ENTRY_POINT_GROUP)
+        else:
+            group = installed.get(PARSING_STRATEGY_ENTRY_POINT_GROUP, [])
+        
+        for entry_point in group:
+            strategies.setdefault(entry_point.name, entry_point.value)
+        
+        return strategies
     
     def get_parsing_strategy(self, supplier_code: str):
         """
         Get parsing strategy for supplier.
         
+        Strategies keep per-parse error state, so a fresh instance is
+        returned for every invoice; only the class is cached.
+        
         Args:
             supplier_code: Supplier code
             
         Returns:
-            Parsing strategy instance or None
+            New parsing strategy instance or None
         """
-        return self.parsing_strategies.get(supplier_code)
+        strategy_class = self._strategy_classes.get(supplier_code)
+        
+        if strategy_class is None:
+            strategy_path = self.parsing_strategies.get(supplier_code)
+            if not strategy_path:
+                return None
+            
+            module_name, _, class_name = strategy_path.partition(':')
+            strategy_class = getattr(importlib.import_module(module_name), class_name)
+            self._strategy_classes[supplier_code] = strategy_class
+        
+        return strategy_class()
     
     async def store_processing_results(
         self,
@@ -234,7 +1160,8 @@ class InvoiceProcessorService:
         parsing_result: InvoiceParsingResult,
         s3_info: Dict[str, Any],
         original_filename: str,
-        file_size: int
+        file_size: int,
+        content_sha256: Optional[str] = None
     ) -> None:
         """
         Store processing results in database.
@@ -246,13 +1173,58 @@ class InvoiceProcessorService:
             s3_info: S3 upload information
             original_filename: Original filename
             file_size: File size in bytes
+            content_sha256: SHA-256 hex digest of the file (optional)
+        """
+        supplier_id = await self._resolve_supplier_id(detection_result)
+        
+        # Create upload batch record
+        batch_data = self._build_upload_batch(
+            detection_result,
+            parsing_result,
+            s3_info,
+            original_filename,
+            file_size,
+            supplier_id,
+            content_sha256
+        )
+        
+        # Store batch record using the provided batch_id
+        await self.db_service.create_upload_batch(batch_data, batch_id)
+        logger.debug("Created upload batch", batch_id=batch_id)
+        
+        # Store product records using the provided batch ID
+        product_rows, products_failed = self._build_product_rows(batch_id, supplier_id, parsing_result)
+        
+        try:
+            products_stored = await self.db_service.create_products_bulk(product_rows)
+        except Exception as e:
+            # One rejected row fails the whole insert; retry row by row so
+            # the remaining products are still stored
+            logger.warning(
+                "Bulk product insert failed, storing products individually",
+                batch_id=batch_id,
+                error=str(e)
+            )
+            products_stored, individually_failed = await self._store_products_individually(product_rows)
+            products_failed += individually_failed
+        
+        await self._complete_upload_batch(
+            batch_id,
+            len(parsing_result.products),
+            products_stored,
+            products_failed
+        )
+    
+    async def _resolve_supplier_id(self, detection_result) -> UUID:
         """
-        # Import the required models
-        from app.models.upload_batch import UploadBatchCreate
-        from app.models.product import ProductCreate
-        from app.models.base import FileType
-        from uuid import UUID
+        Look up the database ID of the detected supplier.
         
+        Args:
+            detection_result: Supplier detection result
+            
+        Returns:
+            UUID: Supplier ID
+        """
         # Get supplier ID - map supplier codes to database codes
         supplier_code_mapping = {
             'lawnfawn': 'LF',
@@ -267,10 +1239,34 @@ class InvoiceProcessorService:
             logger.error(f"Supplier with code {db_supplier_code} not found in database")
             raise Exception(f"Supplier {detection_result.supplier_code} (DB code: {db_supplier_code}) not found in database")
         
-        supplier_id = supplier.id if hasattr(supplier, 'id') else UUID(str(supplier['id']))
+        return supplier.id if hasattr(supplier, 'id') else UUID(str(supplier['id']))
+    
+    def _build_upload_batch(
+        self,
+        detection_result,
+        parsing_result: InvoiceParsingResult,
+        s3_info: Dict[str, Any],
+        original_filename: str,
+        file_size: int,
+        supplier_id: UUID,
+        content_sha256: Optional[str] = None
+    ) -> UploadBatchCreate:
+        """
+        Build the upload batch record of a processed invoice.
         
-        # Create upload batch record
-        batch_data = UploadBatchCreate(
+        Args:
+            detection_result: Supplier detection result
+            parsing_result: Invoice parsing result
+            s3_info: S3 upload information
+            original_filename: Original filename
+            file_size: File size in bytes
+            supplier_id: Database ID of the supplier
+            content_sha256: SHA-256 hex digest of the file (optional)
+            
+        Returns:
+            UploadBatchCreate: Upload batch creation data
+        """
+        return UploadBatchCreate(
             supplier_id=str(supplier_id),
             batch_name=f"Invoice_{parsing_result.metadata.invoice_number or 'Unknown'}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
             file_type=FileType.PDF,
@@ -286,50 +1282,95 @@ class InvoiceProcessorService:
             currency_code=parsing_result.metadata.currency,
             total_amount_original=float(parsing_result.metadata.total_amount) if parsing_result.metadata.total_amount else None,
             parsing_success_rate=parsing_result.parsing_success_rate,
-                total_products=len(parsing_result.products)
+            total_products=len(parsing_result.products),
+            content_sha256=content_sha256
         )
+    
+    def _build_product_rows(
+        self,
+        batch_id: str,
+        supplier_id: UUID,
+        parsing_result: InvoiceParsingResult
+    ) -> Tuple[List[ProductCreate], int]:
+        """
+        Build product records for the parsed products of an invoice.
         
-        # Store batch record using the provided batch_id
-        created_batch = await self.db_service.create_upload_batch(batch_data, batch_id)
-        logger.info(f"Created upload batch with ID: {batch_id}")
-        
-        # Store product records using the provided batch ID
-        products_stored = 0
+        Args:
+            batch_id: Upload batch identifier
+            supplier_id: Database ID of the supplier
+            parsing_result: Invoice parsing result
+            
+        Returns:
+            Tuple of (product_rows, failed_count)
+        """
+        product_rows = []
         products_failed = 0
         
+        # Parse the shared IDs once instead of validating the strings per product
+        batch_uuid = UUID(batch_id)
+        
         for product in parsing_result.products:
             try:
-                product_data = ProductCreate(
-                    batch_id=batch_id,
-                    supplier_id=str(supplier_id),
+                product_rows.append(ProductCreate(
+                    batch_id=batch_uuid,
+                    supplier_id=supplier_id,
                     supplier_sku=product.supplier_sku,
                     supplier_name=product.product_name,
                     manufacturer=product.manufacturer,
                     manufacturer_sku=product.manufacturer_sku,
                     category=product.category,
                     quantity_ordered=product.quantity,
-                    supplier_price_usd=float(product.price_usd),
-                    line_total_usd=float(product.line_total_usd),
+                    supplier_price_usd=product.price_usd,
+                    line_total_usd=product.line_total_usd,
                     origin_country=product.origin_country,
                     tariff_code=product.tariff_code,
                     raw_description=product.raw_description,
                     line_number=product.line_number
-                )
+                ))
+            except Exception as e:
+                logger.warning(f"Failed to store product {product.supplier_sku}: {e}")
+                products_failed += 1
+        
+        return product_rows, products_failed
+    
+    async def _store_products_individually(self, product_rows: List[ProductCreate]) -> Tuple[int, int]:
+        """
+        Insert products one by one after a rejected bulk insert.
+        
+        Args:
+            product_rows: Product records to insert
+            
+        Returns:
+            Tuple of (stored_count, failed_count)
+        """
+        products_stored = 0
+        products_failed = 0
+        
+        for product_data in product_rows:
+            try:
+                if await self.db_service.create_product(product_data) is None:
+                    logger.warning(f"Product {product_data.supplier_sku} already exists, not stored")
+                    products_failed += 1
+                    continue
                 
-                await self.db_service.create_product(product_data)
                 products_stored += 1
                 
             except Exception as e:
-                logger.warning(f"Failed to store product {product.supplier_sku}: {e}")
+                logger.warning(f"Failed to store product {product_data.supplier_sku}: {e}")
                 products_failed += 1
         
-        # Update batch with final counts and status
-        from app.models.upload_batch import UploadBatchUpdate
-        from app.models.base import BatchStatus
-        from uuid import UUID
-        
+        return products_stored, products_failed
+    
+    async def _complete_upload_batch(
+        self,
+        batch_id: str,
+        total_products: int,
+        products_stored: int,
+        products_failed: int
+    ) -> None:
+        """Update the upload batch with its final counts and status."""
         batch_update = UploadBatchUpdate(
-            total_products=len(parsing_result.products),
+            total_products=total_products,
             processed_products=products_stored,
             failed_products=products_failed,
             status=BatchStatus.COMPLETED
@@ -337,12 +1378,12 @@ class InvoiceProcessorService:
         
         await self.db_service.update_upload_batch(UUID(batch_id), batch_update)
         
-        logger.info(
+        logger.debug(
             "Processing results stored and batch updated",
             batch_id=batch_id,
             products_stored=products_stored,
             products_failed=products_failed,
-            total_products=len(parsing_result.products)
+            total_products=total_products
         )
     
     async def get_invoice_details(self, batch_id: str) -> Optional[Dict[str, Any]]:
@@ -401,7 +1442,7 @@ class InvoiceProcessorService:
                 return None
             
             # Generate presigned URL
-            download_url, expires_at = self.s3_manager.generate_download_url(batch.s3_key)
+            download_url, expires_at = await self._get_download_url(batch.s3_key)
             
             # Note: increment_download_count method doesn't exist in database service
             # This would need to be implemented if download tracking is required
@@ -411,3 +1452,44 @@ class InvoiceProcessorService:
         except Exception as e:
             logger.error("Failed to generate download URL", batch_id=batch_id, error=str(e))
             return None
+
+
+# Global invoice processor instance, shared across requests
+_invoice_processor: Optional[InvoiceProcessorService] = None
+
+
+def get_invoice_processor() -> InvoiceProcessorService:
+    """
+    Get the global invoice processor instance.
+    
+    Created on first use so the S3 client and its connection pool are
+    built once and reused by all requests.
+    
+    Returns:
+        InvoiceProcessorService: Invoice processor instance
+    """
+    global _invoice_processor
+    if _invoice_processor is None:
+        _invoice_processor = InvoiceProcessorService()
+    return _invoice_processor
+
+
+def reset_invoice_processor() -> None:
+    """Reset the global invoice processor (for testing)."""
+    global _invoice_processor
+    _invoice_processor = None
+
+
+async def run_s3_orphan_cleanup(interval_seconds: int) -> None:
+    """
+    Periodically delete orphaned invoice files until cancelled.
+    
+    Args:
+        interval_seconds: Seconds between cleanup runs
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await get_invoice_processor().cleanup_s3_orphans()
+        except Exception as e:
+            logger.warning("S3 orphan cleanup failed", error=str(e))
@@ -5,25 +5,135 @@ This module handles SKU extraction, search URL construction, product page scrapi
 and confidence scoring specifically for LawnFawn products.
 """
 
+import asyncio
+import io
 import re
 import time
-from typing import Optional, List, Dict, Any
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from urllib.parse import quote
 import structlog
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from ..models.product import Product
 from ..models.enrichment import (
     EnrichmentData, SearchResults, ProductData, EnrichmentMethod,
-    EnrichmentConfig
+    EnrichmentConfig, FirecrawlResponse
 )
 from ..exceptions.enrichment import (
     SKUExtractionError, SearchError, ScrapingError
 )
+from ..core.config import get_settings
 from .firecrawl_client import get_firecrawl_client
 
 logger = structlog.get_logger(__name__)
 
+# Parsed search and product pages kept for reuse while the Firecrawl client
+# keeps serving the same cached response
+PARSED_PAGE_CACHE_MAX_ENTRIES = 256
+
+
+# Elements whose text is not part of the visible page text
+_SKIPPED_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+# Shared HTML parser; lxml keeps a separate parser context per thread.
+# Parsing the UTF-8 bytes sidesteps lxml's refusal of str input that
+# carries an encoding declaration
+_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+
+
+def _has_class(name: str) -> str:
+    """
+    Build an XPath predicate matching elements with a class token, like ``.name`` in CSS.
+    
+    Args:
+        name: Class name
+        
+    Returns:
+        str: XPath predicate expression
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _parse_html(content: str) -> Optional[Any]:
+    """
+    Parse page content into an lxml HTML tree.
+    
+    Args:
+        content: Page content
+        
+    Returns:
+        Optional[Any]: Root element, or None for empty content
+    """
+    return etree.fromstring(content.encode('utf-8'), _HTML_PARSER)
+
+
+def _element_text(element: Any) -> str:
+    """
+    Return the stripped, concatenated text of an element and its descendants.
+    
+    Matches BeautifulSoup's ``get_text(strip=True)``: comments and script,
+    style and template contents are left out.
+    
+    Args:
+        element: lxml element
+        
+    Returns:
+        str: Element text
+    """
+    parts: List[str] = []
+    
+    def collect(node: Any) -> None:
+        if not isinstance(node.tag, str) or node.tag in _SKIPPED_TEXT_TAGS:
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            collect(child)
+            if child.tail:
+                parts.append(child.tail)
+    
+    collect(element)
+    return ''.join(stripped for stripped in (part.strip() for part in parts) if stripped)
+
+
+def _absolute_url(url: str) -> str:
+    """
+    Convert a protocol-relative or site-relative LawnFawn URL to an absolute one.
+    
+    Args:
+        url: URL as found in page content
+        
+    Returns:
+        str: Absolute URL (unchanged if already absolute)
+    """
+    if url.startswith('//'):
+        return f"https:{url}"
+    if url.startswith('/'):
+        return f"https://www.lawnfawn.com{url}"
+    return url
+
+
+@lru_cache(maxsize=4096)
+def _extract_numeric_sku(sku_pattern: str, supplier_sku: str) -> Optional[str]:
+    """
+    Extract the first group of a SKU pattern from an uppercased supplier SKU.
+    
+    Cached because the same SKU is extracted several times while matching
+    one product, and invoices repeat SKUs.
+    
+    Args:
+        sku_pattern: SKU extraction regex with the numeric part as group 1
+        supplier_sku: Original supplier SKU
+        
+    Returns:
+        Optional[str]: Numeric SKU or None if not found
+    """
+    match = re.compile(sku_pattern).search(supplier_sku.upper())
+    return match.group(1) if match else None
+
 
 class LawnFawnMatcher:
     """
@@ -37,6 +147,155 @@ class LawnFawnMatcher:
     - Confidence scoring
     """
     
+    # "Show X result(s)" style result counts on search pages, in priority
+    # order. Each pattern is paired with a lowercase literal that every match
+    # contains, and whether the count digits come before that literal.
+    RESULT_COUNT_PATTERNS = (
+        ('show ', re.compile(r'Show (\d+) results?', re.IGNORECASE), False),
+        (' result', re.compile(r'(\d+) results? found', re.IGNORECASE), True),
+        (' product', re.compile(r'(\d+) products? found', re.IGNORECASE), True),
+    )
+    
+    # Search results section: from "Show X result(s)" up to the first filter
+    # or sort heading (or the end of the page). The end marker is found with a
+    # separate forward search rather than a lazy scan that re-tries the
+    # lookahead at every character.
+    RESULTS_SECTION_START_PATTERN = re.compile(r'Show \d+ results?', re.IGNORECASE)
+    RESULTS_SECTION_END_PATTERN = re.compile(r'Filter|Sort|Product type', re.IGNORECASE)
+    
+    # Product links inside the search results section, one alternative per
+    # link form; each alternative captures the URL in its own named group
+    SEARCH_RESULT_LINK_PATTERN = re.compile(
+        # Markdown link with product URL: [product name](url)
+        r'\[[^\]]+\]\((?P<markdown>https://www\.lawnfawn\.com/products/[^)]+)\)'
+        # Direct product URLs
+        r'|(?P<absolute>https://www\.lawnfawn\.com/products/[^\s\)]+)'
+        # Relative product URLs
+        r'|\((?P<relative>/products/[^)]+)\)',
+        re.IGNORECASE
+    )
+    
+    # Broad product link pattern used when no results section is found
+    BROAD_URL_PATTERN = re.compile(
+        # Markdown link format: [text](url)
+        r'\[[^\]]*\]\((?P<markdown>https://www\.lawnfawn\.com/[^)]*products/[^)]*)\)'
+        # Direct URL mentions
+        r'|(?P<absolute>https://www\.lawnfawn\.com/[^\s]*products/[^\s]*)'
+        # Relative URLs that start with /products/
+        r'|\((?P<relative>/products/[^)]*)\)'
+        r'|(?P<bare>/products/[^\s\)]*)',
+        re.IGNORECASE
+    )
+    
+    # Product title lines in markdown page content
+    TITLE_PATTERNS = (
+        re.compile(r'^# (.+)$'),  # Markdown h1
+        re.compile(r'^\*\*(.+)\*\*$'),  # Bold text
+        re.compile(r'^(.+) – Lawn Fawn$'),  # Common title format
+    )
+    
+    # Search page product link selectors, most specific first
+    LINK_SELECTORS = (
+        'a.js-prod-link',  # Primary LawnFawn product link class
+        'a.media.block.relative',  # Alternative class combination
+        'a[href*="/products/"]',  # Generic product URL selector
+        '.product-item a',  # Fallback selectors
+        '.product-link',
+        '.grid-product__link'
+    )
+    
+    # Common product names that might appear in search page content, in
+    # priority order, with the product URL each one maps to
+    PRODUCT_NAME_URLS = tuple(
+        (indicator, f"https://www.lawnfawn.com/products/{indicator.replace(' ', '-')}")
+        for indicator in (
+            'stitched rectangle frames',
+            'rectangle frames',
+            'stitched frames'
+        )
+    )
+    
+    # Product page fields, each as XPath queries in priority order
+    NAME_XPATHS = tuple(etree.XPath(query) for query in (
+        f"//h1[{_has_class('product-title')}]",
+        f"//h1[{_has_class('product__title')}]",
+        f"//*[{_has_class('product-single__title')}]",
+        "//h1",
+        f"//*[{_has_class('product-name')}]",
+    ))
+    DESCRIPTION_XPATHS = tuple(etree.XPath(query) for query in (
+        f"//*[{_has_class('product-description')}]",
+        f"//*[{_has_class('product__description')}]",
+        f"//*[{_has_class('product-single__description')}]",
+        f"//*[{_has_class('description')}]",
+        f"//*[{_has_class('product-content')}]",
+    ))
+    SKU_XPATHS = tuple(etree.XPath(query) for query in (
+        f"//*[{_has_class('sku')}]",
+        f"//*[{_has_class('product-sku')}]",
+        f"//*[{_has_class('variant-sku')}]",
+        "//*[@data-sku]",
+    ))
+    IMAGE_XPATHS = tuple(etree.XPath(query) for query in (
+        f"//*[{_has_class('product-single__photos')}]//img",
+        f"//*[{_has_class('product__media')}]//img",
+        f"//*[{_has_class('product-images')}]//img",
+        f"//*[{_has_class('product-gallery')}]//img",
+        "//img[contains(@src, 'product')]",
+        "//img[contains(@data-src, 'product')]",
+    ))
+    
+    # data-* image attributes kept in image metadata; others (tracking and
+    # theme attributes) are not useful for downloading images
+    IMAGE_DATA_ATTRIBUTES = ('data-src', 'data-original', 'data-srcset', 'data-zoom')
+    
+    # LawnFawn SKU mentioned anywhere in page content
+    SKU_TEXT_PATTERN = re.compile(r'LF[-]?\d+', re.IGNORECASE)
+    
+    # Image URL keywords of product images and of common non-product images
+    PRODUCT_IMAGE_KEYWORDS = ('product', 'cdn', 'files', 'images')
+    NON_PRODUCT_IMAGE_KEYWORDS = ('logo', 'icon', 'banner', 'footer', 'header', 'nav')
+    
+    # Image types indicated by class names, then by the URL, checked in order
+    IMAGE_CLASS_TYPES = (
+        ('main', ('main', 'primary', 'hero', 'featured')),
+        ('thumbnail', ('thumb', 'small', 'mini', 'preview')),
+        ('gallery', ('gallery', 'additional', 'alternate')),
+        ('detail', ('zoom', 'large', 'detail', 'full')),
+    )
+    IMAGE_URL_TYPES = (
+        ('thumbnail', ('thumb', 'small', '_s.', '_sm.')),
+        ('detail', ('large', 'big', '_l.', '_lg.')),
+        ('main', ('main', 'primary', 'hero')),
+    )
+    
+    # Image format quality by file extension
+    IMAGE_FORMAT_QUALITY = {
+        'jpg': 'good',
+        'jpeg': 'good',
+        'png': 'excellent',
+        'webp': 'excellent',
+        'gif': 'poor'
+    }
+    
+    # Size buckets by the larger image dimension: below 400, below 800, and
+    # from 800 up, as (estimated_size, download_priority)
+    IMAGE_SIZE_THRESHOLDS = (400, 800)
+    IMAGE_SIZE_BUCKETS = (('small', 30), ('medium', 60), ('large', 80))
+    
+    # Image URL keywords that raise or lower download priority
+    HIGH_QUALITY_URL_KEYWORDS = ('hd', 'high', 'quality', '1080', '720')
+    LOW_QUALITY_URL_KEYWORDS = ('low', 'compressed', 'thumb')
+    
+    # Resolution hints in image URLs, each with a literal every match
+    # contains; URLs without it skip the regex
+    RESOLUTION_PATTERNS = (
+        ('x', re.compile(r'(\d+)x(\d+)'), 'explicit_dimensions'),
+        ('_', re.compile(r'_(\d+)w'), 'width_hint'),
+        ('_', re.compile(r'_(\d+)h'), 'height_hint'),
+        ('@', re.compile(r'@(\d+)x'), 'retina_multiplier')
+    )
+    
     def __init__(self, config: Optional[EnrichmentConfig] = None):
         """
         Initialize LawnFawn matcher.
@@ -50,17 +309,23 @@ class LawnFawnMatcher:
             self.base_search_url = f"{config.lawnfawn_base_url}/search"
             self.sku_pattern = config.sku_extraction_pattern
             self.confidence_scores = config.confidence_thresholds
+            self.candidate_hedge_delay_ms = config.candidate_hedge_delay_ms
         else:
-            import os
-            self.base_search_url = f"{os.getenv('LAWNFAWN_BASE_URL', 'https://www.lawnfawn.com')}/search"
-            self.sku_pattern = os.getenv('SKU_EXTRACTION_PATTERN', r'LF[-]?(\d+)')
+            # Application settings are read from the environment once at import
+            settings = get_settings()
+            self.base_search_url = f"{settings.lawnfawn_base_url}/search"
+            self.sku_pattern = settings.sku_extraction_pattern
+            self.candidate_hedge_delay_ms = settings.lawnfawn_candidate_hedge_delay_ms
             self.confidence_scores = {
-                'exact_match': int(os.getenv('CONFIDENCE_EXACT_MATCH', '100')),
-                'first_result_match': int(os.getenv('CONFIDENCE_FIRST_RESULT_MATCH', '90')),
-                'first_result_no_match': int(os.getenv('CONFIDENCE_FIRST_RESULT_NO_MATCH', '60')),
-                'fallback': int(os.getenv('CONFIDENCE_FALLBACK', '30'))
+                'exact_match': settings.confidence_exact_match,
+                'first_result_match': settings.confidence_first_result_match,
+                'first_result_no_match': settings.confidence_first_result_no_match,
+                'fallback': settings.confidence_fallback
             }
         
+        # URL -> (response, parsed result), in LRU order
+        self._parsed_pages: "OrderedDict[str, Tuple[FirecrawlResponse, Any]]" = OrderedDict()
+        
         logger.info(
             "LawnFawn matcher initialized",
             base_search_url=self.base_search_url,
@@ -86,8 +351,7 @@ class LawnFawnMatcher:
             return None
         
         try:
-            match = re.search(self.sku_pattern, supplier_sku.upper())
-            numeric_sku = match.group(1) if match else None
+            numeric_sku = _extract_numeric_sku(self.sku_pattern, supplier_sku)
             
             logger.debug(
                 "SKU extraction",
@@ -156,7 +420,10 @@ class LawnFawnMatcher:
                 )
             
             # Parse search results to extract product links
-            product_links = self.extract_product_links(response.content)
+            product_links = self._get_parsed_page(search_url, response)
+            if product_links is None:
+                product_links = self.extract_product_links(response.content)
+                self._store_parsed_page(search_url, response, product_links)
             
             logger.info(
                 "Search completed",
@@ -169,7 +436,7 @@ class LawnFawnMatcher:
                 search_url=search_url,
                 product_links=product_links,
                 total_results=len(product_links),
-                raw_response=response.raw_data
+                raw_response=response.raw_data or {}
             )
             
         except SearchError:
@@ -185,6 +452,43 @@ class LawnFawnMatcher:
                 search_url=search_url
             )
     
+    def _get_parsed_page(self, url: str, response: FirecrawlResponse) -> Optional[Any]:
+        """
+        Get the parsed result of a page if it was parsed from this response.
+        
+        The Firecrawl client returns the same response object for cached
+        scrapes, so a parsed result stays valid exactly as long as the
+        client's cache entry.
+        
+        Args:
+            url: Scraped page URL
+            response: Firecrawl response for the page
+            
+        Returns:
+            Parsed result, or None if the page has to be parsed
+        """
+        entry = self._parsed_pages.get(url)
+        if entry is None or entry[0] is not response:
+            return None
+        
+        self._parsed_pages.move_to_end(url)
+        return entry[1]
+    
+    def _store_parsed_page(self, url: str, response: FirecrawlResponse, parsed: Any) -> None:
+        """
+        Remember the parsed result of a page response.
+        
+        Args:
+            url: Scraped page URL
+            response: Firecrawl response the result was parsed from
+            parsed: Parsed product links or product data
+        """
+        self._parsed_pages[url] = (response, parsed)
+        self._parsed_pages.move_to_end(url)
+        
+        while len(self._parsed_pages) > PARSED_PAGE_CACHE_MAX_ENTRIES:
+            self._parsed_pages.popitem(last=False)
+    
     def extract_product_links(self, html_content: str) -> List[str]:
         """
         Extract product page links from search results content using context-aware parsing.
@@ -200,78 +504,44 @@ class LawnFawnMatcher:
             List[str]: List of product page URLs from actual search results
         """
         try:
-            product_links = []
-            
             # Step 1: Try HTML parsing first (in case format changes)
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Look for LawnFawn-specific product link selectors
-            lawnfawn_selectors = [
-                'a.js-prod-link',  # Primary LawnFawn product link class
-                'a.media.block.relative',  # Alternative class combination
-                'a[href*="/products/"]',  # Generic product URL selector
-                '.product-item a',  # Fallback selectors
-                '.product-link',
-                '.grid-product__link'
-            ]
-            
-            for selector in lawnfawn_selectors:
-                for link in soup.select(selector):
-                    href = link.get('href')
-                    if href and '/products/' in href:
-                        # Convert relative URLs to absolute
-                        if href.startswith('/'):
-                            href = f"https://www.lawnfawn.com{href}"
-                        elif href.startswith('//'):
-                            href = f"https:{href}"
-                        
-                        # Avoid duplicates
-                        if href not in product_links:
-                            product_links.append(href)
-                            logger.debug(
-                                "Found product link (HTML)",
-                                selector=selector,
-                                href=href,
-                                link_classes=link.get('class', [])
-                            )
-            
-            # Step 2: If no HTML links found, use context-aware regex extraction
-            if not product_links:
-                logger.debug("No HTML links found, trying context-aware regex extraction")
-                
-                # First, find the expected number of search results
-                expected_results = self._extract_results_count(html_content)
-                logger.debug(
-                    "Search results context",
-                    expected_results=expected_results
+            product_links = self._extract_html_product_links(html_content)
+            if product_links:
+                # Markup matched, so none of the regex scans below are needed
+                return product_links
+            
+            # Step 2: No HTML links found, use context-aware regex extraction
+            logger.debug("No HTML links found, trying context-aware regex extraction")
+            
+            # First, find the expected number of search results
+            expected_results = self._extract_results_count(html_content)
+            logger.debug(
+                "Search results context",
+                expected_results=expected_results
+            )
+            
+            # If no results expected, return empty list
+            if expected_results == 0:
+                logger.info("Search returned 0 results")
+                return []
+            
+            # Extract product links from the search results section only,
+            # stopping once the expected number of results is found
+            search_result_links = self._extract_search_result_links(
+                html_content,
+                limit=expected_results
+            )
+            
+            # Validate that we found the expected number of results
+            if expected_results is not None and len(search_result_links) < expected_results:
+                logger.warning(
+                    "Result count mismatch",
+                    expected=expected_results,
+                    found=len(search_result_links),
+                    links=search_result_links
                 )
-                
-                # If no results expected, return empty list
-                if expected_results == 0:
-                    logger.info("Search returned 0 results")
-                    return []
-                
-                # Extract product links from the search results section only
-                search_result_links = self._extract_search_result_links(html_content)
-                
-                # Validate that we found the expected number of results
-                if expected_results is not None and len(search_result_links) != expected_results:
-                    logger.warning(
-                        "Result count mismatch",
-                        expected=expected_results,
-                        found=len(search_result_links),
-                        links=search_result_links
-                    )
-                    
-                    # If we found more than expected, take only the first N
-                    if len(search_result_links) > expected_results:
-                        search_result_links = search_result_links[:expected_results]
-                        logger.debug(
-                            "Trimmed results to expected count",
-                            trimmed_links=search_result_links
-                        )
-                
-                product_links.extend(search_result_links)
+            
+            product_links = search_result_links
             
             # Step 3: Fallback to broad extraction if context-aware method failed
             if not product_links:
@@ -298,6 +568,77 @@ class LawnFawnMatcher:
             )
             return []
     
+    def _extract_html_product_links(self, html_content: str) -> List[str]:
+        """
+        Extract product links from HTML markup in a single streaming pass.
+        
+        Every element is checked against all LINK_SELECTORS when the parser
+        opens it, and subtrees are dropped once closed, so the whole page is
+        never held as a tree. The links of the highest-priority selector that
+        found any are returned.
+        
+        Args:
+            html_content: Content from search page
+            
+        Returns:
+            List[str]: Unique absolute product URLs in document order
+        """
+        if not html_content:
+            return []
+        
+        links_by_selector: List[List[str]] = [[] for _ in self.LINK_SELECTORS]
+        
+        events = etree.iterparse(
+            io.BytesIO(html_content.encode('utf-8')),
+            events=('start', 'end'),
+            html=True,
+            encoding='utf-8'
+        )
+        
+        for event, element in events:
+            if event == 'end':
+                # Ancestors are kept until they close themselves, so the
+                # ancestor check below still sees them
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+                continue
+            
+            href = element.get('href')
+            if href and '/products/' in href:
+                classes = element.get('class', '').split()
+                is_link = element.tag == 'a'
+                
+                # One flag per entry of LINK_SELECTORS
+                matched = (
+                    is_link and 'js-prod-link' in classes,
+                    is_link and 'media' in classes and 'block' in classes and 'relative' in classes,
+                    is_link,
+                    is_link and any(
+                        'product-item' in ancestor.get('class', '').split()
+                        for ancestor in element.iterancestors()
+                    ),
+                    'product-link' in classes,
+                    'grid-product__link' in classes,
+                )
+                
+                url = _absolute_url(href)
+                for links, is_match in zip(links_by_selector, matched):
+                    if is_match:
+                        links.append(url)
+        
+        for selector, links in zip(self.LINK_SELECTORS, links_by_selector):
+            if links:
+                product_links = list(dict.fromkeys(links))
+                logger.debug(
+                    "Found product links (HTML)",
+                    selector=selector,
+                    total_links=len(product_links)
+                )
+                return product_links
+        
+        return []
+    
     def _extract_results_count(self, content: str) -> Optional[int]:
         """
         Extract the expected number of search results from "Show X result(s)" pattern.
@@ -309,20 +650,25 @@ class LawnFawnMatcher:
             Optional[int]: Number of expected results, or None if not found
         """
         try:
-            # Look for "Show X result" or "Show X results" pattern
-            result_patterns = [
-                r'Show (\d+) results?',
-                r'(\d+) results? found',
-                r'(\d+) products? found',
-            ]
-            
-            for pattern in result_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
+            # Candidate positions are found with plain substring searches on a
+            # lowercased copy and only confirmed with an anchored regex match,
+            # instead of running each case-insensitive pattern over the page.
+            # Lowercasing can change the length of some non-ASCII text, in
+            # which case positions would not line up and full searches are used.
+            lowered = content.lower()
+            aligned = len(lowered) == len(content)
+            
+            for needle, pattern, count_first in self.RESULT_COUNT_PATTERNS:
+                if aligned:
+                    match = self._match_at_needle(content, lowered, needle, pattern, count_first)
+                else:
+                    match = pattern.search(content)
+                
                 if match:
                     count = int(match.group(1))
                     logger.debug(
                         "Found results count",
-                        pattern=pattern,
+                        pattern=pattern.pattern,
                         count=count
                     )
                     return count
@@ -333,7 +679,44 @@ class LawnFawnMatcher:
             logger.error("Error extracting results count", error=str(e))
             return None
     
-    def _extract_search_result_links(self, content: str) -> List[str]:
+    @staticmethod
+    def _match_at_needle(
+        content: str,
+        lowered: str,
+        needle: str,
+        pattern: re.Pattern,
+        count_first: bool
+    ) -> Optional[re.Match]:
+        """
+        Find the leftmost pattern match by anchoring it at occurrences of a literal.
+        
+        Args:
+            content: Page content
+            lowered: Lowercased content with the same length as ``content``
+            needle: Lowercase literal contained in every match
+            pattern: Pattern to confirm at each occurrence
+            count_first: Whether the match starts with digits before the literal
+            
+        Returns:
+            Optional[re.Match]: First match, or None if the pattern does not occur
+        """
+        position = lowered.find(needle)
+        while position >= 0:
+            start = position
+            if count_first:
+                # Walk back over the count digits to where the match begins
+                while start > 0 and lowered[start - 1].isdecimal():
+                    start -= 1
+            
+            match = pattern.match(content, start)
+            if match:
+                return match
+            
+            position = lowered.find(needle, position + 1)
+        
+        return None
+    
+    def _extract_search_result_links(self, content: str, limit: Optional[int] = None) -> List[str]:
         """
         Extract product links specifically from the search results section.
         
@@ -342,23 +725,23 @@ class LawnFawnMatcher:
         
         Args:
             content: Page content
+            limit: Stop after this many links (no limit if None)
             
         Returns:
             List[str]: Product URLs from search results section
         """
         try:
-            product_links = []
-            
             # Find the search results section boundaries
             # Start: after "Show X result(s)"
             # End: before next major section or end of content
             
-            # Pattern to find search results section
-            results_section_pattern = r'Show \d+ results?.*?(?=(?:Filter|Sort|Product type|\Z))'
-            results_section_match = re.search(results_section_pattern, content, re.IGNORECASE | re.DOTALL)
+            results_section_match = self.RESULTS_SECTION_START_PATTERN.search(content)
             
             if results_section_match:
-                results_section = results_section_match.group(0)
+                section_end = self.RESULTS_SECTION_END_PATTERN.search(content, results_section_match.end())
+                results_section = content[
+                    results_section_match.start():section_end.start() if section_end else len(content)
+                ]
                 logger.debug(
                     "Found search results section",
                     section_length=len(results_section),
@@ -370,51 +753,7 @@ class LawnFawnMatcher:
                 logger.debug("No clear results section found, using full content")
             
             # Extract product links from the results section
-            # Look for markdown link patterns: [product name](url)
-            link_patterns = [
-                # Markdown link with product URL
-                r'\[([^\]]+)\]\((https://www\.lawnfawn\.com/products/[^)]+)\)',
-                # Direct product URLs
-                r'(https://www\.lawnfawn\.com/products/[^\s\)]+)',
-                # Relative product URLs
-                r'\((/products/[^)]+)\)',
-            ]
-            
-            for pattern in link_patterns:
-                matches = re.findall(pattern, results_section, re.IGNORECASE)
-                
-                for match in matches:
-                    # Handle tuple results from regex groups
-                    if isinstance(match, tuple):
-                        # Find the URL part (usually the second element)
-                        url = None
-                        for part in match:
-                            if '/products/' in part:
-                                url = part
-                                break
-                    else:
-                        url = match
-                    
-                    if url:
-                        # Clean up and normalize URL
-                        url = url.strip('()')
-                        
-                        # Convert relative URLs to absolute
-                        if url.startswith('/'):
-                            url = f"https://www.lawnfawn.com{url}"
-                        elif url.startswith('//'):
-                            url = f"https:{url}"
-                        
-                        # Avoid duplicates and ensure it's a product URL
-                        if url not in product_links and '/products/' in url:
-                            product_links.append(url)
-                            logger.debug(
-                                "Found search result link",
-                                pattern=pattern,
-                                url=url
-                            )
-            
-            return product_links
+            return self._find_product_links(self.SEARCH_RESULT_LINK_PATTERN, results_section, limit)
             
         except Exception as e:
             logger.error("Error extracting search result links", error=str(e))
@@ -431,59 +770,51 @@ class LawnFawnMatcher:
             List[str]: Product URLs found with broad patterns
         """
         try:
-            product_links = []
-            
-            # Broad regex patterns (original approach)
-            url_patterns = [
-                # Markdown link format: [text](url)
-                r'\[([^\]]*)\]\((https://www\.lawnfawn\.com/[^)]*products/[^)]*)\)',
-                # Direct URL mentions
-                r'(https://www\.lawnfawn\.com/[^\s]*products/[^\s]*)',
-                # Relative URLs that start with /products/
-                r'(\(/products/[^)]*\))',
-                r'(/products/[^\s\)]*)',
-            ]
-            
-            for pattern in url_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                
-                for match in matches:
-                    # Handle tuple results from regex groups
-                    if isinstance(match, tuple):
-                        # For patterns with groups, find the URL part
-                        url = None
-                        for part in match:
-                            if '/products/' in part:
-                                url = part
-                                break
-                    else:
-                        url = match
-                    
-                    if url:
-                        # Clean up the URL
-                        url = url.strip('()')
-                        
-                        # Convert relative URLs to absolute
-                        if url.startswith('/'):
-                            url = f"https://www.lawnfawn.com{url}"
-                        elif url.startswith('//'):
-                            url = f"https:{url}"
-                        
-                        # Avoid duplicates
-                        if url not in product_links and '/products/' in url:
-                            product_links.append(url)
-                            logger.debug(
-                                "Found product link (broad pattern)",
-                                pattern=pattern,
-                                url=url
-                            )
-            
-            return product_links
+            return self._find_product_links(self.BROAD_URL_PATTERN, content)
             
         except Exception as e:
             logger.error("Error with broad pattern extraction", error=str(e))
             return []
     
+    def _find_product_links(
+        self,
+        pattern: re.Pattern,
+        content: str,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Collect unique product URLs matched by a link pattern in one pass.
+        
+        Args:
+            pattern: Link pattern capturing each URL in a named group
+            content: Content to search
+            limit: Stop scanning after this many links (no limit if None)
+            
+        Returns:
+            List[str]: Absolute product URLs in order of appearance
+        """
+        product_links = []
+        seen_links = set()
+        
+        for match in pattern.finditer(content):
+            # Clean up the URL
+            url = match.group(match.lastgroup).strip('()')
+            
+            # Convert relative URLs to absolute
+            url = _absolute_url(url)
+            
+            # Avoid duplicates and ensure it's a product URL
+            if url not in seen_links and '/products/' in url:
+                seen_links.add(url)
+                product_links.append(url)
+                if limit is not None and len(product_links) >= limit:
+                    break
+        
+        # Logged once per page rather than once per link
+        logger.debug("Found product links", total_links=len(product_links))
+        
+        return product_links
+    
     def _construct_urls_from_content(self, content: str) -> List[str]:
         """
         Final fallback: construct URLs based on product names found in content.
@@ -495,32 +826,20 @@ class LawnFawnMatcher:
             List[str]: Constructed product URLs
         """
         try:
-            product_links = []
             content_lower = content.lower()
             
-            # Common product name patterns that might appear in content
-            product_indicators = [
-                'stitched rectangle frames',
-                'rectangle frames',
-                'stitched frames'
-            ]
-            
-            for indicator in product_indicators:
+            # Only the first indicator found is used, so at most one URL is
+            # constructed and no dedup is needed
+            for indicator, constructed_url in self.PRODUCT_NAME_URLS:
                 if indicator in content_lower:
-                    # Construct likely URL based on product name
-                    url_slug = indicator.replace(' ', '-')
-                    constructed_url = f"https://www.lawnfawn.com/products/{url_slug}"
-                    
-                    if constructed_url not in product_links:
-                        product_links.append(constructed_url)
-                        logger.debug(
-                            "Constructed product URL from content",
-                            indicator=indicator,
-                            url=constructed_url
-                        )
-                    break
+                    logger.debug(
+                        "Constructed product URL from content",
+                        indicator=indicator,
+                        url=constructed_url
+                    )
+                    return [constructed_url]
             
-            return product_links
+            return []
             
         except Exception as e:
             logger.error("Error constructing URLs from content", error=str(e))
@@ -552,7 +871,12 @@ class LawnFawnMatcher:
                 )
             
             # Parse product page content
-            product_data = self.extract_product_data(response.content, product_url)
+            parsed_data = self._get_parsed_page(product_url, response)
+            if parsed_data is None:
+                parsed_data = self.extract_product_data(response.content, product_url)
+                self._store_parsed_page(product_url, response, parsed_data)
+            
+            product_data = parsed_data.model_copy()
             product_data.raw_response = response.raw_data
             
             logger.info(
@@ -578,6 +902,97 @@ class LawnFawnMatcher:
                 product_url=product_url
             )
     
+    async def scrape_product_pages(self, product_urls: List[str]) -> List[Optional[ProductData]]:
+        """
+        Scrape several product pages with a single batch request.
+        
+        Parsed pages are kept in the parsed-page cache, so later calls to
+        ``scrape_product_page`` for the same URLs reuse them.
+        
+        Args:
+            product_urls: Product page URLs
+            
+        Returns:
+            List[Optional[ProductData]]: Extracted product information in the
+                same order as ``product_urls``, or None for pages that failed
+        """
+        responses = await self.firecrawl_client.batch_scrape(product_urls)
+        
+        products: List[Optional[ProductData]] = []
+        for product_url, response in zip(product_urls, responses):
+            if not response.success:
+                logger.warning(
+                    "Product page scrape failed in batch",
+                    product_url=product_url,
+                    error=response.error_message
+                )
+                products.append(None)
+                continue
+            
+            try:
+                parsed_data = self._get_parsed_page(product_url, response)
+                if parsed_data is None:
+                    parsed_data = self.extract_product_data(response.content, product_url)
+                    self._store_parsed_page(product_url, response, parsed_data)
+            except Exception as e:
+                logger.error(
+                    "Unexpected error parsing product page",
+                    product_url=product_url,
+                    error=str(e)
+                )
+                products.append(None)
+                continue
+            
+            product_data = parsed_data.model_copy()
+            product_data.raw_response = response.raw_data
+            products.append(product_data)
+        
+        return products
+    
+    async def prefetch_products(self, products: List[Product]) -> None:
+        """
+        Warm the scrape caches for a batch of products ahead of matching.
+        
+        Search pages for all SKUs are fetched in one batch request, then the
+        top search result of each is fetched in a second one. ``match_product``
+        then serves these pages from cache and only scrapes fallback results
+        individually.
+        
+        Args:
+            products: Products about to be matched
+        """
+        search_urls: List[str] = []
+        for product in products:
+            numeric_sku = self.extract_numeric_sku(product.supplier_sku)
+            if numeric_sku:
+                search_urls.append(self.build_search_url(numeric_sku))
+        
+        search_urls = list(dict.fromkeys(search_urls))
+        if len(search_urls) < 2:
+            return
+        
+        await self.firecrawl_client.batch_scrape(search_urls)
+        
+        product_urls: List[str] = []
+        for search_url in search_urls:
+            try:
+                search_results = await self.search_products(search_url)
+            except SearchError:
+                continue
+            if search_results.product_links:
+                product_urls.append(search_results.product_links[0])
+        
+        product_urls = list(dict.fromkeys(product_urls))
+        if product_urls:
+            await self.scrape_product_pages(product_urls)
+        
+        logger.info(
+            "Prefetched product pages",
+            total_products=len(products),
+            search_pages=len(search_urls),
+            product_pages=len(product_urls)
+        )
+    
     def extract_product_data(self, html_content: str, product_url: str) -> ProductData:
         """
         Extract product data from product page content.
@@ -593,29 +1008,18 @@ class LawnFawnMatcher:
             ProductData: Extracted product information
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Parse once; each field is then looked up with precompiled XPath
+            # queries that run in lxml's C code
+            root = _parse_html(html_content)
             
             # Extract product name (try HTML selectors first)
-            name_selectors = [
-                'h1.product-title',
-                'h1.product__title',
-                '.product-single__title',
-                'h1',
-                '.product-name'
-            ]
-            
             product_name = "Unknown Product"
-            for selector in name_selectors:
-                name_element = soup.select_one(selector)
-                if name_element:
-                    product_name = name_element.get_text(strip=True)
-                    break
+            name_element = self._first_match(root, self.NAME_XPATHS)
+            if name_element is not None:
+                product_name = _element_text(name_element)
             
             # If no HTML name found, try extracting from text content
             if product_name == "Unknown Product":
-                # Look for product name patterns in text content
-                content_lines = html_content.split('\n')
-                
                 # Try to find the product name from URL slug
                 url_parts = product_url.split('/')
                 if 'products' in url_parts:
@@ -632,24 +1036,19 @@ class LawnFawnMatcher:
                 
                 # Try to find product name in content patterns
                 if product_name == "Unknown Product":
-                    # Look for title patterns in content
-                    title_patterns = [
-                        r'^# (.+)$',  # Markdown h1
-                        r'^\*\*(.+)\*\*$',  # Bold text
-                        r'^(.+) – Lawn Fawn$',  # Common title format
-                    ]
-                    
-                    for line in content_lines[:10]:  # Check first 10 lines
+                    # Look for title patterns in the first 10 lines; a bounded
+                    # split avoids splitting the whole page to read its head
+                    for line in html_content.split('\n', 10)[:10]:
                         line = line.strip()
-                        for pattern in title_patterns:
-                            match = re.match(pattern, line)
+                        for pattern in self.TITLE_PATTERNS:
+                            match = pattern.match(line)
                             if match:
                                 potential_name = match.group(1).strip()
                                 if len(potential_name) > 3 and not potential_name.lower().startswith(('skip', 'quick', 'post')):
                                     product_name = potential_name
                                     logger.debug(
                                         "Extracted product name from content pattern",
-                                        pattern=pattern,
+                                        pattern=pattern.pattern,
                                         product_name=product_name
                                     )
                                     break
@@ -657,42 +1056,22 @@ class LawnFawnMatcher:
                             break
             
             # Extract description (try multiple selectors)
-            desc_selectors = [
-                '.product-description',
-                '.product__description',
-                '.product-single__description',
-                '.description',
-                '.product-content'
-            ]
-            
             description = ""
-            for selector in desc_selectors:
-                desc_element = soup.select_one(selector)
-                if desc_element:
-                    description = desc_element.get_text(strip=True)
-                    break
+            desc_element = self._first_match(root, self.DESCRIPTION_XPATHS)
+            if desc_element is not None:
+                description = _element_text(desc_element)
             
             # Extract SKU for validation (try multiple approaches)
             found_sku = ""
             
             # Look for SKU in specific elements
-            sku_selectors = [
-                '.sku',
-                '.product-sku',
-                '.variant-sku',
-                '[data-sku]'
-            ]
-            
-            for selector in sku_selectors:
-                sku_element = soup.select_one(selector)
-                if sku_element:
-                    found_sku = sku_element.get_text(strip=True)
-                    break
+            sku_element = self._first_match(root, self.SKU_XPATHS)
+            if sku_element is not None:
+                found_sku = _element_text(sku_element)
             
             # If no SKU found in elements, search in text content
             if not found_sku:
-                sku_pattern = re.compile(r'LF[-]?\d+', re.IGNORECASE)
-                sku_match = sku_pattern.search(html_content)
+                sku_match = self.SKU_TEXT_PATTERN.search(html_content)
                 if sku_match:
                     found_sku = sku_match.group(0)
             
@@ -700,46 +1079,47 @@ class LawnFawnMatcher:
             image_urls = []
             image_metadata = []
             
-            # Look for product images
-            img_selectors = [
-                '.product-single__photos img',
-                '.product__media img',
-                '.product-images img',
-                '.product-gallery img',
-                'img[src*="product"]',
-                'img[data-src*="product"]'
-            ]
-            
+            # Look for product images (empty content has no tree to query)
             processed_urls = set()
+            image_xpaths = self.IMAGE_XPATHS if root is not None else ()
             
-            for selector in img_selectors:
-                for img in soup.select(selector):
+            for image_xpath in image_xpaths:
+                for img in image_xpath(root):
                     src = img.get('src') or img.get('data-src') or img.get('data-original')
                     
                     if src and self._is_product_image(src):
                         # Convert relative URLs to absolute
-                        if src.startswith('/'):
-                            src = f"https://www.lawnfawn.com{src}"
-                        elif src.startswith('//'):
-                            src = f"https:{src}"
+                        src = _absolute_url(src)
                         
                         if src not in processed_urls:
                             processed_urls.add(src)
                             image_urls.append(src)
                             
+                            # Read each attribute once and share it with the
+                            # type and quality assessments
+                            attrib = img.attrib
+                            class_attr = attrib.get('class', '')
+                            width = attrib.get('width')
+                            height = attrib.get('height')
+                            src_lower = src.lower()
+                            
                             # Collect metadata for future image download task
                             metadata = {
                                 'url': src,
-                                'alt_text': img.get('alt', ''),
-                                'title': img.get('title', ''),
-                                'width': img.get('width'),
-                                'height': img.get('height'),
-                                'class': img.get('class', []),
-                                'data_attributes': {k: v for k, v in img.attrs.items() if k.startswith('data-')},
-                                'estimated_type': self._estimate_image_type(img, src),
-                                'quality_indicators': self._assess_image_quality_indicators(img, src)
+                                'alt_text': attrib.get('alt', ''),
+                                'title': attrib.get('title', ''),
+                                'width': width,
+                                'height': height,
+                                'class': class_attr.split(),
+                                'data_attributes': {key: attrib[key] for key in self.IMAGE_DATA_ATTRIBUTES if key in attrib},
+                                'estimated_type': self._estimate_image_type(class_attr.lower(), src_lower),
+                                'quality_indicators': self._assess_image_quality_indicators(width, height, src_lower)
                             }
                             image_metadata.append(metadata)
+                
+                # The first selector that finds product images wins
+                if image_urls:
+                    break
             
             logger.debug(
                 "Extracted product data",
@@ -774,71 +1154,79 @@ class LawnFawnMatcher:
                 image_metadata=[]
             )
     
-    def _is_product_image(self, src: str) -> bool:
-        """Check if URL appears to be a product image."""
-        src_lower = src.lower()
+    @staticmethod
+    def _first_match(root: Optional[Any], queries: Tuple[Any, ...]) -> Optional[Any]:
+        """
+        Return the first element matched by the highest-priority query that matches.
         
-        # Include images that contain product-related keywords
-        product_indicators = ['product', 'cdn', 'files', 'images']
+        Args:
+            root: Parsed page root, or None for empty content
+            queries: Compiled XPath queries in priority order
+            
+        Returns:
+            Optional[Any]: First matching element, or None
+        """
+        if root is None:
+            return None
         
-        # Exclude common non-product images
-        exclude_indicators = ['logo', 'icon', 'banner', 'footer', 'header', 'nav']
+        for query in queries:
+            elements = query(root)
+            if elements:
+                return elements[0]
         
-        has_product_indicator = any(indicator in src_lower for indicator in product_indicators)
-        has_exclude_indicator = any(indicator in src_lower for indicator in exclude_indicators)
+        return None
+    
+    def _is_product_image(self, src: str) -> bool:
+        """Check if URL appears to be a product image."""
+        src_lower = src.lower()
         
-        return has_product_indicator and not has_exclude_indicator
+        # Include images that contain product-related keywords, excluding
+        # common non-product images. map() runs each keyword scan in C
+        # without a Python frame per keyword.
+        return (
+            any(map(src_lower.__contains__, self.PRODUCT_IMAGE_KEYWORDS))
+            and not any(map(src_lower.__contains__, self.NON_PRODUCT_IMAGE_KEYWORDS))
+        )
     
-    def _estimate_image_type(self, img_element, src_url: str) -> str:
+    def _estimate_image_type(self, class_lower: str, url_lower: str) -> str:
         """
-        Estimate image type based on element attributes and URL.
+        Estimate image type based on element classes and URL.
         
         Args:
-            img_element: BeautifulSoup img element
-            src_url: Image source URL
+            class_lower: Lowercased class attribute of the img element; the
+                indicators contain no whitespace, so it needs no normalizing
+            url_lower: Lowercased image source URL
             
         Returns:
             str: Estimated image type (main, thumbnail, detail, gallery, etc.)
         """
-        # Check class names for type indicators
-        classes = img_element.get('class', [])
-        class_str = ' '.join(classes).lower()
-        
-        # Check for main product image indicators
-        if any(indicator in class_str for indicator in ['main', 'primary', 'hero', 'featured']):
-            return 'main'
-        
-        # Check for thumbnail indicators
-        if any(indicator in class_str for indicator in ['thumb', 'small', 'mini', 'preview']):
-            return 'thumbnail'
-        
-        # Check for gallery indicators
-        if any(indicator in class_str for indicator in ['gallery', 'additional', 'alternate']):
-            return 'gallery'
-        
-        # Check for detail/zoom indicators
-        if any(indicator in class_str for indicator in ['zoom', 'large', 'detail', 'full']):
-            return 'detail'
+        # Check class names for type indicators (most images have none)
+        if class_lower:
+            for image_type, indicators in self.IMAGE_CLASS_TYPES:
+                if any(map(class_lower.__contains__, indicators)):
+                    return image_type
         
         # Check URL patterns
-        url_lower = src_url.lower()
-        if any(pattern in url_lower for pattern in ['thumb', 'small', '_s.', '_sm.']):
-            return 'thumbnail'
-        elif any(pattern in url_lower for pattern in ['large', 'big', '_l.', '_lg.']):
-            return 'detail'
-        elif any(pattern in url_lower for pattern in ['main', 'primary', 'hero']):
-            return 'main'
+        for image_type, patterns in self.IMAGE_URL_TYPES:
+            if any(map(url_lower.__contains__, patterns)):
+                return image_type
         
         # Default to gallery if no specific type detected
         return 'gallery'
     
-    def _assess_image_quality_indicators(self, img_element, src_url: str) -> Dict[str, Any]:
+    def _assess_image_quality_indicators(
+        self,
+        width: Optional[str],
+        height: Optional[str],
+        url_lower: str
+    ) -> Dict[str, Any]:
         """
         Assess image quality indicators for future download prioritization.
         
         Args:
-            img_element: BeautifulSoup img element
-            src_url: Image source URL
+            width: Width attribute of the img element
+            height: Height attribute of the img element
+            url_lower: Lowercased image source URL
             
         Returns:
             Dict[str, Any]: Quality indicators and metadata
@@ -852,48 +1240,28 @@ class LawnFawnMatcher:
         }
         
         # Check for dimension attributes
-        width = img_element.get('width')
-        height = img_element.get('height')
-        
         if width and height:
             quality_indicators['has_dimensions'] = True
             try:
-                w, h = int(width), int(height)
-                if w >= 800 or h >= 800:
-                    quality_indicators['estimated_size'] = 'large'
-                    quality_indicators['download_priority'] = 80
-                elif w >= 400 or h >= 400:
-                    quality_indicators['estimated_size'] = 'medium'
-                    quality_indicators['download_priority'] = 60
-                else:
-                    quality_indicators['estimated_size'] = 'small'
-                    quality_indicators['download_priority'] = 30
+                largest = max(int(width), int(height))
+                estimated_size, priority = self.IMAGE_SIZE_BUCKETS[
+                    bisect_right(self.IMAGE_SIZE_THRESHOLDS, largest)
+                ]
+                quality_indicators['estimated_size'] = estimated_size
+                quality_indicators['download_priority'] = priority
             except ValueError:
                 pass
         
-        # Analyze URL for quality hints
-        url_lower = src_url.lower()
-        
-        # Format quality assessment
-        if url_lower.endswith('.jpg') or url_lower.endswith('.jpeg'):
-            quality_indicators['format_quality'] = 'good'
-        elif url_lower.endswith('.png'):
-            quality_indicators['format_quality'] = 'excellent'
-        elif url_lower.endswith('.webp'):
-            quality_indicators['format_quality'] = 'excellent'
-        elif url_lower.endswith('.gif'):
-            quality_indicators['format_quality'] = 'poor'
+        # Format quality assessment from the path's extension; image CDNs
+        # append version query strings such as ?v=123
+        extension = url_lower.split('?', 1)[0].rsplit('.', 1)[-1]
+        quality_indicators['format_quality'] = self.IMAGE_FORMAT_QUALITY.get(extension, 'unknown')
         
         # Resolution hints from URL
-        resolution_patterns = [
-            (r'(\d+)x(\d+)', 'explicit_dimensions'),
-            (r'_(\d+)w', 'width_hint'),
-            (r'_(\d+)h', 'height_hint'),
-            (r'@(\d+)x', 'retina_multiplier')
-        ]
-        
-        for pattern, hint_type in resolution_patterns:
-            matches = re.findall(pattern, url_lower)
+        for needle, pattern, hint_type in self.RESOLUTION_PATTERNS:
+            if needle not in url_lower:
+                continue
+            matches = pattern.findall(url_lower)
             if matches:
                 quality_indicators['resolution_hints'].append({
                     'type': hint_type,
@@ -901,9 +1269,9 @@ class LawnFawnMatcher:
                 })
         
         # Adjust priority based on URL quality indicators
-        if any(indicator in url_lower for indicator in ['hd', 'high', 'quality', '1080', '720']):
+        if any(map(url_lower.__contains__, self.HIGH_QUALITY_URL_KEYWORDS)):
             quality_indicators['download_priority'] += 20
-        elif any(indicator in url_lower for indicator in ['low', 'compressed', 'thumb']):
+        elif any(map(url_lower.__contains__, self.LOW_QUALITY_URL_KEYWORDS)):
             quality_indicators['download_priority'] -= 20
         
         # Ensure priority stays within bounds
@@ -935,44 +1303,28 @@ class LawnFawnMatcher:
             original_numeric = self.extract_numeric_sku(original_sku)
             found_numeric = self.extract_numeric_sku(found_sku) if found_sku else None
             
-            # Exact SKU match
             if original_numeric and found_numeric and original_numeric == found_numeric:
-                logger.debug(
-                    "Exact SKU match",
-                    original_sku=original_sku,
-                    found_sku=found_sku,
-                    confidence=self.confidence_scores['exact_match']
-                )
-                return self.confidence_scores['exact_match']
-            
-            # First result with SKU match (but not exact)
-            if search_results_count > 0 and found_numeric:
-                logger.debug(
-                    "First result with SKU",
-                    original_sku=original_sku,
-                    found_sku=found_sku,
-                    confidence=self.confidence_scores['first_result_match']
-                )
-                return self.confidence_scores['first_result_match']
+                # Exact SKU match
+                reason, score_key = "Exact SKU match", 'exact_match'
+            elif search_results_count > 0 and found_numeric:
+                # First result with SKU match (but not exact)
+                reason, score_key = "First result with SKU", 'first_result_match'
+            elif search_results_count > 0:
+                # First result without SKU match
+                reason, score_key = "First result without SKU match", 'first_result_no_match'
+            else:
+                # Fallback methods
+                reason, score_key = "Fallback confidence score", 'fallback'
             
-            # First result without SKU match
-            if search_results_count > 0:
-                logger.debug(
-                    "First result without SKU match",
-                    original_sku=original_sku,
-                    found_sku=found_sku,
-                    confidence=self.confidence_scores['first_result_no_match']
-                )
-                return self.confidence_scores['first_result_no_match']
+            confidence = self.confidence_scores[score_key]
             
-            # Fallback methods
             logger.debug(
-                "Fallback confidence score",
+                reason,
                 original_sku=original_sku,
                 found_sku=found_sku,
-                confidence=self.confidence_scores['fallback']
+                confidence=confidence
             )
-            return self.confidence_scores['fallback']
+            return confidence
             
         except Exception as e:
             logger.error(
@@ -983,6 +1335,90 @@ class LawnFawnMatcher:
             )
             return self.confidence_scores['fallback']
     
+    async def _scrape_ranked_candidates(
+        self,
+        candidate_urls: List[str],
+        total_links: int
+    ) -> Tuple[ProductData, str]:
+        """
+        Scrape search result candidates and return the highest-ranked success.
+        
+        Candidates are scraped in rank order, but a candidate still pending
+        after the hedge delay gets the next one scraped alongside it. A slow or
+        failing first result then does not delay the fallbacks by its full
+        timeout, while fast first results cost no extra scrapes. A lower-ranked
+        page is only used once every higher-ranked one has failed.
+        
+        Args:
+            candidate_urls: Product URLs in search result order
+            total_links: Number of product links the search returned
+            
+        Returns:
+            Tuple[ProductData, str]: Scraped product data and its URL
+            
+        Raises:
+            ScrapingError: If every candidate fails (the last candidate's error)
+        """
+        hedge_delay = self.candidate_hedge_delay_ms / 1000
+        tasks: List[asyncio.Task] = []
+        
+        def start_next() -> None:
+            attempt = len(tasks) + 1
+            logger.info(
+                "Attempting to scrape product URL",
+                url=candidate_urls[attempt - 1],
+                attempt=attempt,
+                total_links=total_links
+            )
+            tasks.append(asyncio.create_task(self.scrape_product_page(candidate_urls[attempt - 1])))
+        
+        start_next()
+        try:
+            for i, product_url in enumerate(candidate_urls):
+                task = tasks[i]
+                while not task.done() and len(tasks) < len(candidate_urls):
+                    await asyncio.wait({task}, timeout=hedge_delay)
+                    if not task.done():
+                        start_next()
+                
+                try:
+                    product_data = await task
+                except ScrapingError as e:
+                    logger.warning(
+                        "Failed to scrape product URL, trying next",
+                        url=product_url,
+                        attempt=i+1,
+                        error=str(e)
+                    )
+                    
+                    # If this was the last URL, re-raise the error
+                    if i == len(candidate_urls) - 1:
+                        raise
+                    if len(tasks) == i + 1:
+                        start_next()
+                    continue
+                
+                logger.info(
+                    "Successfully scraped product page",
+                    url=product_url,
+                    product_name=product_data.name,
+                    attempt=i+1
+                )
+                return product_data, product_url
+        finally:
+            # Stop lower-ranked scrapes that are no longer needed, and consume
+            # errors of hedged scrapes that were never awaited
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+        
+        raise ScrapingError(
+            f"Failed to scrape any of {len(candidate_urls)} product pages",
+            product_url=candidate_urls[0] if candidate_urls else None
+        )
+    
     async def match_product(self, product: Product) -> EnrichmentData:
         """
         Match LawnFawn product using SKU-based search strategy.
@@ -1028,42 +1464,11 @@ class LawnFawnMatcher:
                     sku=numeric_sku
                 )
             
-            # Try first result with fallback logic
-            product_data = None
-            successful_url = None
-            
-            for i, product_url in enumerate(search_results.product_links[:3]):  # Try up to 3 results
-                try:
-                    logger.info(
-                        "Attempting to scrape product URL",
-                        url=product_url,
-                        attempt=i+1,
-                        total_links=len(search_results.product_links)
-                    )
-                    
-                    product_data = await self.scrape_product_page(product_url)
-                    successful_url = product_url
-                    
-                    logger.info(
-                        "Successfully scraped product page",
-                        url=product_url,
-                        product_name=product_data.name,
-                        attempt=i+1
-                    )
-                    break
-                    
-                except ScrapingError as e:
-                    logger.warning(
-                        "Failed to scrape product URL, trying next",
-                        url=product_url,
-                        attempt=i+1,
-                        error=str(e)
-                    )
-                    
-                    # If this was the last URL, re-raise the error
-                    if i == len(search_results.product_links[:3]) - 1:
-                        raise
-                    continue
+            # Try up to 3 results, preferring the highest-ranked one that scrapes
+            product_data, successful_url = await self._scrape_ranked_candidates(
+                search_results.product_links[:3],
+                total_links=len(search_results.product_links)
+            )
             
             if not product_data or not successful_url:
                 raise ScrapingError(
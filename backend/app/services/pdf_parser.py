@@ -2,14 +2,15 @@
 PDF parsing service for invoice processing.
 
 This module provides PDF text and table extraction using pdfplumber
-with proper temporary file handling and error management.
+with in-memory file handling and error management.
 """
 
-import os
-import tempfile
+import io
+import threading
 import structlog
 import pdfplumber
-from typing import List, Tuple, Optional, Dict, Any
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Tuple, Optional, Dict, Any
 from app.models.invoice import PDFParsingError
 from app.core.config import get_settings
 
@@ -20,13 +21,16 @@ class PDFParserService:
     """
     Service for parsing PDF invoices to extract text and table data.
     
-    Uses pdfplumber for robust PDF processing with automatic cleanup
-    of temporary files and comprehensive error handling.
+    Uses pdfplumber for robust PDF processing, reading the uploaded bytes
+    in memory without temporary files, and comprehensive error handling.
     """
     
     def __init__(self):
         """Initialize PDF parser service."""
         self.settings = get_settings()
+        # Per-thread slot holding the last opened document with its bytes,
+        # so validation and extraction of one upload parse its layout once
+        self._open_documents = threading.local()
     
     def extract_text_and_tables(self, file_data: bytes) -> Tuple[str, List[List[List[str]]]]:
         """
@@ -41,23 +45,13 @@ class PDFParserService:
         Raises:
             PDFParsingError: If PDF parsing fails
         """
-        temp_file_path = None
-        
         try:
-            # Create temporary file for pdfplumber (requires file path)
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(file_data)
-                tmp_file.flush()
-                temp_file_path = tmp_file.name
+            logger.info("Starting PDF parsing", file_size=len(file_data))
             
-            logger.info(
-                "Starting PDF parsing",
-                file_size=len(file_data),
-                temp_file=temp_file_path
-            )
-            
-            # Extract content using pdfplumber
-            full_text, all_tables = self._parse_pdf_file(temp_file_path)
+            # Extract content using pdfplumber; BytesIO shares the buffer
+            with self._open_pdf(file_data, keep_open=False) as pdf:
+                full_text, all_tables = self._parse_document(pdf)
+            full_text = full_text.strip()
             
             logger.info(
                 "PDF parsing completed",
@@ -70,15 +64,6 @@ class PDFParserService:
         except Exception as e:
             logger.error("PDF parsing failed", error=str(e))
             raise PDFParsingError(f"Failed to parse PDF: {e}", original_error=e)
-        
-        finally:
-            # Always cleanup temporary file
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                    logger.debug("Temporary file cleaned up", temp_file=temp_file_path)
-                except Exception as e:
-                    logger.warning("Failed to cleanup temp file", error=str(e))
     
     def extract_text_only(self, file_data: bytes) -> str:
         """
@@ -93,19 +78,13 @@ class PDFParserService:
         Raises:
             PDFParsingError: If PDF parsing fails
         """
-        temp_file_path = None
-        
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(file_data)
-                tmp_file.flush()
-                temp_file_path = tmp_file.name
-            
             logger.info("Extracting text from PDF", file_size=len(file_data))
             
             # Extract only text
-            full_text = self._extract_text_from_file(temp_file_path)
+            with self._open_pdf(file_data) as pdf:
+                full_text, _ = self._parse_document(pdf, want_tables=False)
+            full_text = full_text.strip()
             
             logger.info("Text extraction completed", text_length=len(full_text))
             
@@ -114,14 +93,6 @@ class PDFParserService:
         except Exception as e:
             logger.error("Text extraction failed", error=str(e))
             raise PDFParsingError(f"Failed to extract text: {e}", original_error=e)
-        
-        finally:
-            # Cleanup temporary file
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                except Exception as e:
-                    logger.warning("Failed to cleanup temp file", error=str(e))
     
     def extract_tables_only(self, file_data: bytes) -> List[List[List[str]]]:
         """
@@ -136,19 +107,12 @@ class PDFParserService:
         Raises:
             PDFParsingError: If PDF parsing fails
         """
-        temp_file_path = None
-        
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(file_data)
-                tmp_file.flush()
-                temp_file_path = tmp_file.name
-            
             logger.info("Extracting tables from PDF", file_size=len(file_data))
             
             # Extract only tables
-            all_tables = self._extract_tables_from_file(temp_file_path)
+            with self._open_pdf(file_data) as pdf:
+                _, all_tables = self._parse_document(pdf, want_text=False)
             
             logger.info("Table extraction completed", tables_found=len(all_tables))
             
@@ -157,14 +121,51 @@ class PDFParserService:
         except Exception as e:
             logger.error("Table extraction failed", error=str(e))
             raise PDFParsingError(f"Failed to extract tables: {e}", original_error=e)
+    
+    def extract_pages(self, file_data: bytes, page_numbers: List[int]) -> Tuple[str, List[List[List[str]]]]:
+        """
+        Extract text and tables from selected pages of a PDF.
+        
+        The text is not stripped, so the results of consecutive page ranges
+        concatenate to the text of the whole range.
         
-        finally:
-            # Cleanup temporary file
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                except Exception as e:
-                    logger.warning("Failed to cleanup temp file", error=str(e))
+        Args:
+            file_data: PDF file content as bytes
+            page_numbers: 1-based numbers of the pages to extract
+            
+        Returns:
+            Tuple of (text, list_of_tables)
+            
+        Raises:
+            PDFParsingError: If PDF parsing fails
+        """
+        try:
+            return self._parse_pdf_file(io.BytesIO(file_data), pages=page_numbers)
+            
+        except Exception as e:
+            logger.error("PDF page extraction failed", pages=page_numbers, error=str(e))
+            raise PDFParsingError(f"Failed to parse PDF pages: {e}", original_error=e)
+    
+    def get_page_count(self, file_data: bytes) -> int:
+        """
+        Count the pages of a PDF without extracting any content.
+        
+        Args:
+            file_data: PDF file content as bytes
+            
+        Returns:
+            int: Number of pages
+            
+        Raises:
+            PDFParsingError: If the PDF cannot be opened
+        """
+        try:
+            with self._open_pdf(file_data) as pdf:
+                return len(pdf.pages)
+                
+        except Exception as e:
+            logger.error("PDF page count failed", error=str(e))
+            raise PDFParsingError(f"Failed to count PDF pages: {e}", original_error=e)
     
     def get_pdf_metadata(self, file_data: bytes) -> Dict[str, Any]:
         """
@@ -179,16 +180,8 @@ class PDFParserService:
         Raises:
             PDFParsingError: If metadata extraction fails
         """
-        temp_file_path = None
-        
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(file_data)
-                tmp_file.flush()
-                temp_file_path = tmp_file.name
-            
-            with pdfplumber.open(temp_file_path) as pdf:
+            with self._open_pdf(file_data) as pdf:
                 metadata = {
                     'page_count': len(pdf.pages),
                     'metadata': pdf.metadata or {},
@@ -206,109 +199,137 @@ class PDFParserService:
         except Exception as e:
             logger.error("Metadata extraction failed", error=str(e))
             raise PDFParsingError(f"Failed to extract metadata: {e}", original_error=e)
+    
+    def _parse_pdf_file(
+        self,
+        pdf_file: BinaryIO,
+        want_text: bool = True,
+        want_tables: bool = True,
+        pages: Optional[List[int]] = None
+    ) -> Tuple[str, List[List[List[str]]]]:
+        """
+        Parse PDF file to extract text and/or tables in a single pass over the pages.
         
-        finally:
-            # Cleanup temporary file
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                except Exception as e:
-                    logger.warning("Failed to cleanup temp file", error=str(e))
+        Args:
+            pdf_file: Binary stream of the PDF
+            want_text: Whether to extract page text
+            want_tables: Whether to extract page tables
+            pages: 1-based numbers of the pages to parse (default: all)
+            
+        Returns:
+            Tuple of (full_text, all_tables); the text is unstripped and the
+            part not requested is empty
+        """
+        with pdfplumber.open(pdf_file, pages=pages) as pdf:
+            return self._parse_document(pdf, want_text, want_tables)
     
-    def _parse_pdf_file(self, file_path: str) -> Tuple[str, List[List[List[str]]]]:
+    def _parse_document(
+        self,
+        pdf: pdfplumber.PDF,
+        want_text: bool = True,
+        want_tables: bool = True
+    ) -> Tuple[str, List[List[List[str]]]]:
         """
-        Parse PDF file to extract text and tables.
+        Extract text and/or tables from an open document in one pass over its pages.
         
         Args:
-            file_path: Path to temporary PDF file
+            pdf: Open pdfplumber document
+            want_text: Whether to extract page text
+            want_tables: Whether to extract page tables
             
         Returns:
-            Tuple of (full_text, all_tables)
+            Tuple of (full_text, all_tables); the text is unstripped and the
+            part not requested is empty
         """
-        full_text = ""
+        page_texts = []
         all_tables = []
         
-        with pdfplumber.open(file_path) as pdf:
-            logger.info("Processing PDF pages", page_count=len(pdf.pages))
-            
-            for page_num, page in enumerate(pdf.pages, 1):
-                try:
-                    # Extract text from page
+        logger.info("Processing PDF pages", page_count=len(pdf.pages))
+        
+        for page in pdf.pages:
+            page_num = page.page_number
+            try:
+                # Extract text from page
+                if want_text:
                     page_text = page.extract_text()
                     if page_text:
-                        full_text += page_text + "\n"
-                    
-                    # Extract tables from page
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        # Clean and validate tables
-                        cleaned_tables = self._clean_tables(page_tables)
-                        all_tables.extend(cleaned_tables)
-                        
-                        logger.debug(
-                            "Extracted tables from page",
-                            page=page_num,
-                            tables_count=len(cleaned_tables)
-                        )
+                        page_texts.append(page_text)
                 
-                except Exception as e:
-                    logger.warning(
-                        "Failed to process page",
+                # Extract tables from page
+                page_tables = page.extract_tables() if want_tables else None
+                if page_tables:
+                    # Clean and validate tables
+                    cleaned_tables = self._clean_tables(page_tables)
+                    all_tables.extend(cleaned_tables)
+                    
+                    logger.debug(
+                        "Extracted tables from page",
                         page=page_num,
-                        error=str(e)
+                        tables_count=len(cleaned_tables)
                     )
-                    continue
+            
+            except Exception as e:
+                logger.warning(
+                    "Failed to process page",
+                    page=page_num,
+                    error=str(e)
+                )
+                continue
         
-        return full_text.strip(), all_tables
+        # Every page's text ends with a newline; joined once at the end
+        # instead of growing one string page by page
+        full_text = "\n".join(page_texts) + "\n" if page_texts else ""
+        
+        return full_text, all_tables
     
-    def _extract_text_from_file(self, file_path: str) -> str:
+    @contextmanager
+    def _open_pdf(self, file_data: bytes, keep_open: bool = True) -> Iterator[pdfplumber.PDF]:
         """
-        Extract only text from PDF file.
+        Open a PDF, reusing the document this thread last opened for the same bytes.
+        
+        pdfplumber caches parsed page objects on the document, so a text pass
+        after validation or a table pass after a text pass does not parse the
+        page layout again. Each thread keeps at most one document open.
         
         Args:
-            file_path: Path to temporary PDF file
+            file_data: PDF file content as bytes
+            keep_open: Whether to keep the document for the next call; when
+                False it is closed on exit
             
-        Returns:
-            str: Extracted text
+        Yields:
+            pdfplumber.PDF: The open document
         """
-        full_text = ""
+        slot = self._open_documents
+        cached = getattr(slot, 'document', None)
         
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n"
-                except Exception as e:
-                    logger.warning("Failed to extract text from page", error=str(e))
-                    continue
+        if cached is not None and cached[0] is file_data:
+            pdf = cached[1]
+        else:
+            self.close_open_document()
+            pdf = pdfplumber.open(io.BytesIO(file_data))
+            slot.document = (file_data, pdf)
         
-        return full_text.strip()
+        try:
+            yield pdf
+        except BaseException:
+            self.close_open_document()
+            raise
+        
+        if not keep_open:
+            self.close_open_document()
     
-    def _extract_tables_from_file(self, file_path: str) -> List[List[List[str]]]:
+    def close_open_document(self) -> None:
         """
-        Extract only tables from PDF file.
+        Close and forget the document kept open by the current thread.
         
-        Args:
-            file_path: Path to temporary PDF file
-            
-        Returns:
-            List of cleaned tables
+        Callers that validate a PDF and may not extract it in the same
+        thread call this when done, so the thread does not keep the upload
+        and its parsed pages alive.
         """
-        all_tables = []
-        
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                try:
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        cleaned_tables = self._clean_tables(page_tables)
-                        all_tables.extend(cleaned_tables)
-                except Exception as e:
-                    logger.warning("Failed to extract tables from page", error=str(e))
-                    continue
-        
-        return all_tables
+        cached = getattr(self._open_documents, 'document', None)
+        if cached is not None:
+            self._open_documents.document = None
+            cached[1].close()
     
     def _clean_tables(self, raw_tables: List[List[List[Optional[str]]]]) -> List[List[List[str]]]:
         """
@@ -329,21 +350,17 @@ class PDFParserService:
             cleaned_table = []
             
             for row_idx, row in enumerate(table):
-                if not row:  # Skip empty rows
+                # Skip empty rows: None and "" cells are falsy, so blank grid
+                # rows are dropped before any cell is cleaned
+                if not any(row):
                     continue
                 
-                # Clean cells and convert None to empty string
-                cleaned_row = []
-                for cell in row:
-                    if cell is None:
-                        cleaned_row.append("")
-                    else:
-                        # Clean whitespace and normalize
-                        cleaned_cell = str(cell).strip()
-                        cleaned_row.append(cleaned_cell)
+                # Clean whitespace and convert None to empty string
+                cleaned_row = ["" if cell is None else str(cell).strip() for cell in row]
                 
-                # Only add rows with at least one non-empty cell
-                if any(cell for cell in cleaned_row):
+                # Only add rows with at least one non-empty cell (rows of
+                # whitespace-only cells pass the check above)
+                if any(cleaned_row):
                     cleaned_table.append(cleaned_row)
             
             # Only add tables with at least 2 rows (header + data)
@@ -373,23 +390,14 @@ class PDFParserService:
             if not file_data.startswith(b'%PDF-'):
                 return False
             
-            # Try to open with pdfplumber
-            temp_file_path = None
-            try:
-                with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                    tmp_file.write(file_data)
-                    tmp_file.flush()
-                    temp_file_path = tmp_file.name
-                
-                with pdfplumber.open(temp_file_path) as pdf:
-                    # Try to access first page
-                    if len(pdf.pages) > 0:
-                        return True
-                    
-            finally:
-                if temp_file_path and os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+            # Try to open with pdfplumber; a valid document stays open for
+            # the extraction that follows
+            with self._open_pdf(file_data) as pdf:
+                # Try to access first page
+                if len(pdf.pages) > 0:
+                    return True
             
+            self.close_open_document()
             return False
             
         except Exception:
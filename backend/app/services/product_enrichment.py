@@ -8,9 +8,10 @@ comprehensive product enrichment capabilities.
 
 import asyncio
 import time
+from collections import deque
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 import structlog
 
 from ..models.product import Product
@@ -22,14 +23,32 @@ from ..models.enrichment import (
 )
 from ..exceptions.enrichment import (
     EnrichmentError, SKUExtractionError, SearchError, ScrapingError,
-    DatabaseError, ConfigurationError
+    DatabaseError, ConfigurationError, RateLimitError
 )
-from ..services.database_service import get_database_service
+from ..services.database_service import execute_query, get_database_service
 from ..services.lawnfawn_matcher import get_lawnfawn_matcher
 from ..services.firecrawl_client import get_firecrawl_client
 
 logger = structlog.get_logger(__name__)
 
+# Product IDs per bulk status update; keeps the PostgREST in.() filter
+# well within URL length limits
+STATUS_UPDATE_CHUNK_SIZE = 100
+
+# Adaptive concurrency: the limit is re-tuned every CONCURRENCY_TUNE_INTERVAL
+# completed enrichments. Rate-limited enrichments since the last tuning cut
+# it by CONCURRENCY_DECREASE_FACTOR; otherwise it grows by one as long as the
+# p95 latency stays within CONCURRENCY_LATENCY_TOLERANCE of its last value.
+CONCURRENCY_TUNE_INTERVAL = 20
+CONCURRENCY_DECREASE_FACTOR = 0.7
+CONCURRENCY_LATENCY_TOLERANCE = 1.2
+CONCURRENCY_LATENCY_WINDOW = 100
+
+# Enrichment methods by stored value; attempts recorded with a method this
+# version does not know are reported as fallback instead of failing after
+# their row was inserted
+ENRICHMENT_METHODS = {method.value: method for method in EnrichmentMethod}
+
 
 class ProductEnrichmentService:
     """
@@ -54,16 +73,54 @@ class ProductEnrichmentService:
         self.lawnfawn_matcher = get_lawnfawn_matcher(config)
         self.firecrawl_client = get_firecrawl_client(config)
         
+        # Matchers by normalized manufacturer name
+        self._matchers: Dict[str, Any] = {}
+        self.register_matcher('lawnfawn', self.lawnfawn_matcher)
+        
         # Concurrency control
         import os
         self.max_concurrent = int(os.getenv('ENRICHMENT_MAX_CONCURRENT', '5'))
-        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        # Admission is a counter checked under a condition, so the limit can
+        # change while enrichments are running without losing track of them
+        self._concurrency_limit = self.max_concurrent
+        self._active_enrichments = 0
+        self._concurrency_condition = asyncio.Condition()
+        # Upper bound for adaptive increases of the limit
+        self.max_concurrent_cap = int(os.getenv('ENRICHMENT_MAX_CONCURRENT_CAP', '20'))
+        self._recent_latencies: deque = deque(maxlen=CONCURRENCY_LATENCY_WINDOW)
+        self._recent_rate_limits = 0
+        self._completions_since_tune = 0
+        self._tuned_p95_latency: Optional[int] = None
+        
+        # Completed enrichments of a SKU younger than this are reused (0 disables)
+        self.enrichment_reuse_days = int(os.getenv('ENRICHMENT_REUSE_DAYS', '30'))
+        
+        # Batch products claimed longer ago than this and still processing
+        # belong to a worker that died and are claimed again
+        self.enrichment_claim_timeout_minutes = int(os.getenv('ENRICHMENT_CLAIM_TIMEOUT_MINUTES', '30'))
         
         logger.info(
             "Product enrichment service initialized",
             max_concurrent=self.max_concurrent
         )
     
+    def register_matcher(self, manufacturer: str, matcher: Any) -> None:
+        """
+        Enrich products of a manufacturer with the given matcher.
+        
+        Args:
+            manufacturer: Manufacturer name; case and surrounding whitespace
+                are ignored
+            matcher: Object with an async match_product(product) method
+                returning EnrichmentData
+        """
+        self._matchers[self._matcher_key(manufacturer)] = matcher
+    
+    @staticmethod
+    def _matcher_key(manufacturer: Optional[str]) -> str:
+        """Normalize a manufacturer name into its matcher registry key."""
+        return (manufacturer or '').strip().lower()
+    
     async def enrich_batch(self, batch_id: UUID, max_concurrent: Optional[int] = None) -> EnrichmentResult:
         """
         Enrich all products in a batch.
@@ -80,10 +137,58 @@ class ProductEnrichmentService:
         logger.info("Starting batch enrichment", batch_id=str(batch_id))
         
         try:
-            # Get products that need enrichment
-            products = await self._get_products_for_enrichment(batch_id)
+            # Update concurrency limit if provided
+            if max_concurrent:
+                await self._set_concurrency_limit(max_concurrent)
+            
+            # Re-drive products stranded in PROCESSING by a run that died
+            released = await self.database_service.release_stale_enrichment_claims(
+                batch_id,
+                datetime.utcnow() - timedelta(minutes=self.enrichment_claim_timeout_minutes)
+            )
+            if released:
+                logger.warning(
+                    "Released stale enrichment claims",
+                    batch_id=str(batch_id),
+                    released_products=released
+                )
             
-            if not products:
+            # Products are claimed in chunks, so concurrent runs on the same
+            # batch enrich disjoint products. One chunk waits claimed behind the
+            # running one, which keeps claims fresh and the workers busy.
+            processed_results = []
+            chunks = []
+            try:
+                while True:
+                    if len(chunks) == 2:
+                        processed_results.extend(await self._gather_enrichments(chunks.pop(0)))
+                    
+                    products = await self.database_service.claim_enrichable_products(batch_id)
+                    if not products:
+                        break
+                    
+                    reuse_lookup = await self._prefetch_product_pages(batch_id, products)
+                    
+                    logger.info(
+                        "Starting concurrent enrichment",
+                        batch_id=str(batch_id),
+                        claimed_products=len(products),
+                        max_concurrent=max_concurrent or self.max_concurrent
+                    )
+                    
+                    chunks.append([
+                        self._start_enrichment(product.id, reuse_lookup) for product in products
+                    ])
+                
+                for chunk in chunks:
+                    processed_results.extend(await self._gather_enrichments(chunk))
+            except BaseException:
+                for chunk in chunks:
+                    for task in chunk:
+                        task.cancel()
+                raise
+            
+            if not processed_results:
                 logger.info("No products found for enrichment", batch_id=str(batch_id))
                 return EnrichmentResult(
                     batch_id=batch_id,
@@ -94,58 +199,15 @@ class ProductEnrichmentService:
                     processing_time_ms=int((time.time() - start_time) * 1000)
                 )
             
-            # Update concurrency limit if provided
-            if max_concurrent:
-                self.semaphore = asyncio.Semaphore(max_concurrent)
-            
-            # Create enrichment tasks
-            tasks = [
-                self._enrich_product_with_semaphore(product.id)
-                for product in products
-            ]
-            
-            logger.info(
-                "Starting concurrent enrichment",
-                batch_id=str(batch_id),
-                total_products=len(products),
-                max_concurrent=max_concurrent or self.max_concurrent
-            )
-            
-            # Execute with concurrency control
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results and handle exceptions
-            successful = 0
-            failed = 0
-            processed_results = []
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(
-                        "Product enrichment task failed with exception",
-                        product_id=str(products[i].id),
-                        error=str(result),
-                        error_type=type(result).__name__
-                    )
-                    failed += 1
-                    processed_results.append(ProductEnrichmentResult(
-                        product_id=products[i].id,
-                        success=False,
-                        error_message=str(result)
-                    ))
-                elif result.success:
-                    successful += 1
-                    processed_results.append(result)
-                else:
-                    failed += 1
-                    processed_results.append(result)
+            successful = sum(1 for result in processed_results if result.success)
+            failed = len(processed_results) - successful
             
             processing_time_ms = int((time.time() - start_time) * 1000)
             
             logger.info(
                 "Batch enrichment completed",
                 batch_id=str(batch_id),
-                total_products=len(products),
+                total_products=len(processed_results),
                 successful=successful,
                 failed=failed,
                 processing_time_ms=processing_time_ms
@@ -153,7 +215,7 @@ class ProductEnrichmentService:
             
             return EnrichmentResult(
                 batch_id=batch_id,
-                total_products=len(products),
+                total_products=len(processed_results),
                 successful_enrichments=successful,
                 failed_enrichments=failed,
                 results=processed_results,
@@ -188,36 +250,13 @@ class ProductEnrichmentService:
         try:
             # Update concurrency limit if provided
             if max_concurrent:
-                self.semaphore = asyncio.Semaphore(max_concurrent)
+                await self._set_concurrency_limit(max_concurrent)
             
-            # Create enrichment tasks
-            tasks = [
-                self._enrich_product_with_semaphore(product_id)
-                for product_id in product_ids
-            ]
+            # One status write for all products instead of one per product
+            await self._mark_products_processing(product_ids)
             
             # Execute with concurrency control
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results and handle exceptions
-            processed_results = []
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(
-                        "Product enrichment task failed with exception",
-                        product_id=str(product_ids[i]),
-                        error=str(result)
-                    )
-                    processed_results.append(ProductEnrichmentResult(
-                        product_id=product_ids[i],
-                        success=False,
-                        error_message=str(result)
-                    ))
-                else:
-                    processed_results.append(result)
-            
-            return processed_results
+            return await self._run_enrichments(product_ids)
             
         except Exception as e:
             logger.error(
@@ -229,24 +268,271 @@ class ProductEnrichmentService:
                 f"Product enrichment failed: {str(e)}"
             )
     
-    async def _enrich_product_with_semaphore(self, product_id: UUID) -> ProductEnrichmentResult:
-        """Enrich product with semaphore control."""
-        async with self.semaphore:
-            return await self.enrich_product(product_id)
+    async def _prefetch_product_pages(
+        self,
+        batch_id: UUID,
+        products: List[Product]
+    ) -> Dict[UUID, Optional[EnrichmentData]]:
+        """
+        Fetch search and product pages for many products at once.
+        
+        Per-product matching is then served from the scrape caches. SKUs with
+        a reusable enrichment are not scraped at all, and products are only
+        prefetched through their manufacturer's matcher if it supports it.
+        Failures only cost the batching; each product still scrapes its own
+        pages.
+        
+        Args:
+            batch_id: Batch ID, for logging
+            products: Products about to be enriched
+            
+        Returns:
+            Dict[UUID, Optional[EnrichmentData]]: Reusable enrichment by
+                product ID, for enrich_product to use instead of looking it up
+                again; empty if the lookups failed
+        """
+        reuse_lookup: Dict[UUID, Optional[EnrichmentData]] = {}
+        try:
+            reusable = await asyncio.gather(
+                *[self._get_reusable_enrichment(product) for product in products]
+            )
+            reuse_lookup = {
+                product.id: enrichment_data for product, enrichment_data in zip(products, reusable)
+            }
+            
+            products_by_manufacturer: Dict[str, List[Product]] = {}
+            for product, enrichment_data in zip(products, reusable):
+                if enrichment_data is None:
+                    products_by_manufacturer.setdefault(
+                        self._matcher_key(product.manufacturer), []
+                    ).append(product)
+            
+            for manufacturer, manufacturer_products in products_by_manufacturer.items():
+                matcher = self._matchers.get(manufacturer)
+                if hasattr(matcher, 'prefetch_products'):
+                    await matcher.prefetch_products(manufacturer_products)
+        except Exception as e:
+            logger.warning(
+                "Batch page prefetch failed, scraping per product",
+                batch_id=str(batch_id),
+                error=str(e)
+            )
+        
+        return reuse_lookup
     
-    async def enrich_product(self, product_id: UUID) -> ProductEnrichmentResult:
+    async def _run_enrichments(self, product_ids: List[UUID]) -> List[ProductEnrichmentResult]:
+        """
+        Enrich products concurrently, turning task errors into failed results.
+        
+        Args:
+            product_ids: IDs of products already marked as processing
+            
+        Returns:
+            List[ProductEnrichmentResult]: Results in the order of product_ids
+        """
+        return await self._gather_enrichments(
+            [self._start_enrichment(product_id) for product_id in product_ids]
+        )
+    
+    def _start_enrichment(
+        self,
+        product_id: UUID,
+        reuse_lookup: Optional[Dict[UUID, Optional[EnrichmentData]]] = None
+    ) -> "asyncio.Future[ProductEnrichmentResult]":
+        """
+        Schedule the enrichment of a product already marked as processing.
+        
+        Errors become a failed result instead of failing the task.
+        
+        Args:
+            product_id: Product ID to enrich
+            reuse_lookup: Reusable enrichments already looked up, by product ID
+            
+        Returns:
+            asyncio.Future: Task resolving to the product's result
+        """
+        async def enrich() -> ProductEnrichmentResult:
+            try:
+                return await self._enrich_product_with_limit(
+                    product_id, mark_processing=False, reuse_lookup=reuse_lookup
+                )
+            except Exception as e:
+                logger.error(
+                    "Product enrichment task failed with exception",
+                    product_id=str(product_id),
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                return ProductEnrichmentResult(
+                    product_id=product_id,
+                    success=False,
+                    error_message=str(e)
+                )
+        
+        return asyncio.ensure_future(enrich())
+    
+    async def _gather_enrichments(
+        self,
+        tasks: List["asyncio.Future[ProductEnrichmentResult]"]
+    ) -> List[ProductEnrichmentResult]:
+        """
+        Wait for started enrichments, cancelling all of them if one is aborted.
+        
+        If the caller is cancelled or any enrichment ends with a
+        BaseException such as cancellation, the remaining enrichments are
+        cancelled and the exception propagates instead of being returned as
+        a result, so no scrapes keep spending credits for an aborted batch.
+        
+        Args:
+            tasks: Tasks from _start_enrichment
+            
+        Returns:
+            List[ProductEnrichmentResult]: Results in the order of tasks
+        """
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    async def _set_concurrency_limit(self, max_concurrent: int) -> None:
+        """
+        Change the number of enrichments allowed to run at once.
+        
+        Running enrichments keep counting against the new limit; waiting ones
+        are admitted as soon as it allows.
+        
+        Args:
+            max_concurrent: New concurrency limit
+        """
+        async with self._concurrency_condition:
+            self._concurrency_limit = max_concurrent
+            self._concurrency_condition.notify_all()
+    
+    async def _observe_enrichment(self, processing_time_ms: Optional[int], rate_limited: bool = False) -> None:
+        """
+        Record a finished enrichment and re-tune the concurrency limit.
+        
+        Additive increase, multiplicative decrease: every
+        CONCURRENCY_TUNE_INTERVAL completions the limit shrinks if Firecrawl
+        rate-limited any of them, and grows by one up to max_concurrent_cap
+        while the p95 latency of successful enrichments holds steady.
+        
+        Args:
+            processing_time_ms: Duration of a successful enrichment, or None
+                for a failed one
+            rate_limited: Whether the enrichment failed on a Firecrawl 429
+        """
+        if processing_time_ms is not None:
+            self._recent_latencies.append(processing_time_ms)
+        if rate_limited:
+            self._recent_rate_limits += 1
+        
+        self._completions_since_tune += 1
+        if self._completions_since_tune < CONCURRENCY_TUNE_INTERVAL:
+            return
+        self._completions_since_tune = 0
+        
+        limit = self._concurrency_limit
+        if self._recent_rate_limits:
+            self._recent_rate_limits = 0
+            new_limit = max(1, int(limit * CONCURRENCY_DECREASE_FACTOR))
+        elif self._recent_latencies:
+            latencies = sorted(self._recent_latencies)
+            p95_latency = latencies[int(0.95 * (len(latencies) - 1))]
+            steady = (
+                self._tuned_p95_latency is None
+                or p95_latency <= self._tuned_p95_latency * CONCURRENCY_LATENCY_TOLERANCE
+            )
+            self._tuned_p95_latency = p95_latency
+            new_limit = limit + 1 if steady and limit < self.max_concurrent_cap else limit
+        else:
+            new_limit = limit
+        
+        if new_limit != limit:
+            logger.info(
+                "Adjusted enrichment concurrency",
+                previous_limit=limit,
+                concurrency_limit=new_limit
+            )
+            await self._set_concurrency_limit(new_limit)
+    
+    @staticmethod
+    def _is_rate_limited(error: BaseException) -> bool:
+        """
+        Check whether an enrichment error was caused by a Firecrawl 429.
+        
+        The matcher wraps client errors in its own, so the chain of causes
+        is searched for the RateLimitError.
+        
+        Args:
+            error: Error that failed the enrichment
+            
+        Returns:
+            bool: True if a rate limit error is in the chain
+        """
+        seen = set()
+        current: Optional[BaseException] = error
+        while current is not None and id(current) not in seen:
+            if isinstance(current, RateLimitError):
+                return True
+            seen.add(id(current))
+            current = current.__cause__ or current.__context__
+        return False
+    
+    async def _enrich_product_with_limit(
+        self,
+        product_id: UUID,
+        mark_processing: bool = True,
+        reuse_lookup: Optional[Dict[UUID, Optional[EnrichmentData]]] = None
+    ) -> ProductEnrichmentResult:
+        """Enrich product once the concurrency limit admits it."""
+        condition = self._concurrency_condition
+        async with condition:
+            await condition.wait_for(lambda: self._active_enrichments < self._concurrency_limit)
+            self._active_enrichments += 1
+        
+        try:
+            return await self.enrich_product(
+                product_id, mark_processing=mark_processing, reuse_lookup=reuse_lookup
+            )
+        finally:
+            # Released before taking the lock, so a cancelled wait for it
+            # cannot leak the slot; the wake-up is shielded so the cancel
+            # cannot skip it either and leave a waiter behind a free slot
+            self._active_enrichments -= 1
+            await asyncio.shield(self._notify_enrichment_waiter())
+    
+    async def _notify_enrichment_waiter(self) -> None:
+        """Wake one enrichment waiting for a concurrency slot."""
+        async with self._concurrency_condition:
+            self._concurrency_condition.notify()
+    
+    async def enrich_product(
+        self,
+        product_id: UUID,
+        mark_processing: bool = True,
+        reuse_lookup: Optional[Dict[UUID, Optional[EnrichmentData]]] = None
+    ) -> ProductEnrichmentResult:
         """
         Enrich a single product with web-scraped data.
         
         Args:
             product_id: Product ID to enrich
+            mark_processing: Whether to set the processing status first; batch
+                callers mark all their products with one update instead
+            reuse_lookup: Reusable enrichments the batch prefetch already
+                looked up, by product ID; products missing from it are looked
+                up here
             
         Returns:
             ProductEnrichmentResult: Enrichment result with confidence score
         """
         start_time = time.time()
+        product_key = str(product_id)
         
-        logger.info("Starting product enrichment", product_id=str(product_id))
+        logger.info("Starting product enrichment", product_id=product_key)
         
         try:
             # Get product from database
@@ -258,22 +544,37 @@ class ProductEnrichmentService:
                 raise EnrichmentError("No supplier SKU available for enrichment")
             
             # Update status to processing
-            await self._update_product_status(
-                product_id, 
-                ProductStatus.PROCESSING,
-                enrichment_status="processing"
-            )
+            if mark_processing:
+                await self._update_product_status(
+                    product_id, 
+                    ProductStatus.PROCESSING,
+                    enrichment_status="processing"
+                )
             
-            # Perform enrichment based on manufacturer
-            if product.manufacturer and product.manufacturer.lower() == "lawnfawn":
-                enrichment_data = await self.lawnfawn_matcher.match_product(product)
-            else:
+            # Perform enrichment with the manufacturer's matcher
+            matcher = self._matchers.get(self._matcher_key(product.manufacturer))
+            if matcher is None:
                 raise EnrichmentError(f"Unsupported manufacturer: {product.manufacturer}")
             
+            # Product pages rarely change, so a recent enrichment of the
+            # same SKU is reused instead of searching and scraping again
+            if reuse_lookup is not None and product_id in reuse_lookup:
+                enrichment_data = reuse_lookup[product_id]
+            else:
+                enrichment_data = await self._get_reusable_enrichment(product)
+            if enrichment_data is None:
+                enrichment_data = await matcher.match_product(product)
+            else:
+                logger.info(
+                    "Reusing recent enrichment",
+                    product_id=product_key,
+                    source_product_id=enrichment_data.raw_response['reused_from_product_id']
+                )
+            
             # Store successful scraping attempt
             scraping_attempt = await self._create_scraping_attempt(
                 product_id=product_id,
-                search_url=enrichment_data.search_url,
+                search_url=enrichment_data.search_url or None,
                 method=enrichment_data.method,
                 status=ScrapingStatus.SUCCESS,
                 confidence_score=enrichment_data.confidence_score,
@@ -299,11 +600,12 @@ class ProductEnrichmentService:
             
             logger.info(
                 "Product enrichment completed successfully",
-                product_id=str(product_id),
+                product_id=product_key,
                 confidence_score=enrichment_data.confidence_score,
                 images_found=len(enrichment_data.image_urls),
                 processing_time_ms=processing_time_ms
             )
+            await self._observe_enrichment(processing_time_ms)
             
             return ProductEnrichmentResult(
                 product_id=product_id,
@@ -341,11 +643,12 @@ class ProductEnrichmentService:
             
             logger.error(
                 "Product enrichment failed",
-                product_id=str(product_id),
+                product_id=product_key,
                 error=str(e),
                 error_type=type(e).__name__,
                 processing_time_ms=processing_time_ms
             )
+            await self._observe_enrichment(None, rate_limited=self._is_rate_limited(e))
             
             return ProductEnrichmentResult(
                 product_id=product_id,
@@ -378,11 +681,12 @@ class ProductEnrichmentService:
             
             logger.error(
                 "Unexpected error during product enrichment",
-                product_id=str(product_id),
+                product_id=product_key,
                 error=str(e),
                 error_type=type(e).__name__,
                 processing_time_ms=processing_time_ms
             )
+            await self._observe_enrichment(None, rate_limited=self._is_rate_limited(e))
             
             return ProductEnrichmentResult(
                 product_id=product_id,
@@ -391,6 +695,54 @@ class ProductEnrichmentService:
                 processing_time_ms=processing_time_ms
             )
     
+    async def _get_reusable_enrichment(self, product: Product) -> Optional[EnrichmentData]:
+        """
+        Build enrichment data from a recent completed enrichment of the same SKU.
+        
+        Args:
+            product: Product to enrich
+            
+        Returns:
+            Optional[EnrichmentData]: Reused enrichment data, or None if there is
+                none recent enough (or the lookup failed)
+        """
+        if self.enrichment_reuse_days <= 0:
+            return None
+        
+        since = datetime.utcnow() - timedelta(days=self.enrichment_reuse_days)
+        
+        try:
+            row = await self.database_service.get_recent_enrichment(
+                manufacturer=product.manufacturer,
+                supplier_sku=product.supplier_sku,
+                since=since,
+                exclude_product_id=product.id
+            )
+        except Exception as e:
+            logger.warning(
+                "Enrichment reuse lookup failed, scraping instead",
+                product_id=str(product.id),
+                error=str(e)
+            )
+            return None
+        
+        if not row or not row.get('scraped_url'):
+            return None
+        
+        # Nothing was searched, so the attempt records no search URL
+        return EnrichmentData(
+            search_url="",
+            product_url=row['scraped_url'],
+            product_name=row.get('scraped_name') or "",
+            description=row.get('scraped_description') or "",
+            image_urls=row.get('scraped_images_urls') or [],
+            image_metadata=row.get('scraped_images_metadata') or [],
+            confidence_score=row.get('scraping_confidence') or 0,
+            method=EnrichmentMethod.DIRECT_URL,
+            raw_response={'reused_from_product_id': row['id']},
+            processing_time_ms=0
+        )
+    
     async def _get_products_for_enrichment(self, batch_id: UUID) -> List[Product]:
         """
         Get products that need enrichment from a batch.
@@ -402,22 +754,15 @@ class ProductEnrichmentService:
             List[Product]: Products that need enrichment
         """
         try:
-            # Get all products in batch that are in DRAFT status
-            products = await self.database_service.get_products(
-                batch_id=batch_id,
-                status=ProductStatus.DRAFT.value
-            )
-            
-            # Filter for products with manufacturer_sku (required for enrichment)
-            enrichable_products = [
-                product for product in products 
-                if product.supplier_sku and product.manufacturer
-            ]
+            # DRAFT products with a supplier SKU and manufacturer (required
+            # for enrichment), filtered by the database and read page by page
+            enrichable_products = []
+            async for products in self.database_service.iter_enrichable_products(batch_id):
+                enrichable_products.extend(products)
             
             logger.debug(
                 "Found products for enrichment",
                 batch_id=str(batch_id),
-                total_products=len(products),
                 enrichable_products=len(enrichable_products)
             )
             
@@ -477,7 +822,9 @@ class ProductEnrichmentService:
             }
             
             # Insert into database
-            result = self.database_service.client.table('scraping_attempts').insert(attempt_data).execute()
+            result = await execute_query(
+                self.database_service.client.table('scraping_attempts').insert(attempt_data)
+            )
             
             if result.data:
                 attempt_record = result.data[0]
@@ -493,7 +840,7 @@ class ProductEnrichmentService:
                     product_id=product_id,
                     attempt_number=attempt_record['attempt_number'],
                     search_url=search_url,
-                    method=EnrichmentMethod(method),
+                    method=ENRICHMENT_METHODS.get(method, EnrichmentMethod.FALLBACK),
                     status=status,
                     confidence_score=confidence_score,
                     firecrawl_response=firecrawl_response,
@@ -546,10 +893,11 @@ class ProductEnrichmentService:
             if processing_notes:
                 update_data['enrichment_notes'] = processing_notes
             
-            result = self.database_service.client.table('products')\
-                .update(update_data)\
-                .eq('id', str(product_id))\
-                .execute()
+            result = await execute_query(
+                self.database_service.client.table('products')
+                .update(update_data)
+                .eq('id', str(product_id))
+            )
             
             if not result.data:
                 raise DatabaseError(f"Product not found: {product_id}")
@@ -574,6 +922,42 @@ class ProductEnrichmentService:
                 table="products"
             )
     
+    async def _mark_products_processing(self, product_ids: List[UUID]) -> None:
+        """
+        Set the processing status of many products with bulk updates.
+        
+        Args:
+            product_ids: IDs of the products about to be enriched
+        """
+        update_data = {
+            'status': ProductStatus.PROCESSING.value,
+            'enrichment_status': "processing",
+            'last_enrichment_attempt': datetime.utcnow().isoformat()
+        }
+        
+        try:
+            for start in range(0, len(product_ids), STATUS_UPDATE_CHUNK_SIZE):
+                chunk = product_ids[start:start + STATUS_UPDATE_CHUNK_SIZE]
+                await execute_query(
+                    self.database_service.client.table('products')
+                    .update(update_data)
+                    .in_('id', [str(product_id) for product_id in chunk])
+                )
+            
+            logger.debug("Products marked as processing", product_count=len(product_ids))
+            
+        except Exception as e:
+            logger.error(
+                "Error marking products as processing",
+                product_count=len(product_ids),
+                error=str(e)
+            )
+            raise DatabaseError(
+                f"Failed to update product status: {str(e)}",
+                operation="update",
+                table="products"
+            )
+    
     async def _update_product_enrichment(
         self,
         product_id: UUID,
@@ -616,10 +1000,11 @@ class ProductEnrichmentService:
                 'last_enrichment_attempt': datetime.utcnow().isoformat()
             }
             
-            result = self.database_service.client.table('products')\
-                .update(update_data)\
-                .eq('id', str(product_id))\
-                .execute()
+            result = await execute_query(
+                self.database_service.client.table('products')
+                .update(update_data)
+                .eq('id', str(product_id))
+            )
             
             if not result.data:
                 raise DatabaseError(f"Product not found: {product_id}")
@@ -655,40 +1040,17 @@ class ProductEnrichmentService:
             Dict[str, Any]: Enrichment status information
         """
         try:
-            # Get products in batch
-            products = await self.database_service.get_products(batch_id=batch_id)
-            
-            if not products:
-                return {
-                    "batch_id": str(batch_id),
-                    "total_products": 0,
-                    "completed_products": 0,
-                    "failed_products": 0,
-                    "processing_products": 0,
-                    "pending_products": 0,
-                    "avg_confidence_score": 0.0,
-                    "last_updated": datetime.utcnow().isoformat()
-                }
-            
-            # Count products by status
-            total_products = len(products)
-            completed_products = len([p for p in products if p.status == ProductStatus.READY])
-            failed_products = len([p for p in products if p.status == ProductStatus.FAILED])
-            processing_products = len([p for p in products if p.status == ProductStatus.PROCESSING])
-            pending_products = len([p for p in products if p.status == ProductStatus.DRAFT])
-            
-            # Calculate average confidence score
-            enriched_products = [p for p in products if p.status == ProductStatus.READY and hasattr(p, 'scraping_confidence')]
-            avg_confidence = sum(p.scraping_confidence for p in enriched_products) / len(enriched_products) if enriched_products else 0.0
+            # Counted by the database; only the totals are transferred
+            counts = await self.database_service.get_batch_enrichment_counts(batch_id)
             
             return {
                 "batch_id": str(batch_id),
-                "total_products": total_products,
-                "completed_products": completed_products,
-                "failed_products": failed_products,
-                "processing_products": processing_products,
-                "pending_products": pending_products,
-                "avg_confidence_score": round(avg_confidence, 2),
+                "total_products": counts["total_products"],
+                "completed_products": counts["completed_products"],
+                "failed_products": counts["failed_products"],
+                "processing_products": counts["processing_products"],
+                "pending_products": counts["pending_products"],
+                "avg_confidence_score": round(counts["avg_confidence_score"], 2),
                 "last_updated": datetime.utcnow().isoformat()
             }
             
@@ -708,11 +1070,13 @@ class ProductEnrichmentService:
             Dict[str, Any]: Health check results
         """
         try:
-            # Check database connectivity
-            db_health = await self.database_service.health_check()
-            
-            # Check Firecrawl API connectivity
-            firecrawl_health = await self.firecrawl_client.health_check()
+            # Check Firecrawl API and database connectivity concurrently. The
+            # Firecrawl check starts first so its request is in flight while
+            # the database check, which uses the blocking Supabase client, runs.
+            firecrawl_health, db_health = await asyncio.gather(
+                self.firecrawl_client.health_check(),
+                self.database_service.health_check()
+            )
             
             # Overall health status
             overall_healthy = (
@@ -5,8 +5,11 @@ This module provides secure S3 operations for storing and retrieving
 PDF invoices with organized folder structure and presigned URLs.
 """
 
+import io
 import boto3
 import structlog
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 from botocore.exceptions import ClientError, NoCredentialsError
@@ -15,6 +18,12 @@ from app.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Multipart settings for invoice uploads; files below the threshold are
+# still sent with a single PUT
+MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+MULTIPART_CHUNK_SIZE_BYTES = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 8
+
 
 class S3InvoiceManager:
     """
@@ -66,10 +75,17 @@ class S3InvoiceManager:
                     'max_attempts': 3,
                     'mode': 'adaptive'
                 },
+                max_pool_connections=self.settings.s3_max_pool_connections,
                 region_name=self.settings.aws_region
             )
             
             self.s3_client = session.client('s3', config=config)
+            self.transfer_config = TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD_BYTES,
+                multipart_chunksize=MULTIPART_CHUNK_SIZE_BYTES,
+                max_concurrency=MULTIPART_MAX_CONCURRENCY,
+                use_threads=True
+            )
             
             # Log credential type for debugging
             final_credentials = session.get_credentials()
@@ -126,14 +142,17 @@ class S3InvoiceManager:
                 file_size=len(file_data)
             )
             
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.settings.s3_bucket_name,
-                Key=s3_key,
-                Body=file_data,
-                ContentType='application/pdf',
-                Metadata=metadata,
-                ServerSideEncryption='AES256'  # Enable encryption
+            # Upload to S3 (multipart with parallel parts for large files)
+            self.s3_client.upload_fileobj(
+                io.BytesIO(file_data),
+                self.settings.s3_bucket_name,
+                s3_key,
+                ExtraArgs={
+                    'ContentType': 'application/pdf',
+                    'Metadata': metadata,
+                    'ServerSideEncryption': 'AES256'  # Enable encryption
+                },
+                Config=self.transfer_config
             )
             
             # Generate S3 URL (not presigned, just the object URL)
@@ -157,6 +176,9 @@ class S3InvoiceManager:
                 error_message=e.response['Error']['Message']
             )
             raise S3UploadError(f"S3 upload failed: {error_code}")
+        except S3UploadFailedError as e:
+            logger.error("S3 upload failed", error_message=str(e))
+            raise S3UploadError(f"S3 upload failed: {e}")
         except Exception as e:
             logger.error("Unexpected error during S3 upload", error=str(e))
             raise S3UploadError(f"Upload failed: {e}")
@@ -93,8 +93,8 @@ class SupplierDetectionService:
         """
         logger.info("Starting supplier detection", text_length=len(pdf_text))
         
-        # Clean and normalize text for better matching
-        normalized_text = self._normalize_text(pdf_text)
+        # Clean, normalize and lowercase text once for all suppliers' patterns
+        normalized_text = self._normalize_text(pdf_text).lower()
         
         best_match = None
         best_confidence = 0.0
@@ -166,7 +166,7 @@ class SupplierDetectionService:
         Args:
             supplier_code: Supplier code to check
             patterns: Pattern configuration for supplier
-            normalized_text: Normalized text for matching
+            normalized_text: Normalized, lowercased text for matching
             original_text: Original text for regex patterns
             
         Returns:
@@ -225,13 +225,13 @@ class SupplierDetectionService:
         Check if text contains pattern (case-insensitive).
         
         Args:
-            text: Text to search in
+            text: Lowercased text to search in
             pattern: Pattern to search for
             
         Returns:
             bool: True if pattern found
         """
-        return pattern.lower() in text.lower()
+        return pattern.lower() in text
     
     def get_supported_suppliers(self) -> List[str]:
         """
@@ -0,0 +1,17 @@
+-- Migration 008: Product Deduplication Indexes
+-- Tune indexes used by the deduplication lookups and the review queue
+
+-- Manufacturer SKU lookups (single "=" and batch "= ANY") are served by the
+-- partial unique index from migration 006. The lookup index created alongside
+-- it has the same column and predicate, so it only adds write overhead.
+DROP INDEX IF EXISTS idx_products_manufacturer_sku_lookup;
+
+-- Review queue: products flagged for review, newest first.
+-- Migration 006 intended a partial requires_review index, but the name was
+-- already taken by the full index from migration 001, so it was never created.
+CREATE INDEX IF NOT EXISTS idx_products_review_queue 
+ON products (created_at DESC) 
+WHERE requires_review = TRUE;
+
+-- Add helpful comments
+COMMENT ON INDEX idx_products_review_queue IS 'Paginated listing of products requiring review (newest first)';
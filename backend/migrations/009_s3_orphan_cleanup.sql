@@ -0,0 +1,15 @@
+-- Migration 009: S3 orphan cleanup queue
+-- Invoice files whose database records could not be stored are queued here
+-- and deleted from S3 by a periodic background task
+
+CREATE TABLE IF NOT EXISTS s3_orphans (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    s3_key VARCHAR(500) NOT NULL UNIQUE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Oldest orphans are cleaned up first
+CREATE INDEX IF NOT EXISTS idx_s3_orphans_created_at ON s3_orphans(created_at);
+
+-- Add helpful comments
+COMMENT ON TABLE s3_orphans IS 'S3 invoice files without database records, pending deletion';
@@ -0,0 +1,14 @@
+-- Migration 010: Upload batch content hash
+-- SHA-256 of the uploaded invoice file, used to answer repeated uploads of
+-- an already processed file without running the pipeline again
+
+ALTER TABLE upload_batches ADD COLUMN IF NOT EXISTS content_sha256 CHAR(64);
+
+-- Duplicate lookups only consider completed batches. The index is not unique:
+-- a file whose earlier upload failed has to be processable again.
+CREATE INDEX IF NOT EXISTS idx_upload_batches_content_sha256 
+ON upload_batches(content_sha256, created_at DESC) 
+WHERE content_sha256 IS NOT NULL AND status = 'completed';
+
+-- Add helpful comments
+COMMENT ON COLUMN upload_batches.content_sha256 IS 'SHA-256 hex digest of the uploaded invoice file';
@@ -0,0 +1,7 @@
+-- Migration 011: Product enrichment reuse index
+-- Supports looking up the latest completed enrichment of a SKU, so products
+-- seen on earlier invoices are enriched from stored data instead of scraped again
+
+CREATE INDEX IF NOT EXISTS idx_products_completed_enrichment_sku 
+ON products(supplier_sku, last_enrichment_attempt DESC) 
+WHERE enrichment_status = 'completed';
@@ -0,0 +1,26 @@
+-- Migration 012: Batch enrichment status function
+-- Counts a batch's products per enrichment state in the database, so status
+-- requests transfer one row instead of every product of the batch
+
+CREATE OR REPLACE FUNCTION get_batch_enrichment_status(batch_uuid UUID)
+RETURNS TABLE (
+    total_products BIGINT,
+    completed_products BIGINT,
+    failed_products BIGINT,
+    processing_products BIGINT,
+    pending_products BIGINT,
+    avg_confidence_score NUMERIC
+) AS $$
+    SELECT
+        COUNT(*),
+        COUNT(*) FILTER (WHERE status = 'ready'),
+        COUNT(*) FILTER (WHERE status = 'failed'),
+        COUNT(*) FILTER (WHERE status = 'processing'),
+        COUNT(*) FILTER (WHERE status = 'draft'),
+        COALESCE(AVG(scraping_confidence) FILTER (WHERE status = 'ready'), 0)
+    FROM products
+    WHERE batch_id = batch_uuid;
+$$ LANGUAGE sql STABLE;
+
+-- Add helpful comments
+COMMENT ON FUNCTION get_batch_enrichment_status(UUID) IS 'Product counts per enrichment state and average confidence of completed products for one upload batch';
@@ -0,0 +1,32 @@
+-- Migration 013: Enrichment claiming
+-- Batch enrichment claims DRAFT products in chunks by moving them to
+-- 'processing' atomically, so concurrent workers never enrich the same
+-- product and products left behind by a crashed worker can be re-driven
+
+CREATE OR REPLACE FUNCTION claim_enrichment_products(batch_uuid UUID, claim_limit INTEGER)
+RETURNS SETOF products AS $$
+    UPDATE products
+    SET status = 'processing',
+        enrichment_status = 'processing',
+        last_enrichment_attempt = CURRENT_TIMESTAMP
+    WHERE id IN (
+        SELECT id
+        FROM products
+        WHERE batch_id = batch_uuid
+          AND status = 'draft'
+          AND supplier_sku <> ''
+          AND manufacturer <> ''
+        ORDER BY id
+        LIMIT claim_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *;
+$$ LANGUAGE sql VOLATILE;
+
+-- Stale claims are looked up per batch among processing products
+CREATE INDEX IF NOT EXISTS idx_products_processing_batch 
+ON products(batch_id, last_enrichment_attempt) 
+WHERE status = 'processing';
+
+-- Add helpful comments
+COMMENT ON FUNCTION claim_enrichment_products(UUID, INTEGER) IS 'Moves up to claim_limit enrichable DRAFT products of a batch to processing, skipping rows locked by other workers, and returns them';
@@ -6,6 +6,7 @@ and environment variable validation using REAL API calls.
 """
 
 import pytest
+import pytest_asyncio
 import os
 import asyncio
 from datetime import datetime
@@ -34,12 +35,12 @@ class TestFirecrawlConnectivity:
             retry_delay=2
         )
     
-    @pytest.fixture(autouse=True)
-    def reset_client(self):
+    @pytest_asyncio.fixture(autouse=True)
+    async def reset_client(self):
         """Reset client before each test."""
-        reset_firecrawl_client()
+        await reset_firecrawl_client()
         yield
-        reset_firecrawl_client()
+        await reset_firecrawl_client()
     
     @pytest.mark.asyncio
     async def test_firecrawl_api_authentication(self, test_config):
@@ -237,12 +238,12 @@ class TestFirecrawlConnectivity:
 class TestFirecrawlClientSingleton:
     """Test singleton behavior with real environment."""
     
-    @pytest.fixture(autouse=True)
-    def reset_client(self):
+    @pytest_asyncio.fixture(autouse=True)
+    async def reset_client(self):
         """Reset client before each test."""
-        reset_firecrawl_client()
+        await reset_firecrawl_client()
         yield
-        reset_firecrawl_client()
+        await reset_firecrawl_client()
     
     def test_singleton_with_environment_config(self):
         """Test singleton behavior with environment-based configuration."""
@@ -286,12 +287,12 @@ class TestFirecrawlIntegrationScenarios:
             firecrawl_timeout=30
         )
     
-    @pytest.fixture(autouse=True)
-    def reset_client(self):
+    @pytest_asyncio.fixture(autouse=True)
+    async def reset_client(self):
         """Reset client before each test."""
-        reset_firecrawl_client()
+        await reset_firecrawl_client()
         yield
-        reset_firecrawl_client()
+        await reset_firecrawl_client()
     
     @pytest.mark.asyncio
     async def test_lawnfawn_search_integration(self, test_config):
@@ -8,6 +8,7 @@ import pytest
 import asyncio
 from unittest.mock import Mock, patch
 from uuid import uuid4
+from postgrest.exceptions import APIError
 
 from app.core.database import SupabaseManager, test_database_connection
 from app.models import (
@@ -273,6 +274,170 @@ class TestDatabaseService:
             assert supplier.code == "TEST"
 
 
+    @pytest.mark.asyncio
+    async def test_iter_enrichable_products_pages_by_id(self):
+        """Test that enrichable products are read in pages that continue after the last ID."""
+        service = DatabaseService()
+        batch_id = uuid4()
+        rows = [
+            {
+                "id": product_id,
+                "batch_id": str(batch_id),
+                "supplier_id": str(uuid4()),
+                "supplier_sku": "LF2538",
+                "manufacturer": "lawnfawn",
+                "status": "draft",
+                "created_at": "2025-01-07T22:50:00Z",
+                "updated_at": "2025-01-07T22:50:00Z"
+            }
+            for product_id in sorted(str(uuid4()) for _ in range(3))
+        ]
+        
+        # Every builder method returns the same query
+        query = Mock()
+        for method in ('select', 'eq', 'neq', 'gt', 'order', 'limit'):
+            getattr(query, method).return_value = query
+        query.execute.side_effect = [Mock(data=rows[:2]), Mock(data=rows[2:])]
+        
+        with patch.object(service.client, 'table', return_value=query):
+            pages = [page async for page in service.iter_enrichable_products(batch_id, page_size=2)]
+        
+        assert [[str(product.id) for product in page] for page in pages] == [
+            [rows[0]["id"], rows[1]["id"]],
+            [rows[2]["id"]]
+        ]
+        query.gt.assert_called_once_with('id', rows[1]["id"])
+        query.neq.assert_any_call('supplier_sku', '')
+    
+    @pytest.mark.asyncio
+    async def test_products_by_manufacturer_skus_looked_up_in_chunks(self):
+        """Test that SKU lookups are split into chunks and their results merged."""
+        service = DatabaseService()
+        skus = ["LF2538", "LF2539", "LF2540"]
+        rows = [
+            {
+                "id": str(uuid4()),
+                "batch_id": str(uuid4()),
+                "supplier_id": str(uuid4()),
+                "supplier_sku": sku,
+                "manufacturer_sku": sku,
+                "status": "draft",
+                "created_at": "2025-01-07T22:50:00Z",
+                "updated_at": "2025-01-07T22:50:00Z"
+            }
+            for sku in skus
+        ]
+        
+        query = Mock()
+        for method in ('select', 'in_', 'gt', 'order', 'limit'):
+            getattr(query, method).return_value = query
+        query.execute.side_effect = [Mock(data=rows[:2]), Mock(data=rows[2:])]
+        
+        with patch.object(service.client, 'table', return_value=query), \
+             patch('app.services.database_service.SKU_LOOKUP_CHUNK_SIZE', 2):
+            products = await service.get_products_by_manufacturer_skus(skus)
+        
+        assert [product.manufacturer_sku for product in products] == skus
+        assert [call.args for call in query.in_.call_args_list] == [
+            ('manufacturer_sku', skus[:2]),
+            ('manufacturer_sku', skus[2:])
+        ]
+        query.gt.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_claim_enrichable_products_without_database_function(self):
+        """Test that products are claimed by a DRAFT-conditional update when the function is not deployed."""
+        service = DatabaseService()
+        batch_id = uuid4()
+        row = {
+            "id": str(uuid4()),
+            "batch_id": str(batch_id),
+            "supplier_id": str(uuid4()),
+            "supplier_sku": "LF2538",
+            "manufacturer": "lawnfawn",
+            "status": "draft",
+            "created_at": "2025-01-07T22:50:00Z",
+            "updated_at": "2025-01-07T22:50:00Z"
+        }
+        
+        # Every builder method returns the same query; the candidate select
+        # finds the row, the update claims it
+        query = Mock()
+        for method in ('select', 'eq', 'neq', 'gt', 'order', 'limit', 'update', 'in_'):
+            getattr(query, method).return_value = query
+        query.execute.side_effect = [Mock(data=[row]), Mock(data=[dict(row, status="processing")])]
+        
+        with patch.object(service.client, 'rpc') as mock_rpc, \
+             patch.object(service.client, 'table', return_value=query):
+            mock_rpc.return_value.execute.side_effect = APIError(
+                {"code": "PGRST202", "message": "Could not find the function"}
+            )
+            
+            products = await service.claim_enrichable_products(batch_id, limit=10)
+        
+        assert [str(product.id) for product in products] == [row["id"]]
+        assert products[0].status == "processing"
+        query.in_.assert_called_once_with('id', [row["id"]])
+        query.eq.assert_any_call('status', 'draft')
+        assert query.update.call_args.args[0]['status'] == 'processing'
+    
+    @pytest.mark.asyncio
+    async def test_get_batch_enrichment_counts_uses_database_function(self):
+        """Test that batch enrichment counts come from one database function call."""
+        service = DatabaseService()
+        batch_id = uuid4()
+        row = {
+            "total_products": 4,
+            "completed_products": 2,
+            "failed_products": 1,
+            "processing_products": 0,
+            "pending_products": 1,
+            "avg_confidence_score": 87.5
+        }
+        
+        with patch.object(service.client, 'rpc') as mock_rpc:
+            mock_rpc.return_value.execute.return_value = Mock(data=[row])
+            
+            counts = await service.get_batch_enrichment_counts(batch_id)
+        
+        mock_rpc.assert_called_once_with('get_batch_enrichment_status', {'batch_uuid': str(batch_id)})
+        assert counts == row
+    
+    @pytest.mark.asyncio
+    async def test_get_batch_enrichment_counts_without_database_function(self):
+        """Test that batch products are counted locally when the function is not deployed."""
+        service = DatabaseService()
+        rows = [
+            {"id": "1", "status": "ready", "scraping_confidence": 90},
+            {"id": "2", "status": "ready", "scraping_confidence": 80},
+            {"id": "3", "status": "failed", "scraping_confidence": 0},
+            {"id": "4", "status": "draft", "scraping_confidence": 0}
+        ]
+        
+        query = Mock()
+        for method in ('select', 'eq', 'gt', 'order', 'limit'):
+            getattr(query, method).return_value = query
+        query.execute.return_value = Mock(data=rows)
+        
+        with patch.object(service.client, 'rpc') as mock_rpc, \
+             patch.object(service.client, 'table', return_value=query):
+            mock_rpc.return_value.execute.side_effect = APIError(
+                {"code": "PGRST202", "message": "Could not find the function"}
+            )
+            
+            counts = await service.get_batch_enrichment_counts(uuid4())
+        
+        assert counts == {
+            "total_products": 4,
+            "completed_products": 2,
+            "failed_products": 1,
+            "processing_products": 0,
+            "pending_products": 1,
+            "avg_confidence_score": 85.0
+        }
+
+
 class TestDatabaseUtils:
     """Test cases for database utility functions."""
     
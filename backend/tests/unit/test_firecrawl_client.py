@@ -5,9 +5,12 @@ Tests the Firecrawl API wrapper with mocked HTTP requests,
 following patterns from existing connectivity tests.
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, Mock, patch
 import httpx
+import orjson
 from datetime import datetime
 
 from app.services.firecrawl_client import FirecrawlClient, get_firecrawl_client
@@ -15,11 +18,25 @@ from app.models.enrichment import FirecrawlResponse, EnrichmentConfig
 from app.exceptions.enrichment import FirecrawlAPIError, ConfigurationError
 
 
+@pytest.fixture
+def firecrawl_config():
+    """Minimal client configuration; test classes override it as needed."""
+    return EnrichmentConfig(firecrawl_api_key="test-api-key")
+
+
+@pytest_asyncio.fixture
+async def firecrawl_client(firecrawl_config):
+    """Create FirecrawlClient with test configuration and close it afterwards."""
+    client = FirecrawlClient(firecrawl_config)
+    yield client
+    await client.aclose()
+
+
 class TestFirecrawlClient:
     """Test suite for FirecrawlClient."""
     
     @pytest.fixture
-    def mock_config(self):
+    def firecrawl_config(self):
         """Mock enrichment configuration."""
         return EnrichmentConfig(
             firecrawl_api_key="test-api-key",
@@ -30,11 +47,6 @@ class TestFirecrawlClient:
             retry_delay=2
         )
     
-    @pytest.fixture
-    def firecrawl_client(self, mock_config):
-        """Create FirecrawlClient with test configuration."""
-        return FirecrawlClient(mock_config)
-    
     @pytest.fixture
     def sample_firecrawl_response(self):
         """Sample successful Firecrawl API response."""
@@ -58,13 +70,11 @@ class TestFirecrawlClient:
         """Test successful page scraping."""
         url = "https://www.lawnfawn.com/products/test-product"
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = sample_firecrawl_response
+            mock_response.content = orjson.dumps(sample_firecrawl_response)
             mock_response.raise_for_status = Mock()
             mock_client.post.return_value = mock_response
             
@@ -97,16 +107,14 @@ class TestFirecrawlClient:
         """Test handling of Firecrawl API errors."""
         url = "https://www.lawnfawn.com/products/test-product"
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             
             mock_response = Mock()
             mock_response.status_code = 400
-            mock_response.json.return_value = {
+            mock_response.content = orjson.dumps({
                 "success": False,
                 "error": "Invalid URL format"
-            }
+            })
             mock_client.post.return_value = mock_response
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Bad Request", request=Mock(), response=mock_response
@@ -124,9 +132,7 @@ class TestFirecrawlClient:
         """Test handling of timeout errors."""
         url = "https://www.lawnfawn.com/products/test-product"
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             mock_client.post.side_effect = httpx.TimeoutException("Request timeout")
             
             # Execute and verify exception
@@ -140,9 +146,7 @@ class TestFirecrawlClient:
         """Test handling of connection errors."""
         url = "https://www.lawnfawn.com/products/test-product"
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             mock_client.post.side_effect = httpx.ConnectError("Connection failed")
             
             # Execute and verify exception
@@ -156,16 +160,14 @@ class TestFirecrawlClient:
         """Test handling of unsuccessful Firecrawl responses."""
         url = "https://www.lawnfawn.com/products/test-product"
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {
+            mock_response.content = orjson.dumps({
                 "success": False,
                 "error": "Page not found or blocked"
-            }
+            })
             mock_response.raise_for_status = Mock()
             mock_client.post.return_value = mock_response
             
@@ -187,17 +189,15 @@ class TestFirecrawlClient:
             "formats": ["html"]
         }
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {
+            mock_response.content = orjson.dumps({
                 "success": True,
                 "data": {"content": "<html>test</html>"},
                 "credits_used": 1
-            }
+            })
             mock_response.raise_for_status = Mock()
             mock_client.post.return_value = mock_response
             
@@ -241,9 +241,7 @@ class TestFirecrawlClient:
             "credits_used": 2
         }
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             
             mock_response = Mock()
             mock_response.status_code = 200
@@ -273,9 +271,7 @@ class TestFirecrawlClient:
             }
         }
         
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             
             mock_response = Mock()
             mock_response.status_code = 200
@@ -301,12 +297,11 @@ class TestFirecrawlClient:
     @pytest.mark.asyncio
     async def test_health_check_success(self, firecrawl_client):
         """Test health check functionality."""
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             
             mock_response = Mock()
             mock_response.status_code = 200
+            mock_response.is_success = True
             mock_response.json.return_value = {"status": "ok"}
             mock_response.raise_for_status = Mock()
             mock_client.get.return_value = mock_response
@@ -322,9 +317,7 @@ class TestFirecrawlClient:
     @pytest.mark.asyncio
     async def test_health_check_failure(self, firecrawl_client):
         """Test health check when API is down."""
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
             mock_client.get.side_effect = httpx.ConnectError("Connection failed")
             
             # Execute
@@ -360,6 +353,331 @@ class TestFirecrawlClient:
         assert "Invalid Firecrawl base URL" in str(exc_info.value)
 
 
+class TestDetect404Content:
+    """Test 404 page detection on scraped content."""
+    
+    @pytest.fixture
+    def product_page(self):
+        """Regular product page content long enough to pass the length check."""
+        return "<html><body><h1>Stitched Rectangle Frames</h1>" + "<p>Lovely dies.</p>" * 20 + "</body></html>"
+    
+    def test_empty_content(self, firecrawl_client):
+        """Test that empty content is not flagged."""
+        assert firecrawl_client._detect_404_content("", "https://example.com") is False
+    
+    def test_regular_page(self, firecrawl_client, product_page):
+        """Test that a regular product page is not flagged."""
+        assert firecrawl_client._detect_404_content(product_page, "https://example.com/p") is False
+    
+    def test_generic_indicator_case_insensitive(self, firecrawl_client, product_page):
+        """Test that generic indicators are matched regardless of case."""
+        content = product_page + "<p>Sorry, PAGE NOT FOUND</p>"
+        assert firecrawl_client._detect_404_content(content, "https://example.com/p") is True
+    
+    def test_short_content(self, firecrawl_client):
+        """Test that very short content is flagged as an error page."""
+        assert firecrawl_client._detect_404_content("<html></html>", "https://example.com") is True
+    
+    def test_indicator_beyond_scanned_prefix_ignored(self, firecrawl_client, product_page):
+        """Test that only the head of long content is scanned for indicators."""
+        content = product_page + " " * 4096 + "<footer>Error 404 help</footer>"
+        assert firecrawl_client._detect_404_content(content, "https://example.com/p") is False
+    
+    def test_lawnfawn_pattern_only_for_lawnfawn_urls(self, firecrawl_client, product_page):
+        """Test that LawnFawn-specific patterns only apply to lawnfawn.com URLs."""
+        content = product_page + "<a href='/'>Back to Home</a>"
+        
+        assert firecrawl_client._detect_404_content(content, "https://example.com/p") is False
+        assert firecrawl_client._detect_404_content(
+            content, "https://www.LawnFawn.com/products/missing"
+        ) is True
+
+
+class TestScrapeResponseCache:
+    """Test response caching and request coalescing in scrape_page."""
+    
+    @pytest.fixture
+    def success_response(self):
+        """Successful scrape response for a LawnFawn product page."""
+        return FirecrawlResponse(
+            url="https://www.lawnfawn.com/products/test-product",
+            content="<html><body><h1>Test Product</h1></body></html>",
+            success=True
+        )
+    
+    @pytest.mark.asyncio
+    async def test_repeated_scrape_served_from_cache(self, firecrawl_client, success_response):
+        """Test that a second scrape of the same URL does not call the API."""
+        with patch.object(
+            firecrawl_client, '_scrape_page', new_callable=AsyncMock, return_value=success_response
+        ) as mock_scrape:
+            first = await firecrawl_client.scrape_page(success_response.url)
+            second = await firecrawl_client.scrape_page(success_response.url)
+        
+        assert first is second
+        mock_scrape.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_options_are_part_of_cache_key(self, firecrawl_client, success_response):
+        """Test that different scrape options are cached separately."""
+        with patch.object(
+            firecrawl_client, '_scrape_page', new_callable=AsyncMock, return_value=success_response
+        ) as mock_scrape:
+            await firecrawl_client.scrape_page(success_response.url)
+            await firecrawl_client.scrape_page(success_response.url, waitFor=5000)
+        
+        assert mock_scrape.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_failed_response_not_cached(self, firecrawl_client):
+        """Test that unsuccessful scrapes are retried on the next call."""
+        failed = FirecrawlResponse(
+            url="https://www.lawnfawn.com/products/missing",
+            content="",
+            success=False,
+            error_message="404 Page Not Found"
+        )
+        
+        with patch.object(
+            firecrawl_client, '_scrape_page', new_callable=AsyncMock, return_value=failed
+        ) as mock_scrape:
+            await firecrawl_client.scrape_page(failed.url)
+            await firecrawl_client.scrape_page(failed.url)
+        
+        assert mock_scrape.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_scrapes_coalesced(self, firecrawl_client, success_response):
+        """Test that concurrent scrapes of the same URL share one API call."""
+        async def slow_scrape(url, **kwargs):
+            await asyncio.sleep(0.01)
+            return success_response
+        
+        with patch.object(
+            firecrawl_client, '_scrape_page', new_callable=AsyncMock, side_effect=slow_scrape
+        ) as mock_scrape:
+            results = await asyncio.gather(
+                *[firecrawl_client.scrape_page(success_response.url) for _ in range(5)]
+            )
+        
+        assert all(result is success_response for result in results)
+        mock_scrape.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, success_response):
+        """Test that the least recently used entry is evicted when full."""
+        client = FirecrawlClient(
+            EnrichmentConfig(firecrawl_api_key="test-api-key", cache_max_entries=2)
+        )
+        
+        with patch.object(
+            client, '_scrape_page', new_callable=AsyncMock, return_value=success_response
+        ) as mock_scrape:
+            await client.scrape_page("https://example.com/a")
+            await client.scrape_page("https://example.com/b")
+            await client.scrape_page("https://example.com/a")
+            await client.scrape_page("https://example.com/c")
+            await client.scrape_page("https://example.com/a")
+            await client.scrape_page("https://example.com/b")
+        
+        # a, b, c fetched once each; b re-fetched after being evicted by c
+        assert mock_scrape.await_count == 4
+
+
+class TestScrapeManyAndRateLimit:
+    """Test batch scraping and the token-bucket rate limiter."""
+    
+    @pytest.fixture
+    def firecrawl_config(self):
+        """Configuration with a one-per-second rate and a burst of two."""
+        return EnrichmentConfig(
+            firecrawl_api_key="test-api-key",
+            rate_limit_requests_per_minute=60,
+            rate_limit_burst=2
+        )
+    
+    @pytest.mark.asyncio
+    async def test_scrape_many_preserves_order_and_wraps_errors(self, firecrawl_client):
+        """Test that results follow input order and exceptions become failed responses."""
+        async def fake_scrape(url, **kwargs):
+            if url.endswith("/broken"):
+                raise FirecrawlAPIError("Firecrawl API returned 500", url=url)
+            return FirecrawlResponse(url=url, content="<html>ok</html>", success=True)
+        
+        urls = [
+            "https://www.lawnfawn.com/products/a",
+            "https://www.lawnfawn.com/products/broken",
+            "https://www.lawnfawn.com/products/c"
+        ]
+        
+        with patch.object(firecrawl_client, 'scrape_page', side_effect=fake_scrape):
+            results = await firecrawl_client.scrape_many(urls, concurrency=2)
+        
+        assert [r.url for r in results] == urls
+        assert [r.success for r in results] == [True, False, True]
+        assert "500" in results[1].error_message
+    
+    @pytest.mark.asyncio
+    async def test_batch_scrape_falls_back_for_missing_pages(self, firecrawl_client):
+        """Test that pages absent from the batch job are scraped individually."""
+        urls = [
+            "https://www.lawnfawn.com/products/a",
+            "https://www.lawnfawn.com/products/b",
+            "https://www.lawnfawn.com/products/c"
+        ]
+        batched = {
+            url: FirecrawlResponse(url=url, content="<html>ok</html>", success=True)
+            for url in urls[:2]
+        }
+        fallback = [FirecrawlResponse(url=urls[2], content="<html>ok</html>", success=True)]
+        
+        with patch.object(
+            firecrawl_client, '_batch_scrape', new_callable=AsyncMock, return_value=batched
+        ) as mock_batch, patch.object(
+            firecrawl_client, 'scrape_many', new_callable=AsyncMock, return_value=fallback
+        ) as mock_many:
+            results = await firecrawl_client.batch_scrape(urls)
+            cached = await firecrawl_client.batch_scrape(urls[:2])
+        
+        assert [r.url for r in results] == urls
+        mock_batch.assert_awaited_once()
+        mock_many.assert_awaited_once_with([urls[2]])
+        assert cached == [batched[urls[0]], batched[urls[1]]]
+    
+    @pytest.mark.asyncio
+    async def test_batch_scrape_job_failure_scrapes_per_url(self, firecrawl_client):
+        """Test that a failed batch job falls back to per-URL scraping."""
+        urls = ["https://www.lawnfawn.com/products/a", "https://www.lawnfawn.com/products/b"]
+        fallback = [FirecrawlResponse(url=url, content="<html>ok</html>", success=True) for url in urls]
+        
+        with patch.object(
+            firecrawl_client, '_batch_scrape', new_callable=AsyncMock,
+            side_effect=FirecrawlAPIError("Firecrawl API returned 500")
+        ), patch.object(
+            firecrawl_client, 'scrape_many', new_callable=AsyncMock, return_value=fallback
+        ) as mock_many:
+            results = await firecrawl_client.batch_scrape(urls)
+        
+        assert results == fallback
+        mock_many.assert_awaited_once_with(urls)
+    
+    @pytest.mark.asyncio
+    async def test_batch_job_charges_each_url_and_returns_v0_pages(self, firecrawl_client):
+        """Test that batch jobs take one rate-limit token per URL and yield v0-shaped pages."""
+        urls = ["https://www.lawnfawn.com/products/a", "https://www.lawnfawn.com/products/b"]
+        markdown = "# Product\n\n" + "Product description. " * 10
+        
+        def api_response(body):
+            response = Mock()
+            response.status_code = 200
+            response.is_success = True
+            response.content = orjson.dumps(body)
+            return response
+        
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client, \
+             patch.object(firecrawl_client, '_wait_for_rate_limit', new_callable=AsyncMock) as mock_rate, \
+             patch.object(firecrawl_client, '_wait_for_domain_slot', new_callable=AsyncMock) as mock_domain, \
+             patch('app.services.firecrawl_client.asyncio.sleep', new_callable=AsyncMock):
+            mock_client.post.return_value = api_response({"success": True, "id": "job-1"})
+            mock_client.get.return_value = api_response({
+                "status": "completed",
+                "data": [
+                    {"markdown": markdown, "metadata": {"sourceURL": url, "statusCode": 200}}
+                    for url in urls
+                ]
+            })
+            
+            responses = await firecrawl_client._batch_scrape(urls)
+        
+        assert mock_rate.await_count == 2
+        assert [call.args[0] for call in mock_domain.await_args_list] == urls
+        assert set(responses) == set(urls)
+        page = responses[urls[0]]
+        assert page.success is True
+        assert page.content == markdown
+        assert page.metadata == {"sourceURL": urls[0], "pageStatusCode": 200}
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_when_bucket_empty(self, firecrawl_client):
+        """Test that requests beyond the burst wait for the bucket to refill."""
+        with patch('app.services.firecrawl_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            # The burst of two goes through without waiting
+            await firecrawl_client._wait_for_rate_limit()
+            await firecrawl_client._wait_for_rate_limit()
+            mock_sleep.assert_not_awaited()
+            
+            await firecrawl_client._wait_for_rate_limit()
+            mock_sleep.assert_awaited_once()
+            
+            # 60 requests per minute refills one token per second
+            wait_time = mock_sleep.await_args.args[0]
+            assert 0.9 < wait_time <= 1.0
+    
+    @pytest.mark.asyncio
+    async def test_domain_delay_spaces_same_domain_only(self, firecrawl_client):
+        """Test that repeat scrapes of one domain wait while other domains do not."""
+        with patch('app.services.firecrawl_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await firecrawl_client._wait_for_domain_slot("https://www.lawnfawn.com/products/a")
+            await firecrawl_client._wait_for_domain_slot("https://example.com/products/a")
+            mock_sleep.assert_not_awaited()
+            
+            await firecrawl_client._wait_for_domain_slot("https://www.lawnfawn.com/products/b")
+            mock_sleep.assert_awaited_once()
+            
+            # Default delay is 200ms between scrapes of the same domain
+            wait_time = mock_sleep.await_args.args[0]
+            assert 0.1 < wait_time <= 0.2
+
+class TestScrapeFormats:
+    """Test the output formats requested from the Firecrawl API."""
+    
+    @pytest.fixture
+    def mock_response(self):
+        """Successful API response with markdown content."""
+        response = Mock()
+        response.status_code = 200
+        response.is_success = True
+        response.content = orjson.dumps({
+            "success": True,
+            "data": {
+                "content": "# Test Product\n\n" + "Product description. " * 10,
+                "markdown": "# Test Product\n\n" + "Product description. " * 10
+            }
+        })
+        return response
+    
+    @pytest.mark.asyncio
+    async def test_markdown_only_by_default(self, firecrawl_client, mock_response):
+        """Test that only markdown is requested unless formats are given."""
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
+            mock_client.post.return_value = mock_response
+            
+            result = await firecrawl_client.scrape_page("https://example.com/p")
+        
+        assert result.success is True
+        assert mock_client.post.call_args.kwargs["json"]["formats"] == ["markdown"]
+    
+    @pytest.mark.asyncio
+    async def test_raw_data_excludes_page_payload(self, firecrawl_client, mock_response):
+        """Test that the lifted page payload is not duplicated in raw_data."""
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
+            mock_client.post.return_value = mock_response
+            
+            result = await firecrawl_client.scrape_page("https://example.com/p")
+        
+        assert result.raw_data == {"success": True}
+    
+    @pytest.mark.asyncio
+    async def test_explicit_formats(self, firecrawl_client, mock_response):
+        """Test that explicitly requested formats are sent to the API."""
+        with patch.object(firecrawl_client, '_client', new_callable=AsyncMock) as mock_client:
+            mock_client.post.return_value = mock_response
+            
+            await firecrawl_client.scrape_page("https://example.com/p", formats=["markdown", "html"])
+        
+        assert mock_client.post.call_args.kwargs["json"]["formats"] == ["markdown", "html"]
+
+
 class TestFirecrawlClientSingleton:
     """Test singleton pattern for Firecrawl client."""
     
@@ -417,7 +735,7 @@ class TestFirecrawlResponseModel:
         
         assert response.markdown == ""
         assert response.metadata == {}
-        assert response.raw_data == {}
+        assert response.raw_data is None
         assert response.error_message is None
         assert response.credits_used == 1
         assert response.processing_time_ms is None
@@ -0,0 +1,497 @@
+"""
+Unit tests for the invoice processing pipeline.
+
+This module tests InvoiceProcessorService orchestration with all
+external services (PDF parser, S3, database) mocked.
+"""
+
+import asyncio
+import hashlib
+import time
+import pdfplumber
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.models.invoice import (
+    SupplierDetectionResult,
+    DetectionMethod,
+    InvoiceUploadResponse,
+    InvoiceParsingResult,
+    InvoiceMetadata,
+    ParsedProduct
+)
+from app.parsers import LawnFawnParsingStrategy
+from app.services.pdf_parser import PDFParserService
+from app.services.invoice_processor import (
+    PARSING_STRATEGY_ENTRY_POINT_GROUP,
+    InvoiceProcessorService,
+    _InvoiceJob,
+    _extract_pdf_content,
+    _extract_pdf_pages,
+    get_invoice_processor,
+    reset_invoice_processor
+)
+
+
+class TestInvoicePipeline:
+    """Test suite for the invoice processing stages."""
+    
+    @pytest.fixture
+    def processor(self):
+        """Create processor with mocked collaborators."""
+        with patch('app.services.invoice_processor.PDFParserService'), \
+             patch('app.services.invoice_processor.SupplierDetectionService'), \
+             patch('app.services.invoice_processor.S3InvoiceManager'), \
+             patch('app.services.invoice_processor.DatabaseService'):
+            processor = InvoiceProcessorService()
+        
+        processor.pdf_parser.validate_pdf_file.side_effect = lambda data: data != b"not a pdf"
+        processor.pdf_parser.extract_text_and_tables.return_value = ("Lawn Fawn invoice", [])
+        processor.supplier_detector.detect_supplier.return_value = SupplierDetectionResult(
+            supplier_code="lawnfawn",
+            confidence=0.95,
+            matched_patterns=["Lawn Fawn"],
+            detection_method=DetectionMethod.COMPANY_NAME
+        )
+        
+        parsing_result = MagicMock()
+        parsing_result.products = []
+        parsing_result.parsing_success_rate = 100.0
+        parsing_result.metadata.total_amount = None
+        parsing_result.metadata.invoice_number = "INV-1"
+        parsing_result.metadata.invoice_date = None
+        parsing_result.metadata.currency = "USD"
+        processor._strategy_classes = {'lawnfawn': MagicMock()}
+        processor._strategy_classes['lawnfawn'].return_value.parse_invoice.return_value = parsing_result
+        
+        processor.s3_manager.upload_invoice.side_effect = lambda data, supplier, filename: {
+            's3_key': f"invoices/{supplier}/{filename}",
+            's3_url': f"s3://bucket/invoices/{supplier}/{filename}"
+        }
+        processor.s3_manager.generate_download_url.side_effect = lambda key: (
+            f"https://example.com/{key}?signature", datetime.utcnow() + timedelta(hours=1)
+        )
+        processor.db_service = AsyncMock()
+        processor.db_service.get_supplier_by_code.return_value = MagicMock(id=uuid4())
+        processor.db_service.get_completed_batch_by_hash.return_value = None
+        processor.db_service.create_products_bulk.side_effect = lambda rows: len(rows)
+        
+        return processor
+    
+    @pytest.mark.asyncio
+    async def test_batch_results_keep_input_order(self, processor):
+        """Test that every invoice gets a response in input order."""
+        files = [
+            (b"%PDF-1\n%%EOF\n", "first.pdf"),
+            (b"not a pdf", "broken.pdf"),
+            (b"%PDF-3\n%%EOF\n", "third.pdf"),
+        ]
+        
+        responses = await processor.process_invoice_batch(files)
+        
+        assert len(responses) == 3
+        assert all(isinstance(response, InvoiceUploadResponse) for response in responses)
+        assert responses[0].success is True
+        assert responses[0].s3_key == "invoices/lawnfawn/first.pdf"
+        assert responses[1].success is False
+        assert responses[1].error == "invalid_file"
+        assert responses[2].success is True
+        assert responses[2].s3_key == "invoices/lawnfawn/third.pdf"
+        
+        # Invalid file never reaches upload or storage
+        assert processor.s3_manager.upload_invoice.call_count == 2
+        assert processor.db_service.update_upload_batch.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_stage_error_does_not_stop_pipeline(self, processor):
+        """Test that an unexpected stage error only fails that invoice."""
+        processor.db_service.update_upload_batch.side_effect = [Exception("db down"), None]
+        
+        responses = await processor.process_invoice_batch([
+            (b"%PDF-1\n%%EOF\n", "first.pdf"),
+            (b"%PDF-2\n%%EOF\n", "second.pdf"),
+        ])
+        
+        assert responses[0].success is False
+        assert responses[0].error == "database_error"
+        await asyncio.gather(*processor._background_tasks)
+        processor.db_service.enqueue_s3_orphan.assert_awaited_once_with("invoices/lawnfawn/first.pdf")
+        processor.s3_manager.delete_invoice.assert_not_called()
+        assert "invoices/lawnfawn/first.pdf" not in processor._download_urls
+        assert responses[1].success is True
+    
+    @pytest.mark.asyncio
+    async def test_single_invoice_parse_failure_removes_upload(self, processor):
+        """Test that a failed parse cleans up the concurrently uploaded file."""
+        processor._strategy_classes['lawnfawn'].return_value.parse_invoice.side_effect = ValueError("bad table")
+        
+        response = await processor.process_invoice(b"%PDF-1\n%%EOF\n", "first.pdf")
+        
+        assert response.success is False
+        assert response.error == "processing_failed"
+        processor.s3_manager.upload_invoice.assert_called_once()
+        await asyncio.gather(*processor._background_tasks)
+        processor.db_service.enqueue_s3_orphan.assert_awaited_once_with("invoices/lawnfawn/first.pdf")
+        processor.db_service.create_upload_batch.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_already_processed_file_returns_earlier_batch(self, processor):
+        """Test that a re-uploaded file short-circuits to its completed batch."""
+        earlier_batch_id = str(uuid4())
+        processor.db_service.get_completed_batch_by_hash.return_value = {
+            'id': earlier_batch_id,
+            'supplier_code': 'lawnfawn',
+            'total_products': 3,
+            'parsing_success_rate': 100.0,
+            'invoice_number': 'INV-1',
+            'invoice_date': None,
+            'currency_code': 'USD',
+            'total_amount_original': None,
+            's3_key': 'invoices/lawnfawn/first.pdf'
+        }
+        
+        response = await processor.process_invoice(b"%PDF-1\n%%EOF\n", "retry.pdf")
+        
+        assert response.success is True
+        assert response.batch_id == earlier_batch_id
+        assert response.download_url == "https://example.com/invoices/lawnfawn/first.pdf?signature"
+        processor.db_service.get_completed_batch_by_hash.assert_awaited_once_with(
+            hashlib.sha256(b"%PDF-1\n%%EOF\n").hexdigest()
+        )
+        processor.pdf_parser.extract_text_and_tables.assert_not_called()
+        processor.s3_manager.upload_invoice.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_s3_calls_queue_beyond_capacity(self, processor):
+        """Test that S3 calls over the concurrency limit wait for a free slot."""
+        processor._s3_slots = asyncio.Semaphore(1)
+        seen_stats = []
+        
+        def s3_call():
+            time.sleep(0.05)
+            seen_stats.append(processor.get_queue_stats())
+        
+        await asyncio.gather(processor._run_s3(s3_call), processor._run_s3(s3_call))
+        
+        assert seen_stats[0]['s3_in_flight'] == 1
+        assert seen_stats[0]['s3_waiting'] == 1
+        assert seen_stats[1]['s3_waiting'] == 0
+        assert processor.get_queue_stats()['s3_in_flight'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_orphan_deleted_directly_when_queue_unavailable(self, processor):
+        """Test that an orphan is deleted from S3 if it cannot be queued."""
+        processor.db_service.enqueue_s3_orphan.side_effect = Exception("db down")
+        
+        await processor._enqueue_orphan_cleanup("invoices/lawnfawn/first.pdf")
+        
+        processor.s3_manager.delete_invoice.assert_called_once_with("invoices/lawnfawn/first.pdf")
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_orphans_that_fail_to_delete(self, processor):
+        """Test that only deleted orphans are removed from the queue."""
+        processor.db_service.get_s3_orphans.return_value = [
+            {'id': 'a', 's3_key': 'invoices/a.pdf'},
+            {'id': 'b', 's3_key': 'invoices/b.pdf'},
+        ]
+        
+        def delete_invoice(s3_key):
+            if s3_key == 'invoices/b.pdf':
+                raise Exception("access denied")
+            return True
+        
+        processor.s3_manager.delete_invoice.side_effect = delete_invoice
+        
+        deleted = await processor.cleanup_s3_orphans()
+        
+        assert deleted == 1
+        processor.db_service.delete_s3_orphans.assert_awaited_once_with(['a'])
+
+    
+    @pytest.mark.asyncio
+    async def test_download_url_reused_until_near_expiry(self, processor):
+        """Test that presigned URLs are cached per S3 key."""
+        processor.db_service = AsyncMock()
+        processor.db_service.get_upload_batch_by_id.return_value = MagicMock(s3_key="invoices/a.pdf")
+        
+        first = await processor.generate_invoice_download_url(str(uuid4()))
+        second = await processor.generate_invoice_download_url(str(uuid4()))
+        
+        assert first == second == "https://example.com/invoices/a.pdf?signature"
+        processor.s3_manager.generate_download_url.assert_called_once()
+        
+        # URLs close to expiry are regenerated
+        processor._download_urls["invoices/a.pdf"] = (first, datetime.utcnow() + timedelta(minutes=1))
+        await processor.generate_invoice_download_url(str(uuid4()))
+        assert processor.s3_manager.generate_download_url.call_count == 2
+
+    
+    @pytest.mark.asyncio
+    async def test_extraction_uses_process_pool_when_enabled(self, processor):
+        """Test that PDF extraction is submitted to the process pool if configured."""
+        processor.pdf_process_pool = MagicMock()
+        processor.pdf_process_pool.submit.return_value.result.return_value = ("Lawn Fawn invoice", [])
+        
+        response = await processor.process_invoice(b"%PDF-1\n%%EOF\n", "first.pdf")
+        
+        assert response.success is True
+        processor.pdf_process_pool.submit.assert_called_once_with(_extract_pdf_content, b"%PDF-1\n%%EOF\n")
+        processor.pdf_parser.extract_text_and_tables.assert_not_called()
+
+    def test_long_pdf_split_into_page_ranges(self, processor):
+        """Test that long invoices are extracted in page ranges and merged in order."""
+        processor.settings = processor.settings.model_copy(update={'pdf_parser_processes': 2})
+        processor.pdf_process_pool = MagicMock()
+        processor.pdf_parser.get_page_count.return_value = 5
+        
+        def submit(func, file_data, page_numbers):
+            future = MagicMock()
+            future.result.return_value = (
+                "".join(f"page {n}\n" for n in page_numbers),
+                [[[f"table {n}"]] for n in page_numbers]
+            )
+            return future
+        
+        processor.pdf_process_pool.submit.side_effect = submit
+        
+        text, tables = processor._extract_content(b"%PDF-1\n%%EOF\n")
+        
+        submitted = [call.args for call in processor.pdf_process_pool.submit.call_args_list]
+        assert submitted == [
+            (_extract_pdf_pages, b"%PDF-1\n%%EOF\n", [1, 2, 3]),
+            (_extract_pdf_pages, b"%PDF-1\n%%EOF\n", [4, 5]),
+        ]
+        assert text == "page 1\npage 2\npage 3\npage 4\npage 5"
+        assert tables == [[[f"table {n}"]] for n in range(1, 6)]
+    
+    def test_extracted_content_reused_by_file_hash(self, processor):
+        """Test that extraction results are cached by hash within the size bound."""
+        processor.pdf_parser.extract_text_and_tables.side_effect = lambda data: (
+            data.decode(), [[["LF2538", "2"]]]
+        )
+        
+        with patch('app.services.invoice_processor.EXTRACTED_CONTENT_CACHE_MAX_CHARS', 20):
+            first = processor._extract_content(b"first", "hash-1")
+            assert processor._extract_content(b"first", "hash-1") == first
+            assert processor.pdf_parser.extract_text_and_tables.call_count == 1
+        
+            # A second file pushes the cache over its size, evicting the oldest
+            processor._extract_content(b"second", "hash-2")
+            processor._extract_content(b"first", "hash-1")
+        
+        assert processor.pdf_parser.extract_text_and_tables.call_count == 3
+        assert list(processor._extracted_content) == ["hash-1"]
+        assert processor._extracted_content_chars == 12
+
+    
+    @pytest.mark.asyncio
+    async def test_no_pdf_left_open_after_cached_extraction(self, processor):
+        """Test that the validated document is closed when extraction hits the cache."""
+        file_data = (Path(__file__).parent.parent / "fixtures" / "test_invoice.pdf").read_bytes()
+        processor.pdf_parser = PDFParserService()
+        processor._extracted_content[hashlib.sha256(file_data).hexdigest()] = ("Lawn Fawn invoice", [], 17)
+        
+        opened = []
+        closed = []
+        open_pdf = pdfplumber.open
+        close_pdf = pdfplumber.PDF.close
+        
+        def tracking_open(*args, **kwargs):
+            pdf = open_pdf(*args, **kwargs)
+            opened.append(pdf)
+            return pdf
+        
+        def tracking_close(pdf):
+            closed.append(pdf)
+            close_pdf(pdf)
+        
+        with patch('app.services.pdf_parser.pdfplumber.open', side_effect=tracking_open), \
+             patch.object(pdfplumber.PDF, 'close', autospec=True, side_effect=tracking_close):
+            response = await processor.process_invoice(file_data, "invoice.pdf")
+        
+        assert response.success is True
+        assert len(opened) == 1
+        assert closed == opened
+
+
+    @pytest.mark.asyncio
+    async def test_non_pdf_rejected_before_validation(self, processor):
+        """Test that files without PDF header and trailer skip full validation."""
+        response = await processor.process_invoice(b"%PDF-1 truncated upload", "broken.pdf")
+        
+        assert response.success is False
+        assert response.error == "invalid_file"
+        processor.pdf_parser.validate_pdf_file.assert_not_called()
+
+    
+    @pytest.mark.asyncio
+    async def test_next_chunk_stops_at_size_and_sentinel(self, processor):
+        """Test that chunks are capped at the chunk size and end at the sentinel."""
+        queue = asyncio.Queue()
+        for item in ("a", "b", "c", None):
+            queue.put_nowait(item)
+        
+        with patch('app.services.invoice_processor.PIPELINE_CHUNK_SIZE', 2):
+            assert await processor._next_chunk(queue) == (["a", "b"], False)
+            assert await processor._next_chunk(queue) == (["c"], True)
+    
+    @pytest.mark.asyncio
+    async def test_store_chunk_uses_bulk_inserts(self, processor):
+        """Test that a chunk of invoices is stored with one insert per table."""
+        jobs = []
+        for name in ("first.pdf", "second.pdf"):
+            job = _InvoiceJob(b"%PDF-1\n%%EOF\n", name)
+            job.detection_result = processor.supplier_detector.detect_supplier.return_value
+            job.parsing_result = processor._strategy_classes['lawnfawn'].return_value.parse_invoice.return_value
+            job.s3_info = processor.s3_manager.upload_invoice(job.file_data, "lawnfawn", name)
+            jobs.append(job)
+        
+        await processor._store_chunk(jobs)
+        
+        assert all(job.response.success for job in jobs)
+        processor.db_service.get_supplier_by_code.assert_awaited_once()
+        processor.db_service.create_upload_batches_bulk.assert_awaited_once()
+        assert len(processor.db_service.create_upload_batches_bulk.await_args.args[0]) == 2
+        processor.db_service.create_products_bulk.assert_awaited_once()
+        processor.db_service.create_upload_batch.assert_not_awaited()
+        assert processor.db_service.update_upload_batch.await_count == 2
+
+
+class TestStoreProcessingResults:
+    """Test suite for storing parsed invoices in the database."""
+    
+    @pytest.fixture
+    def processor(self):
+        """Create processor with mocked database service."""
+        with patch('app.services.invoice_processor.PDFParserService'), \
+             patch('app.services.invoice_processor.SupplierDetectionService'), \
+             patch('app.services.invoice_processor.S3InvoiceManager'), \
+             patch('app.services.invoice_processor.DatabaseService'):
+            processor = InvoiceProcessorService()
+        
+        processor.db_service = AsyncMock()
+        processor.db_service.get_supplier_by_code.return_value = MagicMock(id=uuid4())
+        return processor
+    
+    @pytest.fixture
+    def parsing_result(self):
+        """Create parsing result with two products."""
+        products = [
+            ParsedProduct(
+                supplier_sku=f"LF{n}",
+                manufacturer="lawnfawn",
+                manufacturer_sku=f"LF{n}",
+                category="stamps",
+                product_name=f"Product {n}",
+                quantity=1,
+                price_usd=Decimal("5.00"),
+                line_total_usd=Decimal("5.00"),
+                raw_description=f"LF{n} Product {n}",
+                line_number=n
+            )
+            for n in (1, 2)
+        ]
+        return InvoiceParsingResult(
+            supplier="lawnfawn",
+            metadata=InvoiceMetadata(invoice_number="INV-1"),
+            products=products,
+            total_products=len(products),
+            parsing_success_rate=100.0
+        )
+    
+    @pytest.fixture
+    def detection_result(self):
+        """Create supplier detection result."""
+        return SupplierDetectionResult(
+            supplier_code="lawnfawn",
+            confidence=0.95,
+            matched_patterns=["Lawn Fawn"],
+            detection_method=DetectionMethod.COMPANY_NAME
+        )
+    
+    async def _store(self, processor, detection_result, parsing_result):
+        """Store results and return the final batch update."""
+        await processor.store_processing_results(
+            str(uuid4()),
+            detection_result,
+            parsing_result,
+            {'s3_key': 'invoices/lawnfawn/a.pdf', 's3_url': 'https://bucket/a.pdf'},
+            "a.pdf",
+            100
+        )
+        return processor.db_service.update_upload_batch.await_args.args[1]
+    
+    @pytest.mark.asyncio
+    async def test_products_inserted_in_one_bulk_call(self, processor, detection_result, parsing_result):
+        """Test that all products are stored with a single insert."""
+        processor.db_service.create_products_bulk.side_effect = lambda rows: len(rows)
+        
+        batch_update = await self._store(processor, detection_result, parsing_result)
+        
+        processor.db_service.create_products_bulk.assert_awaited_once()
+        product_rows = processor.db_service.create_products_bulk.await_args.args[0]
+        assert len(product_rows) == 2
+        assert product_rows[0].supplier_price_usd == Decimal("5.00")
+        processor.db_service.create_product.assert_not_awaited()
+        assert batch_update.processed_products == 2
+        assert batch_update.failed_products == 0
+    
+    @pytest.mark.asyncio
+    async def test_bulk_failure_falls_back_to_single_inserts(
+        self, processor, detection_result, parsing_result
+    ):
+        """Test that a rejected bulk insert still stores the valid products."""
+        processor.db_service.create_products_bulk.side_effect = Exception("duplicate key")
+        processor.db_service.create_product.side_effect = [MagicMock(), None]
+        
+        batch_update = await self._store(processor, detection_result, parsing_result)
+        
+        assert processor.db_service.create_product.await_count == 2
+        assert batch_update.processed_products == 1
+        assert batch_update.failed_products == 1
+
+
+class TestInvoiceProcessorFactory:
+    """Test suite for the shared invoice processor."""
+    
+    def test_processor_is_shared_and_strategies_are_not(self):
+        """Test that the processor is reused but each parse gets its own strategy."""
+        reset_invoice_processor()
+        try:
+            with patch('app.services.invoice_processor.PDFParserService'), \
+                 patch('app.services.invoice_processor.SupplierDetectionService'), \
+                 patch('app.services.invoice_processor.S3InvoiceManager') as mock_s3_class, \
+                 patch('app.services.invoice_processor.DatabaseService'):
+                processor = get_invoice_processor()
+                
+                assert get_invoice_processor() is processor
+                mock_s3_class.assert_called_once()
+            
+            first = processor.get_parsing_strategy('lawnfawn')
+            second = processor.get_parsing_strategy('lawnfawn')
+            assert isinstance(first, LawnFawnParsingStrategy)
+            assert first is not second
+            assert processor.get_parsing_strategy('unknown') is None
+        finally:
+            reset_invoice_processor()
+    
+    def test_strategies_discovered_from_grouped_entry_points(self):
+        """Test that entry points in the Python 3.9 dict-of-groups shape are found."""
+        plugin = EntryPoint(
+            name='acme',
+            value='acme_parsers:AcmeParsingStrategy',
+            group=PARSING_STRATEGY_ENTRY_POINT_GROUP
+        )
+        with patch(
+            'app.services.invoice_processor.entry_points',
+            return_value={PARSING_STRATEGY_ENTRY_POINT_GROUP: [plugin]}
+        ):
+            strategies = InvoiceProcessorService._discover_parsing_strategies()
+        
+        assert strategies['acme'] == 'acme_parsers:AcmeParsingStrategy'
+        assert strategies['lawnfawn'] == 'app.parsers.lawnfawn:LawnFawnParsingStrategy'
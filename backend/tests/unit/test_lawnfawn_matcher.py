@@ -5,11 +5,12 @@ Tests SKU extraction, search URL construction, and product matching logic
 with mocked Firecrawl responses.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
-from app.services.lawnfawn_matcher import LawnFawnMatcher, get_lawnfawn_matcher
+from app.services.lawnfawn_matcher import LawnFawnMatcher, get_lawnfawn_matcher, _absolute_url
 from app.models.product import Product
 from app.models.base import ProductStatus
 from app.models.enrichment import (
@@ -147,6 +148,16 @@ class TestSKUExtraction:
         
         # Test with multiple numbers (should get first)
         assert matcher.extract_numeric_sku("LF2538LF1234") == "2538"
+    
+    def test_extract_numeric_sku_cache_respects_pattern(self):
+        """Test that cached extractions are not shared between SKU patterns."""
+        matcher = LawnFawnMatcher()
+        hyphen_only = LawnFawnMatcher()
+        hyphen_only.sku_pattern = r'LF-(\d+)'
+        
+        assert matcher.extract_numeric_sku("LF2538") == "2538"
+        assert hyphen_only.extract_numeric_sku("LF2538") is None
+        assert hyphen_only.extract_numeric_sku("LF-2538") == "2538"
 
 
 class TestSearchURLConstruction:
@@ -483,3 +494,173 @@ class TestErrorHandling:
         # Should handle gracefully and return empty results
         with pytest.raises(SearchError):
             await lawnfawn_matcher.match_product(sample_product)
+
+
+class TestParsedPageCache:
+    """Test reuse of parsed pages for cached Firecrawl responses."""
+    
+    @pytest.fixture
+    def mock_firecrawl_client(self):
+        """Mock Firecrawl client."""
+        mock_client = Mock()
+        mock_client.scrape_page = AsyncMock()
+        return mock_client
+    
+    @pytest.fixture
+    def lawnfawn_matcher(self, mock_firecrawl_client):
+        """Create LawnFawnMatcher with mocked dependencies."""
+        with patch('app.services.lawnfawn_matcher.get_firecrawl_client', return_value=mock_firecrawl_client):
+            return LawnFawnMatcher()
+    
+    @pytest.mark.asyncio
+    async def test_cached_response_is_not_parsed_again(self, lawnfawn_matcher, mock_firecrawl_client):
+        """Test that the same response object is parsed only once."""
+        mock_firecrawl_client.scrape_page.return_value = FirecrawlResponse(
+            url="https://www.lawnfawn.com/search?q=2538",
+            content='<a class="js-prod-link" href="/products/stitched-frames">Stitched Frames</a>',
+            success=True
+        )
+        
+        with patch.object(
+            lawnfawn_matcher, 'extract_product_links', wraps=lawnfawn_matcher.extract_product_links
+        ) as extract:
+            first = await lawnfawn_matcher.search_products("https://www.lawnfawn.com/search?q=2538")
+            second = await lawnfawn_matcher.search_products("https://www.lawnfawn.com/search?q=2538")
+        
+        assert extract.call_count == 1
+        assert first.product_links == second.product_links == [
+            "https://www.lawnfawn.com/products/stitched-frames"
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_new_response_is_parsed(self, lawnfawn_matcher, mock_firecrawl_client):
+        """Test that a fresh response for the same URL is parsed again."""
+        product_url = "https://www.lawnfawn.com/products/stitched-frames"
+        mock_firecrawl_client.scrape_page.side_effect = [
+            FirecrawlResponse(url=product_url, content="<h1>Old Name</h1>", success=True),
+            FirecrawlResponse(url=product_url, content="<h1>New Name</h1>", success=True),
+        ]
+        
+        first = await lawnfawn_matcher.scrape_product_page(product_url)
+        second = await lawnfawn_matcher.scrape_product_page(product_url)
+        
+        assert first.name == "Old Name"
+        assert second.name == "New Name"
+
+
+class TestCandidateScraping:
+    """Test scraping of ranked search result candidates."""
+    
+    @pytest.fixture
+    def lawnfawn_matcher(self):
+        """Create LawnFawnMatcher with a short hedge delay."""
+        with patch('app.services.lawnfawn_matcher.get_firecrawl_client', return_value=Mock()):
+            matcher = LawnFawnMatcher()
+        matcher.candidate_hedge_delay_ms = 10
+        return matcher
+    
+    @staticmethod
+    def _scraper(delays, failing=()):
+        """Build a fake scrape_product_page recording the order of started URLs."""
+        started = []
+        
+        async def scrape_product_page(url):
+            started.append(url)
+            await asyncio.sleep(delays[url])
+            if url in failing:
+                raise ScrapingError("Page not accessible", product_url=url)
+            return ProductData(name=url, description="", sku="", image_urls=[], product_url=url)
+        
+        return scrape_product_page, started
+    
+    @pytest.mark.asyncio
+    async def test_fast_first_result_scrapes_nothing_else(self, lawnfawn_matcher):
+        """Test that a first result finishing within the hedge delay is scraped alone."""
+        lawnfawn_matcher.scrape_product_page, started = self._scraper({"a": 0, "b": 0, "c": 0})
+        
+        product_data, url = await lawnfawn_matcher._scrape_ranked_candidates(["a", "b", "c"], total_links=3)
+        
+        assert url == "a"
+        assert started == ["a"]
+    
+    @pytest.mark.asyncio
+    async def test_slow_first_result_still_preferred(self, lawnfawn_matcher):
+        """Test that hedged lower-ranked pages do not win over a slower first result."""
+        lawnfawn_matcher.scrape_product_page, started = self._scraper({"a": 0.05, "b": 0, "c": 0})
+        
+        product_data, url = await lawnfawn_matcher._scrape_ranked_candidates(["a", "b", "c"], total_links=3)
+        
+        assert url == "a"
+        assert product_data.name == "a"
+        assert started[:2] == ["a", "b"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_first_result_falls_back_to_hedged_page(self, lawnfawn_matcher):
+        """Test that the next page is already scraping when a slow first result fails."""
+        lawnfawn_matcher.scrape_product_page, started = self._scraper(
+            {"a": 0.05, "b": 0, "c": 0}, failing={"a"}
+        )
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        product_data, url = await lawnfawn_matcher._scrape_ranked_candidates(["a", "b", "c"], total_links=3)
+        
+        assert url == "b"
+        assert loop.time() - start < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_all_results_failing_raises_last_error(self, lawnfawn_matcher):
+        """Test that the last candidate's error is raised when every page fails."""
+        lawnfawn_matcher.scrape_product_page, started = self._scraper(
+            {"a": 0, "b": 0, "c": 0}, failing={"a", "b", "c"}
+        )
+        
+        with pytest.raises(ScrapingError) as exc_info:
+            await lawnfawn_matcher._scrape_ranked_candidates(["a", "b", "c"], total_links=3)
+        
+        assert exc_info.value.product_url == "c"
+        assert started == ["a", "b", "c"]
+
+
+class TestImageQualityIndicators:
+    """Test image quality assessment."""
+    
+    @pytest.fixture
+    def lawnfawn_matcher(self):
+        """Create LawnFawnMatcher without a Firecrawl client."""
+        with patch('app.services.lawnfawn_matcher.get_firecrawl_client', return_value=Mock()):
+            return LawnFawnMatcher()
+    
+    def test_format_quality_ignores_query_string(self, lawnfawn_matcher):
+        """Test that CDN version query strings do not hide the image format."""
+        indicators = lawnfawn_matcher._assess_image_quality_indicators(
+            None, None, "https://cdn.shopify.com/files/lf2538.png?v=1612345678"
+        )
+        
+        assert indicators['format_quality'] == 'excellent'
+    
+    def test_size_bucket_uses_larger_dimension(self, lawnfawn_matcher):
+        """Test that either dimension reaching a threshold selects its bucket."""
+        large = lawnfawn_matcher._assess_image_quality_indicators("300", "800", "a.jpg")
+        medium = lawnfawn_matcher._assess_image_quality_indicators("400", "100", "a.jpg")
+        small = lawnfawn_matcher._assess_image_quality_indicators("399", "399", "a.jpg")
+        
+        assert (large['estimated_size'], large['download_priority']) == ('large', 80)
+        assert (medium['estimated_size'], medium['download_priority']) == ('medium', 60)
+        assert (small['estimated_size'], small['download_priority']) == ('small', 30)
+
+
+class TestAbsoluteURL:
+    """Test normalization of relative LawnFawn URLs."""
+    
+    def test_site_relative_url(self):
+        """Test that site-relative URLs get the LawnFawn origin."""
+        assert _absolute_url("/products/a") == "https://www.lawnfawn.com/products/a"
+    
+    def test_protocol_relative_url(self):
+        """Test that protocol-relative URLs keep their own host."""
+        assert _absolute_url("//cdn.shopify.com/files/a.jpg") == "https://cdn.shopify.com/files/a.jpg"
+    
+    def test_absolute_url_unchanged(self):
+        """Test that absolute URLs are returned as-is."""
+        assert _absolute_url("https://www.lawnfawn.com/products/a") == "https://www.lawnfawn.com/products/a"
@@ -14,6 +14,7 @@ from datetime import datetime
 from app.services.deduplication_service import DeduplicationService, get_deduplication_service
 from app.services.conflict_detector import ConflictDetector, get_conflict_detector
 from app.models.deduplication import (
+    ConflictAnalysis,
     DataConflict, 
     DeduplicationResult, 
     DeduplicationSummary, 
@@ -138,7 +139,7 @@ class TestDeduplicationService:
         mock_db_service.get_product_by_manufacturer_sku.return_value = sample_existing_product
         
         # Mock conflict detector to return no conflicts
-        mock_conflict_detector.detect_conflicts.return_value = []
+        mock_conflict_detector.analyze_conflicts.return_value = ConflictAnalysis()
         
         # Act
         result = await deduplication_service.process_product_with_deduplication(
@@ -155,6 +156,36 @@ class TestDeduplicationService:
         # Verify no product creation
         mock_db_service.create_product.assert_not_called()
     
+    @pytest.mark.asyncio
+    async def test_create_race_handled_as_existing_product(
+        self, 
+        deduplication_service, 
+        sample_product_create, 
+        sample_existing_product,
+        mock_db_service,
+        mock_conflict_detector
+    ):
+        """Test that losing a create race falls back to the existing product."""
+        # Arrange
+        batch_id = uuid4()
+        
+        # Not found on lookup, but inserted concurrently before our create
+        mock_db_service.get_product_by_manufacturer_sku.side_effect = [
+            None, sample_existing_product
+        ]
+        mock_db_service.create_product.return_value = None
+        mock_conflict_detector.analyze_conflicts.return_value = ConflictAnalysis()
+        
+        # Act
+        result = await deduplication_service.process_product_with_deduplication(
+            sample_product_create, batch_id
+        )
+        
+        # Assert
+        assert result.status == "duplicate_skipped"
+        assert result.product_id == sample_existing_product.id
+        assert mock_db_service.get_product_by_manufacturer_sku.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_conflict_detection_and_flagging(
         self,
@@ -183,9 +214,11 @@ class TestDeduplicationService:
             severity="major",
             auto_resolvable=False
         )
-        mock_conflict_detector.detect_conflicts.return_value = [price_conflict]
-        mock_conflict_detector.classify_conflict_severity.return_value = "major"
-        mock_conflict_detector.can_auto_resolve.return_value = False
+        mock_conflict_detector.analyze_conflicts.return_value = ConflictAnalysis(
+            conflicts=[price_conflict],
+            severity="major",
+            can_auto_resolve=False
+        )
         
         # Act
         result = await deduplication_service.process_product_with_deduplication(
@@ -231,9 +264,11 @@ class TestDeduplicationService:
             severity="minor",
             auto_resolvable=True
         )
-        mock_conflict_detector.detect_conflicts.return_value = [minor_conflict]
-        mock_conflict_detector.classify_conflict_severity.return_value = "minor"
-        mock_conflict_detector.can_auto_resolve.return_value = True
+        mock_conflict_detector.analyze_conflicts.return_value = ConflictAnalysis(
+            conflicts=[minor_conflict],
+            severity="minor",
+            can_auto_resolve=True
+        )
         
         # Act
         result = await deduplication_service.process_product_with_deduplication(
@@ -314,6 +349,7 @@ class TestDeduplicationService:
                     batch_id=uuid4(),
                     supplier_id=uuid4(),
                     supplier_sku="DUP-001",
+                    manufacturer_sku="DUP-MFG-001",
                     supplier_name="Duplicate Product",
                     scraped_images_urls=[],
                     scraping_confidence=85,
@@ -329,6 +365,7 @@ class TestDeduplicationService:
                     batch_id=uuid4(),
                     supplier_id=uuid4(),
                     supplier_sku="CONF-001",
+                    manufacturer_sku="CONF-MFG-001",
                     supplier_name="Conflict Product",
                     supplier_price_usd=Decimal("49.99"),  # Different price
                     scraped_images_urls=[],
@@ -340,7 +377,10 @@ class TestDeduplicationService:
                     updated_at=datetime.now()
                 )
         
-        mock_db_service.get_product_by_manufacturer_sku.side_effect = mock_get_by_sku
+        def mock_get_by_skus(skus):
+            return [product for product in map(mock_get_by_sku, skus) if product]
+        
+        mock_db_service.get_products_by_manufacturer_skus.side_effect = mock_get_by_skus
         mock_db_service.create_product.return_value = Product(
             id=uuid4(), 
             batch_id=uuid4(),
@@ -356,20 +396,22 @@ class TestDeduplicationService:
         )
         
         # Mock conflict detection
-        def mock_detect_conflicts(existing, new):
+        def mock_analyze_conflicts(existing, new):
             if existing.manufacturer_sku == "CONF-MFG-001":
-                return [DataConflict(
-                    field="supplier_price_usd",
-                    existing_value=49.99,
-                    new_value=99.99,
+                return ConflictAnalysis(
+                    conflicts=[DataConflict(
+                        field="supplier_price_usd",
+                        existing_value=49.99,
+                        new_value=99.99,
+                        severity="major",
+                        auto_resolvable=False
+                    )],
                     severity="major",
-                    auto_resolvable=False
-                )]
-            return []
+                    can_auto_resolve=False
+                )
+            return ConflictAnalysis()
         
-        mock_conflict_detector.detect_conflicts.side_effect = mock_detect_conflicts
-        mock_conflict_detector.classify_conflict_severity.return_value = "major"
-        mock_conflict_detector.can_auto_resolve.return_value = False
+        mock_conflict_detector.analyze_conflicts.side_effect = mock_analyze_conflicts
         
         # Act
         summary = await deduplication_service.process_batch_with_deduplication(
@@ -386,6 +428,48 @@ class TestDeduplicationService:
         # Check success and conflict rates
         assert summary.success_rate == 66.67  # 2 out of 3 successful
         assert summary.conflict_rate == 33.33  # 1 out of 3 conflicts
+        
+        # Existing products are prefetched once for the whole batch
+        mock_db_service.get_products_by_manufacturer_skus.assert_called_once()
+        mock_db_service.get_product_by_manufacturer_sku.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_batch_processing_repeated_sku_within_batch(
+        self,
+        deduplication_service,
+        sample_product_create,
+        mock_db_service,
+        mock_conflict_detector
+    ):
+        """Test that a SKU repeated within one batch is only created once."""
+        # Arrange
+        batch_id = uuid4()
+        created_product = Product(
+            id=uuid4(),
+            **sample_product_create.dict(),
+            scraped_images_urls=[],
+            scraping_confidence=85,
+            status=ProductStatus.READY,
+            quality_score=90,
+            requires_review=False,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+        
+        mock_db_service.get_products_by_manufacturer_skus.return_value = []
+        mock_db_service.create_product.return_value = created_product
+        mock_conflict_detector.analyze_conflicts.return_value = ConflictAnalysis()
+        
+        # Act
+        summary = await deduplication_service.process_batch_with_deduplication(
+            [sample_product_create, sample_product_create.copy()], batch_id
+        )
+        
+        # Assert
+        assert summary.created_new == 1
+        assert summary.duplicates_skipped == 1
+        assert summary.results[1].product_id == created_product.id
+        mock_db_service.create_product.assert_called_once()
 
 
 class TestConflictDetector:
@@ -660,6 +744,28 @@ class TestConflictDetector:
         
         # No conflicts
         assert conflict_detector.can_auto_resolve([]) is True
+    
+    @pytest.mark.asyncio
+    async def test_analyze_conflicts_single_pass(
+        self, 
+        conflict_detector, 
+        sample_existing_product, 
+        sample_new_data
+    ):
+        """Test that analyze_conflicts matches the separate classification helpers."""
+        # Arrange - 100% price increase
+        sample_new_data.supplier_price_usd = Decimal("40.00")
+        
+        # Act
+        analysis = await conflict_detector.analyze_conflicts(
+            sample_existing_product, sample_new_data
+        )
+        
+        # Assert
+        assert analysis.conflicts
+        assert analysis.severity == "critical"
+        assert analysis.severity == conflict_detector.classify_conflict_severity(analysis.conflicts)
+        assert analysis.can_auto_resolve is conflict_detector.can_auto_resolve(analysis.conflicts)
 
 
 class TestDeduplicationIntegration:
@@ -709,6 +815,20 @@ class TestDeduplicationIntegration:
         config = DeduplicationConfig(price_difference_threshold=0.05)
         custom_detector = get_conflict_detector(config)
         assert custom_detector.config.price_difference_threshold == 0.05
+    
+    def test_service_factories_cache_per_config(self):
+        """Test that factory functions reuse instances for equal configurations."""
+        assert get_deduplication_service() is get_deduplication_service(DeduplicationConfig())
+        assert get_conflict_detector() is get_conflict_detector()
+        
+        custom_config = DeduplicationConfig(price_difference_threshold=0.05)
+        custom_service = get_deduplication_service(custom_config)
+        
+        assert custom_service is not get_deduplication_service()
+        assert custom_service is get_deduplication_service(
+            DeduplicationConfig(price_difference_threshold=0.05)
+        )
+        assert custom_service.conflict_detector is get_conflict_detector(custom_config)
 
 
 class TestDeduplicationModels:
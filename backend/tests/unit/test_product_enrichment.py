@@ -5,20 +5,22 @@ Tests the main enrichment orchestrator with mocked dependencies,
 following patterns from existing test_product_deduplication.py.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4, UUID
 from datetime import datetime
 
-from app.services.product_enrichment import ProductEnrichmentService, get_product_enrichment_service
+from app.services.product_enrichment import (
+    ProductEnrichmentService, get_product_enrichment_service, CONCURRENCY_TUNE_INTERVAL
+)
 from app.models.product import Product
 from app.models.base import ProductStatus
 from app.models.enrichment import (
     EnrichmentData, EnrichmentMethod, ProductEnrichmentResult, 
     EnrichmentResult, ScrapingAttempt, ScrapingStatus
 )
-from app.exceptions.enrichment import EnrichmentError, SKUExtractionError, SearchError
-
+from app.exceptions.enrichment import EnrichmentError, SKUExtractionError, SearchError, RateLimitError
 
 class TestProductEnrichmentService:
     """Test suite for ProductEnrichmentService."""
@@ -38,6 +40,9 @@ class TestProductEnrichmentService:
         mock_service = Mock()
         mock_service.get_product_by_id = AsyncMock()
         mock_service.get_products = AsyncMock()
+        mock_service.claim_enrichable_products = AsyncMock(return_value=[])
+        mock_service.release_stale_enrichment_claims = AsyncMock(return_value=0)
+        mock_service.get_recent_enrichment = AsyncMock(return_value=None)
         mock_service.client = Mock()
         mock_service.client.table.return_value.insert.return_value.execute.return_value.data = [
             {'id': str(uuid4()), 'attempt_number': 1, 'created_at': datetime.utcnow().isoformat(), 'updated_at': datetime.utcnow().isoformat()}
@@ -50,6 +55,7 @@ class TestProductEnrichmentService:
         """Mock LawnFawn matcher service."""
         mock_matcher = Mock()
         mock_matcher.match_product = AsyncMock()
+        mock_matcher.prefetch_products = AsyncMock()
         return mock_matcher
     
     @pytest.fixture
@@ -121,6 +127,84 @@ class TestProductEnrichmentService:
         mock_database_service.get_product_by_id.assert_called_once_with(sample_product.id)
         mock_lawnfawn_matcher.match_product.assert_called_once_with(sample_product)
     
+    @pytest.mark.asyncio
+    async def test_enrich_product_reuses_recent_enrichment(self, enrichment_service, mock_database_service,
+                                                           mock_lawnfawn_matcher, sample_product):
+        """Test that a recent enrichment of the same SKU is reused without scraping."""
+        source_product_id = str(uuid4())
+        mock_database_service.get_product_by_id.return_value = sample_product
+        mock_database_service.get_recent_enrichment.return_value = {
+            'id': source_product_id,
+            'scraped_name': "Stitched Rectangle Frames Dies",
+            'scraped_description': "A set of rectangle frame dies",
+            'scraped_url': "https://www.lawnfawn.com/products/lf2538",
+            'scraped_images_urls': ["https://example.com/image1.jpg"],
+            'scraped_images_metadata': [],
+            'scraping_confidence': 90
+        }
+        
+        result = await enrichment_service.enrich_product(sample_product.id)
+        
+        assert result.success is True
+        assert result.confidence_score == 90
+        assert result.method == EnrichmentMethod.DIRECT_URL
+        assert result.product_url == "https://www.lawnfawn.com/products/lf2538"
+        mock_lawnfawn_matcher.match_product.assert_not_called()
+        
+        lookup = mock_database_service.get_recent_enrichment.await_args.kwargs
+        assert lookup['supplier_sku'] == "LF2538"
+        assert lookup['exclude_product_id'] == sample_product.id
+        
+        # The reused product page is not recorded as a search
+        attempt = mock_database_service.client.table.return_value.insert.call_args.args[0]
+        assert attempt['search_url'] is None
+    
+    @pytest.mark.asyncio
+    async def test_enrich_product_uses_registered_matcher(self, enrichment_service, mock_database_service,
+                                                          mock_lawnfawn_matcher, sample_product, sample_enrichment_data):
+        """Test products are dispatched to the matcher registered for their manufacturer."""
+        # Setup
+        other_matcher = Mock()
+        other_matcher.match_product = AsyncMock(return_value=sample_enrichment_data)
+        enrichment_service.register_matcher(" Other Maker ", other_matcher)
+        product = sample_product.model_copy(update={"manufacturer": "other maker"})
+        mock_database_service.get_product_by_id.return_value = product
+        
+        # Execute
+        result = await enrichment_service.enrich_product(product.id)
+        
+        # Verify
+        assert result.success is True
+        other_matcher.match_product.assert_called_once_with(product)
+        mock_lawnfawn_matcher.match_product.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_enrich_product_unsupported_manufacturer(self, enrichment_service, mock_database_service,
+                                                           mock_lawnfawn_matcher, sample_product):
+        """Test enrichment fails for a manufacturer without a matcher."""
+        # Setup
+        product = sample_product.model_copy(update={"manufacturer": "unknown"})
+        mock_database_service.get_product_by_id.return_value = product
+        
+        # Execute
+        result = await enrichment_service.enrich_product(product.id)
+        
+        # Verify
+        assert result.success is False
+        assert "Unsupported manufacturer" in result.error_message
+        mock_lawnfawn_matcher.match_product.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_scraping_attempt_with_unknown_method(self, enrichment_service):
+        """Test that an attempt recorded with an unknown method is reported as fallback."""
+        attempt = await enrichment_service._create_scraping_attempt(
+            product_id=uuid4(),
+            method="retired_method",
+            status=ScrapingStatus.FAILED
+        )
+        
+        assert attempt.method == EnrichmentMethod.FALLBACK
+    
     @pytest.mark.asyncio
     async def test_enrich_product_not_found(self, enrichment_service, mock_database_service):
         """Test enrichment when product not found."""
@@ -214,7 +298,7 @@ class TestProductEnrichmentService:
             Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku="LF2539", manufacturer="lawnfawn", status=ProductStatus.DRAFT, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
         ]
         
-        mock_database_service.get_products.return_value = products
+        mock_database_service.claim_enrichable_products.side_effect = [products, []]
         # Mock get_product_by_id to return the products when called individually
         mock_database_service.get_product_by_id.side_effect = lambda pid: next((p for p in products if p.id == pid), None)
         mock_lawnfawn_matcher.match_product.return_value = sample_enrichment_data
@@ -229,13 +313,30 @@ class TestProductEnrichmentService:
         assert result.failed_enrichments == 0
         assert len(result.results) == 2
         assert all(r.success for r in result.results)
+        
+        # Reuse is looked up once per product, by the prefetch
+        assert mock_database_service.get_recent_enrichment.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_groups_products_by_manufacturer(self, enrichment_service, mock_lawnfawn_matcher):
+        """Test that products are prefetched only through their own manufacturer's matcher."""
+        batch_id = uuid4()
+        products = [
+            Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku=sku, manufacturer=manufacturer, status=ProductStatus.DRAFT, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+            for sku, manufacturer in (("LF2538", "lawnfawn"), ("XY1", "Other"), ("LF2539", " LawnFawn "), ("ZZ1", "unknown"))
+        ]
+        other_matcher = Mock(spec=['match_product'])
+        enrichment_service.register_matcher("other", other_matcher)
+        
+        await enrichment_service._prefetch_product_pages(batch_id, products)
+        
+        mock_lawnfawn_matcher.prefetch_products.assert_awaited_once_with([products[0], products[2]])
     
     @pytest.mark.asyncio
     async def test_enrich_batch_empty(self, enrichment_service, mock_database_service):
         """Test batch enrichment with no products."""
         # Setup
         batch_id = uuid4()
-        mock_database_service.get_products.return_value = []
         
         # Execute
         result = await enrichment_service.enrich_batch(batch_id)
@@ -258,7 +359,7 @@ class TestProductEnrichmentService:
             Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku="INVALID", manufacturer="lawnfawn", status=ProductStatus.DRAFT, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
         ]
         
-        mock_database_service.get_products.return_value = products
+        mock_database_service.claim_enrichable_products.side_effect = [products, []]
         # Mock get_product_by_id to return the products when called individually
         mock_database_service.get_product_by_id.side_effect = lambda pid: next((p for p in products if p.id == pid), None)
         
@@ -280,6 +381,173 @@ class TestProductEnrichmentService:
         assert result.results[0].success is True
         assert result.results[1].success is False
     
+    @pytest.mark.asyncio
+    async def test_enrich_batch_claims_products_in_chunks(self, enrichment_service, mock_database_service,
+                                                          mock_lawnfawn_matcher, sample_enrichment_data):
+        """Test that batch enrichment claims products until none are left, after releasing stale claims."""
+        # Setup
+        batch_id = uuid4()
+        products = [
+            Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku=f"LF25{i:02d}", manufacturer="lawnfawn", status=ProductStatus.PROCESSING, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+            for i in range(5)
+        ]
+        
+        mock_database_service.claim_enrichable_products.side_effect = [products[:2], products[2:4], products[4:], []]
+        mock_database_service.get_product_by_id.side_effect = lambda pid: next((p for p in products if p.id == pid), None)
+        mock_lawnfawn_matcher.match_product.return_value = sample_enrichment_data
+        
+        # Execute
+        with patch.object(enrichment_service, '_update_product_status', AsyncMock()) as update_status:
+            result = await enrichment_service.enrich_batch(batch_id)
+        
+        # Verify
+        assert [r.product_id for r in result.results] == [p.id for p in products]
+        assert result.successful_enrichments == 5
+        assert mock_database_service.claim_enrichable_products.call_count == 4
+        mock_database_service.release_stale_enrichment_claims.assert_called_once()
+        assert mock_database_service.release_stale_enrichment_claims.call_args.args[0] == batch_id
+        update_status.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_enrich_products_marks_processing_in_one_update(self, enrichment_service, mock_database_service,
+                                                                  mock_lawnfawn_matcher, sample_enrichment_data):
+        """Test that enriching products by ID sets the processing status with a single bulk update."""
+        # Setup
+        products = [
+            Product(id=uuid4(), batch_id=uuid4(), supplier_id=uuid4(), supplier_sku=f"LF25{i:02d}", manufacturer="lawnfawn", status=ProductStatus.DRAFT, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+            for i in range(3)
+        ]
+        
+        mock_database_service.get_product_by_id.side_effect = lambda pid: next((p for p in products if p.id == pid), None)
+        mock_lawnfawn_matcher.match_product.return_value = sample_enrichment_data
+        
+        # Execute
+        with patch.object(enrichment_service, '_update_product_status', AsyncMock()) as update_status:
+            results = await enrichment_service.enrich_products([p.id for p in products])
+        
+        # Verify
+        assert all(r.success for r in results)
+        update_status.assert_not_called()
+        update = mock_database_service.client.table.return_value.update
+        update.return_value.in_.assert_called_once_with('id', [str(p.id) for p in products])
+        assert update.call_args_list[0].args[0]['enrichment_status'] == "processing"
+    
+    @pytest.mark.asyncio
+    async def test_lowered_concurrency_limit_applies_to_running_enrichments(self, enrichment_service):
+        """Test that enrichments admitted under the old limit count against a lowered one."""
+        enrichment_service._concurrency_limit = 3
+        active_at_start = []
+        
+        async def enrich_product(product_id, mark_processing=True, reuse_lookup=None):
+            active_at_start.append(enrichment_service._active_enrichments)
+            await asyncio.sleep(0.01)
+            return ProductEnrichmentResult(product_id=product_id, success=True)
+        
+        enrichment_service.enrich_product = enrich_product
+        tasks = [
+            asyncio.create_task(enrichment_service._enrich_product_with_limit(uuid4()))
+            for _ in range(6)
+        ]
+        await asyncio.sleep(0)
+        await enrichment_service._set_concurrency_limit(1)
+        await asyncio.gather(*tasks)
+        
+        assert active_at_start[:3] == [1, 2, 3]
+        assert active_at_start[3:] == [1, 1, 1]
+        assert enrichment_service._active_enrichments == 0
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_backs_off_after_rate_limits(self, enrichment_service,
+                                                                 mock_database_service,
+                                                                 mock_lawnfawn_matcher, sample_product):
+        """Test that Firecrawl 429s behind matcher errors cut the concurrency limit."""
+        enrichment_service._concurrency_limit = 10
+        mock_database_service.get_product_by_id.return_value = sample_product
+        
+        async def match_product(product):
+            try:
+                raise RateLimitError()
+            except RateLimitError as e:
+                raise SearchError(f"Search failed: {e}")
+        
+        mock_lawnfawn_matcher.match_product.side_effect = match_product
+        
+        for _ in range(CONCURRENCY_TUNE_INTERVAL):
+            result = await enrichment_service.enrich_product(sample_product.id)
+            assert result.success is False
+        
+        assert enrichment_service._concurrency_limit == 7
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_grows_while_latency_is_steady(self, enrichment_service):
+        """Test that the concurrency limit grows by one per interval up to the cap."""
+        enrichment_service._concurrency_limit = 5
+        enrichment_service.max_concurrent_cap = 6
+        
+        for _ in range(CONCURRENCY_TUNE_INTERVAL):
+            await enrichment_service._observe_enrichment(1000)
+        assert enrichment_service._concurrency_limit == 6
+        
+        for _ in range(CONCURRENCY_TUNE_INTERVAL):
+            await enrichment_service._observe_enrichment(1000)
+        assert enrichment_service._concurrency_limit == 6
+    
+    @pytest.mark.asyncio
+    async def test_cancel_during_slot_release_still_wakes_waiter(self, enrichment_service):
+        """Test that a waiter is admitted when the finishing enrichment is cancelled on the lock."""
+        enrichment_service._concurrency_limit = 1
+        condition = enrichment_service._concurrency_condition
+        first_done = asyncio.Event()
+        first_id = uuid4()
+        
+        async def enrich_product(product_id, mark_processing=True, reuse_lookup=None):
+            if product_id == first_id:
+                await first_done.wait()
+            return ProductEnrichmentResult(product_id=product_id, success=True)
+        
+        enrichment_service.enrich_product = enrich_product
+        first = asyncio.create_task(enrichment_service._enrich_product_with_limit(first_id))
+        second = asyncio.create_task(enrichment_service._enrich_product_with_limit(uuid4()))
+        await asyncio.sleep(0)
+        
+        # The first enrichment finishes while the lock is held, then is
+        # cancelled while waiting for it to wake the second one
+        await condition.acquire()
+        first_done.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        condition.release()
+        
+        result = await asyncio.wait_for(second, timeout=1)
+        
+        assert result.success is True
+        assert enrichment_service._active_enrichments == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_enrichment_cancels_the_rest(self, enrichment_service):
+        """Test that a cancelled enrichment cancels its siblings instead of becoming a result."""
+        product_ids = [uuid4(), uuid4(), uuid4()]
+        cancelled = []
+        
+        async def enrich_product(product_id, mark_processing=True, reuse_lookup=None):
+            if product_id == product_ids[0]:
+                raise asyncio.CancelledError()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(product_id)
+                raise
+        
+        enrichment_service.enrich_product = enrich_product
+        
+        with pytest.raises(asyncio.CancelledError):
+            await enrichment_service._run_enrichments(product_ids)
+        await asyncio.sleep(0)
+        
+        assert cancelled == product_ids[1:]
+    
     @pytest.mark.asyncio
     async def test_enrich_products_by_ids(self, enrichment_service, mock_database_service, 
                                         mock_lawnfawn_matcher, sample_enrichment_data):
@@ -308,13 +576,14 @@ class TestProductEnrichmentService:
         """Test getting enrichment status for a batch."""
         # Setup
         batch_id = uuid4()
-        products = [
-            Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku="LF2538", status=ProductStatus.READY, scraping_confidence=90, created_at=datetime.utcnow(), updated_at=datetime.utcnow()),
-            Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku="LF2539", status=ProductStatus.FAILED, created_at=datetime.utcnow(), updated_at=datetime.utcnow()),
-            Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku="LF2540", status=ProductStatus.PROCESSING, created_at=datetime.utcnow(), updated_at=datetime.utcnow()),
-            Product(id=uuid4(), batch_id=batch_id, supplier_id=uuid4(), supplier_sku="LF2541", status=ProductStatus.DRAFT, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
-        ]
-        mock_database_service.get_products.return_value = products
+        mock_database_service.get_batch_enrichment_counts = AsyncMock(return_value={
+            "total_products": 4,
+            "completed_products": 1,
+            "failed_products": 1,
+            "processing_products": 1,
+            "pending_products": 1,
+            "avg_confidence_score": 90.0
+        })
         
         # Execute
         status = await enrichment_service.get_enrichment_status(batch_id)
@@ -327,6 +596,7 @@ class TestProductEnrichmentService:
         assert status["processing_products"] == 1
         assert status["pending_products"] == 1
         assert status["avg_confidence_score"] == 90.0
+        mock_database_service.get_batch_enrichment_counts.assert_called_once_with(batch_id)
     
     @pytest.mark.asyncio
     async def test_health_check(self, enrichment_service, mock_database_service, mock_firecrawl_client):